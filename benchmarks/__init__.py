@@ -0,0 +1 @@
+# Benchmarks for the modules in python_concepts. Run them from the root of the repository with python -m benchmarks.<name>
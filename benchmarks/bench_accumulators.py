@@ -0,0 +1,77 @@
+# Benchmark: updates per second for every accumulator in python_concepts/accumulators.py as the number of threads grows
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_accumulators
+#   python -m benchmarks.bench_accumulators --threads 1 2 4 8 16 --updates 500000
+
+import argparse
+import threading
+import time
+
+from benchmarks.common import print_table
+from python_concepts.accumulators import ACCUMULATORS, add_range
+
+
+class UnsynchronizedCounter:
+    """ The commented-out-lock version from threading_basics.py. Fast, but loses updates. """
+
+    def __init__(self):
+        self.value = 0
+
+    def add(self, amount=1):
+        self.value += amount
+
+
+def run_threads(accumulator, thread_count, updates_per_thread):
+    """
+    Start thread_count threads that each add 1 to the accumulator updates_per_thread times.
+    Every thread waits on a barrier first so that they all start hammering the accumulator together.
+    :return: seconds taken
+    """
+    barrier = threading.Barrier(thread_count + 1)
+    ones = [1] * updates_per_thread
+
+    def work():
+        barrier.wait()
+        add_range(accumulator, ones)
+        # The batched accumulator keeps updates per thread until a batch fills up, flush what is left.
+        if hasattr(accumulator, "flush"):
+            accumulator.flush()
+
+    threads = [threading.Thread(target=work) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accumulator contention benchmark.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--updates", type=int, default=200_000, help="updates per thread")
+    args = parser.parse_args()
+
+    strategies = {"unsynchronized": UnsynchronizedCounter, **ACCUMULATORS}
+    rows = []
+    for name, accumulator_class in strategies.items():
+        row = [name]
+        for thread_count in args.threads:
+            accumulator = accumulator_class()
+            seconds = run_threads(accumulator, thread_count, args.updates)
+            expected = thread_count * args.updates
+            lost = expected - accumulator.value
+            cell = f"{expected / seconds / 1e6:.2f}M/s"
+            if lost:
+                cell += f" (lost {lost})"
+            row.append(cell)
+        rows.append(row)
+
+    print(f"{args.updates:,} updates per thread\n")
+    print_table(["strategy"] + [f"{count} threads" for count in args.threads], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Benchmark: wall time and peak memory (RSS) of many sleeping count() tasks, one OS thread each vs asyncio
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_async
+#   python -m benchmarks.bench_async --tasks 10 1000 --steps 5 --delay 0.05
+#
+# Every configuration runs in a fresh child process, so the peak RSS of one run does not leak into the next.
+# Starting 100,000 OS threads may fail because of operating system limits. That is reported instead of a number.
+
+import argparse
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.common import print_table
+from python_concepts.async_runtime import count, run, run_interleaved
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def sync_count(n, delay, out):
+    for i in range(1, n + 1):
+        out.append(i)
+        time.sleep(delay)
+
+
+def run_threads(tasks, steps, delay):
+    out = []
+    threads = [threading.Thread(target=sync_count, args=(steps, delay, out)) for _ in range(tasks)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(out)
+
+
+def run_asyncio(tasks, steps, delay):
+    out = []
+    run(run_interleaved([count(steps, delay, out) for _ in range(tasks)]))
+    return len(out)
+
+
+def child(mode, tasks, steps, delay):
+    """ Runs inside the child process and prints 'seconds peak_rss_mb'. """
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    produced = (run_threads if mode == "threads" else run_asyncio)(tasks, steps, delay)
+    seconds = time.perf_counter() - start
+    assert produced == tasks * steps
+    print(f"{seconds} {peak_rss_mb() - baseline}")
+
+
+def measure(mode, tasks, steps, delay, timeout):
+    command = [sys.executable, "-m", "benchmarks.bench_async", "--child", mode, str(tasks), str(steps), str(delay)]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return ["timed out", "-"]
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"
+        return [error[:40], "-"]
+    seconds, rss = completed.stdout.split()
+    return [f"{float(seconds):.2f}", f"{float(rss):.1f}"]
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        mode, tasks, steps, delay = sys.argv[2:6]
+        child(mode, int(tasks), int(steps), float(delay))
+        return
+
+    parser = argparse.ArgumentParser(description="Threads vs asyncio benchmark for sleep-bound tasks.")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10, 1_000, 100_000])
+    parser.add_argument("--steps", type=int, default=3, help="numbers every task counts to")
+    parser.add_argument("--delay", type=float, default=0.1, help="seconds slept after every number")
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    rows = []
+    for tasks in args.tasks:
+        for mode in ("threads", "asyncio"):
+            rows.append([f"{tasks:,}", mode] + measure(mode, tasks, args.steps, args.delay, args.timeout))
+
+    print(f"Every task counts to {args.steps}, sleeping {args.delay}s after every number.")
+    print(f"Ideal wall time is {args.steps * args.delay:.2f}s no matter how many tasks there are.\n")
+    print_table(["tasks", "mode", "wall seconds", "extra peak RSS (MB)"], rows)
+
+
+if __name__ == "__main__":
+    main()
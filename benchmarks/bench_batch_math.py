@@ -0,0 +1,75 @@
+# Benchmark: add(*args) and calculate(**kwargs) from args_and_kwargs.py called in a loop vs the batch versions
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_batch_math
+#   python -m benchmarks.bench_batch_math --rows 10000000
+
+import argparse
+import math
+import random
+
+from benchmarks.common import best_of, print_table
+from python_concepts.batch_math import add_batch, calculate_batch
+from python_concepts.pipeline import np
+
+
+# The functions from args_and_kwargs.py, returning their result instead of printing it.
+def add(*args):
+    total = 0
+    for num in args:
+        total += num
+    return total
+
+
+def calculate(start_value=0, **kwargs):
+    total = start_value
+    if kwargs["multiply"]:
+        total *= kwargs["multiply"]
+    if kwargs["divide"]:
+        total /= kwargs["divide"]
+    if kwargs["add"]:
+        total += kwargs["add"]
+    if kwargs["subtract"]:
+        total -= kwargs["subtract"]
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scalar loop vs batch arithmetic benchmark.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    n = args.rows
+    columns = [[random.uniform(-100, 100) for _ in range(n)] for _ in range(7)]
+    starts = [random.uniform(0, 100) for _ in range(n)]
+    divisors = [random.randint(1, 9) for _ in range(n)]
+
+    table = []
+    baseline, expected = best_of(lambda: [add(*row) for row in zip(*columns)], 1)
+    table.append(["add", "add(*row) loop", f"{baseline:.3f}", "1.00x", "-"])
+    for label, data in (("add_batch, lists", columns), ("add_batch, NumPy", [np.asarray(c) for c in columns] if np else None)):
+        if data is None:
+            continue
+        seconds, result = best_of(lambda: add_batch(*data), 1)
+        exact = sum(1 for row, value in zip(zip(*columns), result) if value == math.fsum(row)) / n
+        table.append(["add", label, f"{seconds:.3f}", f"{baseline / seconds:.2f}x", f"{exact:.2%}"])
+
+    baseline, expected = best_of(
+        lambda: [calculate(s, add=3, multiply=5, subtract=6, divide=d) for s, d in zip(starts, divisors)], 1
+    )
+    table.append(["calculate", "calculate(...) loop", f"{baseline:.3f}", "1.00x", "-"])
+    for label, s, d in (("calculate_batch, lists", starts, divisors),
+                        ("calculate_batch, NumPy", *((np.asarray(starts), np.asarray(divisors)) if np else (None, None)))):
+        if s is None:
+            continue
+        seconds, result = best_of(lambda: calculate_batch(s, add=3, multiply=5, subtract=6, divide=d), 1)
+        same = sum(1 for a, b in zip(result, expected) if a == b) / n
+        table.append(["calculate", label, f"{seconds:.3f}", f"{baseline / seconds:.2f}x", f"{same:.2%}"])
+
+    print(f"{n:,} rows. 'matches' is the share of rows equal to math.fsum (add) or the scalar result (calculate).\n")
+    print_table(["function", "strategy", "seconds", "speedup", "matches"], table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Benchmark: repeated repr() of the same Car, and repeated multiplication, with and without the caching mixin
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_cached_attributes
+#   python -m benchmarks.bench_cached_attributes --reprs 1000000 --multiplies 24
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.cached_attributes import Car as CachedCar
+
+
+class PlainCar:
+    """ The Car from dunder_methods.py, with __repr__ and __mul__. """
+
+    def __init__(self, make, model):
+        self.make = make
+        self.model = model
+
+    def __repr__(self):
+        return f"Car('{self.make}', '{self.model}')"
+
+    def __mul__(self, x):
+        if type(x) is not int:
+            raise TypeError("Invalid argument. Must multiply Car by an int.")
+        self.make = self.make * x
+        self.model = self.model * x
+
+
+class LazyCar(CachedCar):
+    mutating_mul = False
+
+
+def repeated_repr(car, calls):
+    for _ in range(calls):
+        repr(car)
+
+
+def repeated_multiply(car_class, times):
+    """ Multiply a car by 2 `times` times, the way the dunder_methods.py example does, and return the make's length. """
+    car = car_class("Jeep", "Wrangler")
+    for _ in range(times):
+        result = car * 2
+        if result is not None:
+            car = result
+    return len(car.make)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cached repr and lazy multiplication benchmark.")
+    parser.add_argument("--reprs", type=int, default=200_000)
+    parser.add_argument("--multiplies", type=int, default=22, help="each multiplication doubles the strings")
+    args = parser.parse_args()
+
+    repr_table = []
+    for name, car in [("plain", PlainCar("Jeep", "Wrangler")), ("cached", CachedCar("Jeep", "Wrangler"))]:
+        seconds, _ = best_of(lambda: repeated_repr(car, args.reprs), 3)
+        repr_table.append([name, f"{seconds / args.reprs * 1e9:,.0f}"])
+    print(f"repr() of the same car {args.reprs:,} times")
+    print_table(["car", "ns per repr"], repr_table)
+    print()
+
+    multiply_table = []
+    for name, car_class in [("plain (in place)", PlainCar), ("cached (in place)", CachedCar), ("lazy", LazyCar)]:
+        seconds, length = best_of(lambda: repeated_multiply(car_class, args.multiplies), 3)
+        multiply_table.append([name, f"{length:,}", f"{seconds * 1e3:,.3f}"])
+    print(f"car * 2, {args.multiplies} times in a row")
+    print_table(["car", "make length", "ms"], multiply_table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# Benchmark: Leaf.get_species() at the bottom of class hierarchies 1 to 20 levels deep, classmethod vs class_constant
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_class_constants
+#   python -m benchmarks.bench_class_constants --calls 1000000 --depths 1 5 10 20
+#
+# CPython already caches attribute lookups per class, so the classmethod column mostly measures the cost of binding
+# and calling a Python function, not of searching the hierarchy.
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.class_constants import ClassConstantMeta, class_constant
+
+
+class PlainPerson:
+    """ The Person from static_and_class_methods.py. """
+
+    species = "Homo Sapien"
+
+    @classmethod
+    def get_species(cls):
+        return cls.species
+
+
+class CachedPerson(metaclass=ClassConstantMeta):
+    species = "Homo Sapien"
+
+    @class_constant
+    def get_species(cls):
+        return cls.species
+
+
+def hierarchy(base, depth):
+    """ A chain of `depth` subclasses under base, returning the one at the bottom. """
+    cls = base
+    for level in range(depth):
+        cls = type(base)(f"{base.__name__}Level{level + 1}", (cls,), {})
+    return cls
+
+
+def call_class(cls, calls):
+    get_species = None
+    for _ in range(calls):
+        get_species = cls.get_species()
+    return get_species
+
+
+def call_instance(obj, calls):
+    get_species = None
+    for _ in range(calls):
+        get_species = obj.get_species()
+    return get_species
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Class constant cache benchmark.")
+    parser.add_argument("--calls", type=int, default=300_000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 5, 10, 15, 20])
+    args = parser.parse_args()
+
+    table = []
+    for depth in args.depths:
+        row = [depth]
+        for base in (PlainPerson, CachedPerson):
+            leaf = hierarchy(base, depth)
+            seconds, species = best_of(lambda: call_class(leaf, args.calls), 3)
+            assert species == "Homo Sapien"
+            row.append(f"{seconds / args.calls * 1e9:,.1f}")
+            seconds, _ = best_of(lambda: call_instance(leaf(), args.calls), 3)
+            row.append(f"{seconds / args.calls * 1e9:,.1f}")
+        table.append(row)
+
+    print(f"{args.calls:,} calls per measurement, ns per call")
+    print_table(
+        ["depth", "classmethod Leaf.", "classmethod leaf.", "class_constant Leaf.", "class_constant leaf."], table
+    )
+
+    # Reassigning species invalidates every cached result, the next call computes it again.
+    leaf = hierarchy(CachedPerson, 20)
+    leaf.get_species()
+    CachedPerson.species = "Homo sapiens"
+    assert leaf.get_species() == "Homo sapiens"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Benchmark: appending from many threads into one shared list vs OrderedCollector, and the cost of the final merge
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_collector
+#   python -m benchmarks.bench_collector --producers 2 16 64 --items 2000000
+
+import argparse
+import threading
+import time
+
+from benchmarks.common import best_of, print_table
+from python_concepts.collector import OrderedCollector
+
+
+def run_producers(producers, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def shared_list(producers, per_producer):
+    nums = []
+
+    def produce(_):
+        append = nums.append
+        for i in range(per_producer):
+            append(i)
+
+    return run_producers(producers, produce), nums
+
+
+def collector_thread_local(producers, per_producer):
+    collector = OrderedCollector()
+
+    def produce(_):
+        append = collector.append
+        for i in range(per_producer):
+            append(i)
+
+    return run_producers(producers, produce), collector
+
+
+def collector_buffers(producers, per_producer):
+    collector = OrderedCollector()
+    buffers = [collector.producer() for _ in range(producers)]
+
+    def produce(index):
+        append = buffers[index].append
+        for i in range(per_producer):
+            append(i)
+
+    return run_producers(producers, produce), collector
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared list vs OrderedCollector benchmark.")
+    parser.add_argument("--producers", type=int, nargs="+", default=[2, 8, 32])
+    parser.add_argument("--items", type=int, default=1_000_000, help="total items across all producers")
+    args = parser.parse_args()
+
+    rows = []
+    for producers in args.producers:
+        per_producer = args.items // producers
+        total = per_producer * producers
+
+        seconds, nums = shared_list(producers, per_producer)
+        rows.append([producers, "shared list", f"{total / seconds / 1e6:.2f}M/s", "-", "-"])
+
+        for name, strategy in (("collector.append", collector_thread_local), ("producer buffers", collector_buffers)):
+            seconds, collector = strategy(producers, per_producer)
+            assert len(collector) == total
+            arrival, _ = best_of(collector.arrival_order, 1)
+            grouped, _ = best_of(collector.producer_order, 1)
+            rows.append([producers, name, f"{total / seconds / 1e6:.2f}M/s", f"{arrival:.3f}", f"{grouped:.3f}"])
+
+    print(f"{args.items:,} items in total, split evenly across the producers\n")
+    print_table(["producers", "strategy", "appends", "arrival_order() s", "producer_order() s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Benchmark: creating Car objects from rows, the **kwargs Car from args_and_kwargs.py vs Record based Car
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_construction
+#   python -m benchmarks.bench_construction --count 1000000
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.construction import Car
+
+FIELDS = Car.fields
+
+
+class KwargsCar:
+    """ The Car from args_and_kwargs.py. """
+
+    def __init__(self, **kwargs):
+        self.make = kwargs.get("make")
+        self.model = kwargs.get("model")
+        self.year = kwargs.get("year")
+        self.miles = kwargs.get("miles")
+        self.color = kwargs.get("color")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record construction benchmark.")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rows = [("Jeep", "Wrangler", 2000 + i % 25, i, "gray") for i in range(args.count)]
+    columns = {field: [row[i] for row in rows] for i, field in enumerate(FIELDS)}
+
+    strategies = (
+        ("KwargsCar(**dict(zip(fields, row)))", lambda: [KwargsCar(**dict(zip(FIELDS, row))) for row in rows]),
+        ("KwargsCar(make=..., model=..., ...)", lambda: [
+            KwargsCar(make=make, model=model, year=year, miles=miles, color=color)
+            for make, model, year, miles, color in rows
+        ]),
+        ("Car(make=..., model=..., ...)", lambda: [
+            Car(make=make, model=model, year=year, miles=miles, color=color)
+            for make, model, year, miles, color in rows
+        ]),
+        ("Car.from_rows(rows)", lambda: Car.from_rows(rows)),
+        ("Car.from_columns(columns)", lambda: Car.from_columns(columns)),
+    )
+
+    table = []
+    baseline = None
+    for name, build in strategies:
+        seconds, cars = best_of(build, 3)
+        assert len(cars) == args.count and cars[-1].miles == args.count - 1
+        baseline = baseline or seconds
+        table.append([name, f"{args.count / seconds:,.0f}", f"{baseline / seconds:.2f}x"])
+
+    print(f"{args.count:,} cars")
+    print_table(["strategy", "objects/sec", "speedup"], table)
+
+
+if __name__ == "__main__":
+    main()
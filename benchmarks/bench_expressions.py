@@ -0,0 +1,84 @@
+# Benchmark: cost per call of getting an expression ready and calling it in a hot loop
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_expressions
+#   python -m benchmarks.bench_expressions --calls 1000000
+#
+# Compares, per call of a request handler that needs "x + 5":
+#   inline lambda      - (lambda x: x+5)(value), the lambda_functions.py style. Creating a lambda from code is cheap.
+#   eval per call      - eval("lambda x: x+5")(value), what happens when the expression arrives as a string.
+#   ExpressionCache    - cache.get("lambda x: x+5")(value), compiled once and looked up every call after that.
+# and, for a batch of values, list(map(...)) against CompiledExpression.apply_batch().
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.expressions import ExpressionCache
+from python_concepts.pipeline import np
+
+SOURCE = "lambda x: x+5"
+
+
+def inline_lambda(calls):
+    total = 0
+    for value in range(calls):
+        total += (lambda x: x+5)(value)
+    return total
+
+
+def eval_per_call(calls):
+    total = 0
+    for value in range(calls):
+        total += eval(SOURCE)(value)
+    return total
+
+
+def cached(calls, cache):
+    total = 0
+    for value in range(calls):
+        total += cache.get(SOURCE)(value)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expression cache benchmark.")
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cache = ExpressionCache()
+    expected = sum(range(args.calls)) + 5 * args.calls
+    rows = []
+    for name, func in (
+        ("inline lambda", lambda: inline_lambda(args.calls)),
+        ("eval per call", lambda: eval_per_call(args.calls)),
+        ("ExpressionCache", lambda: cached(args.calls, cache)),
+    ):
+        seconds, total = best_of(func, 3)
+        assert total == expected
+        rows.append([name, f"{seconds / args.calls * 1e9:,.0f}"])
+
+    print(f"{args.calls:,} calls")
+    print_table(["strategy", "ns per call"], rows)
+    stats = cache.stats()
+    print(f"cache: hit rate {stats['hit_rate']:.4%}, {stats['misses']} compile(s), "
+          f"{stats['compile_seconds'] * 1e6:,.0f} us spent compiling\n")
+
+    compiled = cache.get(SOURCE)
+    values = list(range(args.batch))
+    rows = []
+    baseline, _ = best_of(lambda: list(map(lambda x: x+5, values)), 3)
+    rows.append(["list(map(lambda))", f"{baseline:.4f}", "1.00x"])
+    seconds, _ = best_of(lambda: compiled.apply_batch(values), 3)
+    rows.append(["apply_batch, list in", f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+    if np is not None:
+        array = np.arange(args.batch)
+        seconds, _ = best_of(lambda: compiled.apply_batch(array), 3)
+        rows.append(["apply_batch, NumPy array in", f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+
+    print(f"Batch of {args.batch:,} values")
+    print_table(["strategy", "seconds", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
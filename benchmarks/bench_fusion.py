@@ -0,0 +1,68 @@
+# Benchmark: chains of 2 to 20 map/filter stages, nested builtin iterators vs one fused Pipeline loop
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_fusion
+#   python -m benchmarks.bench_fusion --lengths 2 4 8 16 20 --elements 1000000
+#
+# Stages alternate between map(x + 1) and filter(x >= 0), so the filters keep every element and
+# every chain length processes the same number of elements. The input is passed as an iterator,
+# so the NumPy path is never used and only the Python loops are compared.
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.pipeline import Pipeline, X
+
+
+def add_1(x):
+    return x + 1
+
+
+def non_negative(x):
+    return x >= 0
+
+
+def builtin_chain(data, length):
+    result = iter(data)
+    for i in range(length):
+        result = map(add_1, result) if i % 2 == 0 else filter(non_negative, result)
+    return list(result)
+
+
+def build_pipeline(length, use_expressions):
+    pipeline = Pipeline()
+    for i in range(length):
+        if i % 2 == 0:
+            pipeline = pipeline.map(X + 1 if use_expressions else add_1)
+        else:
+            pipeline = pipeline.filter(X >= 0 if use_expressions else non_negative)
+    return pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fused pipeline vs nested map/filter benchmark.")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[2, 5, 10, 15, 20])
+    parser.add_argument("--elements", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = range(args.elements)
+    rows = []
+    for length in args.lengths:
+        expected = builtin_chain(data, length)
+        baseline, _ = best_of(lambda: builtin_chain(data, length), args.repeat)
+        rows.append([length, "nested map/filter", f"{baseline:.4f}", "1.00x"])
+
+        for label, use_expressions in (("fused, function stages", False), ("fused, expression stages", True)):
+            pipeline = build_pipeline(length, use_expressions)
+            pipeline.compile()
+            seconds, result = best_of(lambda: pipeline.run(iter(data)), args.repeat)
+            assert result == expected
+            rows.append([length, label, f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+
+    print(f"{args.elements:,} elements\n")
+    print_table(["stages", "strategy", "seconds", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
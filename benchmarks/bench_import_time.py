@@ -0,0 +1,63 @@
+# Benchmark: how long importing each tutorial takes
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_import_time
+#   python -m benchmarks.bench_import_time --budget-ms 25 --repeat 10
+#
+# Importing a tutorial should only define its functions and classes. Every tutorial is imported in a fresh
+# interpreter with python -X importtime, and the cumulative import time of the tutorial module (including
+# everything it imports that wasn't imported yet) is compared against the budget. The script exits with
+# status 1 when any tutorial is over budget, so it can guard startup time in CI.
+
+import argparse
+import subprocess
+import sys
+
+from benchmarks.common import print_table
+from python_concepts.tutorials import TUTORIALS
+
+
+def import_time_us(module_name):
+    """
+    Import a module in a new interpreter and return its cumulative import time.
+    :param module_name: str
+    :return: int, microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module_name:
+            return int(fields[1])
+    raise RuntimeError(f"{module_name} missing from -X importtime output:\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tutorial import time benchmark.")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="maximum import time of one tutorial")
+    parser.add_argument("--repeat", type=int, default=5, help="imports per tutorial, the fastest one counts")
+    args = parser.parse_args()
+
+    table = []
+    over_budget = []
+    for tutorial in TUTORIALS:
+        module_name = f"python_concepts.tutorials.{tutorial}"
+        best_ms = min(import_time_us(module_name) for _ in range(args.repeat)) / 1000
+        ok = best_ms <= args.budget_ms
+        if not ok:
+            over_budget.append(tutorial)
+        table.append([tutorial, f"{best_ms:,.2f}", "ok" if ok else "OVER BUDGET"])
+    print(f"budget: {args.budget_ms:,.1f} ms per tutorial, best of {args.repeat}")
+    print_table(["tutorial", "import ms", "status"], table)
+
+    if over_budget:
+        print(f"Over budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
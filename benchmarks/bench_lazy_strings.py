@@ -0,0 +1,69 @@
+# Benchmark: memory and time of "Python" * n compared with RepeatedString("Python", n)
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_lazy_strings
+#   python -m benchmarks.bench_lazy_strings --max-eager-mb 8000
+#
+# For every n the benchmark creates the repeated string, then takes its length, reads a character and a slice
+# from the middle, and writes the whole thing to os.devnull. Memory is the peak traced by tracemalloc.
+# Eager repetition is skipped once the string would be bigger than --max-eager-mb.
+
+import argparse
+import os
+import time
+import tracemalloc
+
+from benchmarks.common import print_table
+from python_concepts.lazy_strings import RepeatedString
+
+WORD = "Python"
+
+
+def measure(make, n, sink):
+    """
+    :return: (peak MB, ms to create, microseconds for len + index + slice, ms to write everything)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    words = make(n)
+    created = time.perf_counter()
+    middle = len(words) // 2
+    _ = words[middle]
+    _ = str(words[middle:middle + 100])
+    accessed = time.perf_counter()
+    if isinstance(words, RepeatedString):
+        words.write_to(sink)
+    else:
+        sink.write(words)
+    written = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6, (created - start) * 1e3, (accessed - created) * 1e6, (written - accessed) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lazy string repetition benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**5, 10**7, 10**8, 10**9])
+    parser.add_argument("--max-eager-mb", type=float, default=1000)
+    args = parser.parse_args()
+
+    makers = {
+        "eager": lambda n: WORD * n,
+        "lazy": lambda n: RepeatedString(WORD, n),
+    }
+
+    table = []
+    with open(os.devnull, "w") as sink:
+        for n in args.sizes:
+            for name, make in makers.items():
+                if name == "eager" and len(WORD) * n / 1e6 > args.max_eager_mb:
+                    table.append([f"{n:,}", name, "skipped", "", "", ""])
+                    continue
+                peak_mb, create_ms, access_us, write_ms = measure(make, n, sink)
+                table.append([f"{n:,}", name, f"{peak_mb:,.2f}", f"{create_ms:,.3f}", f"{access_us:,.1f}", f"{write_ms:,.1f}"])
+
+    print_table(["n", "repetition", "peak MB", "create ms", "len/index/slice us", "write ms"], table)
+
+
+if __name__ == "__main__":
+    main()
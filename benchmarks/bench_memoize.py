@@ -0,0 +1,63 @@
+# Benchmark: per call overhead of memoize on cache hits and misses, compared with functools.lru_cache
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_memoize
+#   python -m benchmarks.bench_memoize --calls 500000
+
+import argparse
+import functools
+
+from benchmarks.common import best_of, print_table
+from python_concepts.memoize import memoize
+
+
+def calculate(start_value=0, **kwargs):
+    """ calculate from args_and_kwargs.py, missing operations skipped, returning instead of printing. """
+    total = start_value
+    if kwargs.get("multiply"):
+        total *= kwargs["multiply"]
+    if kwargs.get("divide"):
+        total /= kwargs["divide"]
+    if kwargs.get("add"):
+        total += kwargs["add"]
+    if kwargs.get("subtract"):
+        total -= kwargs["subtract"]
+    return total
+
+
+def hits(func, calls):
+    for _ in range(calls):
+        func(10, add=3, multiply=5, subtract=6, divide=4)
+
+
+def misses(func, calls):
+    # Every call has a new start value, so with a small cache every call misses and evicts an entry.
+    for i in range(calls):
+        func(i, add=3, multiply=5, subtract=6, divide=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="memoize overhead benchmark.")
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    variants = {
+        "no cache": calculate,
+        "functools.lru_cache": functools.lru_cache(maxsize=128)(calculate),
+        "memoize lru": memoize(maxsize=128)(calculate),
+        "memoize lfu": memoize(maxsize=128, policy="lfu")(calculate),
+        "memoize lru + ttl + max_bytes": memoize(maxsize=128, ttl=60, max_bytes=1_000_000)(calculate),
+    }
+
+    table = []
+    for name, func in variants.items():
+        hit_seconds, _ = best_of(lambda: hits(func, args.calls), 3)
+        miss_seconds, _ = best_of(lambda: misses(func, args.calls), 3)
+        table.append([name, f"{hit_seconds / args.calls * 1e9:,.0f}", f"{miss_seconds / args.calls * 1e9:,.0f}"])
+
+    print(f"{args.calls:,} calls per measurement")
+    print_table(["cache", "ns per hit", "ns per miss"], table)
+
+
+if __name__ == "__main__":
+    main()
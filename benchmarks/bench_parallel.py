@@ -0,0 +1,55 @@
+# Benchmark: when does parallel_map beat the builtin map?
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_parallel
+#   python -m benchmarks.bench_parallel --sizes 1000 100000 --costs 0 100 1000 --chunk-size 4096
+#
+# The cost of an element is the number of loop iterations the mapped function spins for, so 0 is roughly
+# the double() function from map_and_filter_functions.py and larger costs stand in for slower pure functions.
+# The process pool is started once per row and its start up time is included, since that is what a caller pays.
+
+import argparse
+import functools
+
+from benchmarks.common import best_of, print_table
+from python_concepts.parallel import parallel_map
+from python_concepts.reduction import default_workers
+
+
+def work(cost, num):
+    for _ in range(cost):
+        num = (num * 31 + 7) % 1000003
+    return num * 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parallel_map vs map benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--costs", type=int, nargs="+", default=[0, 10, 100, 1000])
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args()
+
+    rows = []
+    for cost in args.costs:
+        func = functools.partial(work, cost)
+        for n in args.sizes:
+            # Keep the slowest combinations from taking minutes.
+            if n * max(cost, 1) > 200_000_000:
+                continue
+            data = range(n)
+            serial, expected = best_of(lambda: list(map(func, data)), 1)
+            parallel, result = best_of(
+                lambda: list(parallel_map(func, data, chunk_size=args.chunk_size, workers=args.workers)), 1
+            )
+            assert result == expected
+            speedup = serial / parallel
+            rows.append([cost, f"{n:,}", f"{serial:.4f}", f"{parallel:.4f}", f"{speedup:.2f}x",
+                         "yes" if speedup > 1 else "no"])
+
+    print(f"{args.workers} worker processes, chunks of {args.chunk_size} elements\n")
+    print_table(["cost", "elements", "map s", "parallel_map s", "speedup", "pays off"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Benchmark: building people from (name, birth year) rows and keeping the adults
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_people
+#   python -m benchmarks.bench_people --count 1000000
+#
+# The per row version is the static_and_class_methods.py way: create_person_from_birth_year for every row
+# (a date.today() call each time), then Person.is_adult for every person.
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.people import Person, Population, is_adult_batch
+
+
+def per_row(rows):
+    people = [Person.create_person_from_birth_year(name, year) for name, year in rows]
+    return [person for person in people if Person.is_adult(person.age)]
+
+
+def bulk_factory(rows):
+    people = Person.from_birth_years(rows)
+    mask = is_adult_batch([person.age for person in people])
+    return [person for person, adult in zip(people, mask) if adult]
+
+
+def population(rows):
+    return Population.from_birth_years(rows).adults()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk Person creation and is_adult benchmark.")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rows = [(f"Person {i}", 1930 + i % 95) for i in range(args.count)]
+
+    table = []
+    baseline = None
+    for name, build in [
+        ("create_person_from_birth_year + is_adult per row", per_row),
+        ("Person.from_birth_years + is_adult_batch", bulk_factory),
+        ("Population.from_birth_years + adults()", population),
+    ]:
+        seconds, adults = best_of(lambda: build(rows), 3)
+        baseline = baseline or seconds
+        table.append([name, f"{len(adults):,}", f"{args.count / seconds:,.0f}", f"{baseline / seconds:.2f}x"])
+    print(f"{args.count:,} rows")
+    print_table(["strategy", "adults", "rows/sec", "speedup"], table)
+
+    ages = Population.from_birth_years(rows).ages
+    age_list = ages.tolist()
+    table = []
+    for name, classify in [
+        ("Person.is_adult per age", lambda: [Person.is_adult(age) for age in age_list]),
+        ("is_adult_batch(list)", lambda: is_adult_batch(age_list)),
+        (f"is_adult_batch({type(ages).__name__})", lambda: is_adult_batch(ages)),
+    ]:
+        seconds, _ = best_of(classify, 3)
+        table.append([name, f"{seconds / args.count * 1e9:,.1f}"])
+    print_table(["classification", "ns per age"], table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Benchmark: the filter(is_odd) -> map(add_7) -> map(double) chain from map_and_filter_functions.py,
+# builtin map/filter vs Pipeline (Python fallback and NumPy batches)
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_pipeline
+#   python -m benchmarks.bench_pipeline --sizes 1000 1000000 100000000
+
+import argparse
+
+from benchmarks.common import best_of, print_table
+from python_concepts.pipeline import Pipeline, X, np
+
+
+def is_odd(x):
+    return x % 2 != 0
+
+
+def add_7(x):
+    return x + 7
+
+
+def double(num):
+    return num * 2
+
+
+def builtin_chain(data):
+    return list(map(double, map(add_7, filter(is_odd, data))))
+
+
+FUNCTION_PIPELINE = Pipeline().filter(is_odd).map(add_7).map(double)
+EXPRESSION_PIPELINE = Pipeline().filter(X % 2 != 0).map(X + 7).map(X * 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Builtin map/filter vs Pipeline benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for n in args.sizes:
+        repeat = args.repeat if n <= 1_000_000 else 1
+        data = range(n)
+        baseline, expected_length = best_of(lambda: len(builtin_chain(data)), repeat)
+        rows.append([f"{n:,}", "builtin map/filter", f"{baseline:.4f}", "1.00x"])
+
+        seconds, _ = best_of(lambda: FUNCTION_PIPELINE.run(data), repeat)
+        rows.append([f"{n:,}", "Pipeline, functions", f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+
+        if np is None:
+            rows.append([f"{n:,}", "Pipeline, NumPy", "NumPy not installed", "-"])
+            continue
+        array = np.arange(n)
+        seconds, result = best_of(lambda: EXPRESSION_PIPELINE.run(array), repeat)
+        assert len(result) == expected_length
+        rows.append([f"{n:,}", "Pipeline, NumPy array in", f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+
+    print_table(["elements", "strategy", "seconds", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
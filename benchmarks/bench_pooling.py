@@ -0,0 +1,139 @@
+# Benchmark: objects created and garbage collector pauses while churning through short lived Person and Car objects
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_pooling
+#   python -m benchmarks.bench_pooling --requests 1000000 --distinct 100
+#
+# Every "request" creates a Person and a Car from a small set of distinct values and keeps them around for the
+# next --live requests (like objects held by requests still in progress), then drops them. The plain version
+# creates two new objects per request, the interned version shares instances with the same values, and the pooled
+# version releases every object back to an ObjectPool when it is dropped.
+#
+# Objects created is counted by the classes themselves. GC pauses are timed with gc.callbacks.
+
+import argparse
+import collections
+import gc
+import time
+
+from benchmarks.common import print_table
+from python_concepts.pooling import InternedCar, InternedPerson, ObjectPool
+
+
+class Counted:
+    """ Counts how many instances of each subclass are created (reusing an instance doesn't count). """
+
+    __slots__ = ()
+    created = 0
+
+    def __new__(cls, *args, **kwargs):
+        cls.created += 1
+        return super().__new__(cls)
+
+
+class Person(Counted):
+    """ The Person from static_and_class_methods.py. """
+
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+
+class Car(Counted):
+    """ The Car from dunder_methods.py. """
+
+    def __init__(self, make, model):
+        self.make = make
+        self.model = model
+
+
+class CountedInternedPerson(Counted, InternedPerson):
+    __slots__ = ()
+
+
+class CountedInternedCar(Counted, InternedCar):
+    __slots__ = ()
+
+
+class GCTimer:
+    """ Collects the duration of every garbage collection while active. """
+
+    def __init__(self):
+        self.pauses = []
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            self.pauses.append(time.perf_counter() - self._start)
+            self._start = None
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self)
+
+
+def workload(values, requests, live, make_person, make_car, drop=None):
+    in_flight = collections.deque()
+    for i in range(requests):
+        name, age, make, model = values[i % len(values)]
+        in_flight.append((make_person(name, age), make_car(make, model)))
+        if len(in_flight) > live:
+            finished = in_flight.popleft()
+            if drop is not None:
+                drop(finished)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interning and pooling churn benchmark.")
+    parser.add_argument("--requests", type=int, default=300_000)
+    parser.add_argument("--distinct", type=int, default=100, help="distinct (name, age, make, model) values")
+    parser.add_argument("--live", type=int, default=1000, help="requests in progress at any time")
+    args = parser.parse_args()
+
+    values = [(f"Person {i}", 18 + i % 60, f"Make {i % 20}", f"Model {i}") for i in range(args.distinct)]
+
+    person_pool = ObjectPool(Person, maxsize=args.live * 2)
+    car_pool = ObjectPool(Car, maxsize=args.live * 2)
+
+    def release(finished):
+        person_pool.release(finished[0])
+        car_pool.release(finished[1])
+
+    variants = [
+        ("plain", lambda: workload(values, args.requests, args.live, Person, Car)),
+        ("interned", lambda: workload(values, args.requests, args.live, CountedInternedPerson, CountedInternedCar)),
+        ("pooled", lambda: workload(values, args.requests, args.live, person_pool.acquire, car_pool.acquire, release)),
+    ]
+
+    table = []
+    for name, run in variants:
+        counted = (Person, Car, CountedInternedPerson, CountedInternedCar)
+        for cls in counted:
+            cls.created = 0
+        with GCTimer() as timer:
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+        created = sum(cls.created for cls in counted)
+        pauses = timer.pauses
+        table.append([
+            name,
+            f"{created:,}",
+            f"{len(pauses):,}",
+            f"{sum(pauses) * 1e3:,.2f}",
+            f"{max(pauses, default=0) * 1e3:,.3f}",
+            f"{seconds * 1e3:,.0f}",
+        ])
+
+    print(f"{args.requests:,} requests, {args.distinct:,} distinct values, {args.live:,} in progress")
+    print_table(["objects", "created", "collections", "GC ms total", "GC ms max", "wall ms"], table)
+
+
+if __name__ == "__main__":
+    main()
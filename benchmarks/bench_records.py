@@ -0,0 +1,96 @@
+# Benchmark: memory and attribute access for millions of cars, plain class vs __slots__ Car vs CarFleet columns
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_records
+#   python -m benchmarks.bench_records --sizes 1000000 10000000
+#
+# Memory is measured with tracemalloc: the memory still allocated after building the records.
+# Makes and models come from a small list, like real data where many cars share a make and model.
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.common import print_table
+from python_concepts.records import Car, CarFleet
+
+MAKES = [f"Make{i}" for i in range(50)]
+MODELS = [f"Model{i}" for i in range(500)]
+CONDITIONS = ["New", "Used", "Certified"]
+
+
+class PlainCar:
+    """ The Car from optional_parameters.py. """
+
+    def __init__(self, make, model, year, condition="New", mileage="0"):
+        self.make = make
+        self.model = model
+        self.year = year
+        self.condition = condition
+        self.mileage = mileage
+
+
+def rows(count):
+    for i in range(count):
+        yield MAKES[i % 50], MODELS[i % 500], 1990 + i % 35, CONDITIONS[i % 3], i % 250_000
+
+
+def build_plain(count):
+    return [PlainCar(*row) for row in rows(count)]
+
+
+def build_slotted(count):
+    return [Car(*row) for row in rows(count)]
+
+
+def build_fleet(count):
+    fleet = CarFleet()
+    fleet.extend(rows(count))
+    return fleet
+
+
+def measure_memory(build, count):
+    gc.collect()
+    tracemalloc.start()
+    records = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, current
+
+
+def time_it(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Car record memory and access benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000])
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        table = []
+        expected = sum(row[4] for row in rows(count))
+        for name, build, readers in (
+            ("plain class", build_plain, {"obj.mileage": lambda cars: sum(car.mileage for car in cars)}),
+            ("__slots__ Car", build_slotted, {"obj.mileage": lambda cars: sum(car.mileage for car in cars)}),
+            ("CarFleet", build_fleet, {
+                "view.mileage": lambda fleet: sum(car.mileage for car in fleet),
+                "column": lambda fleet: sum(fleet.mileages),
+            }),
+        ):
+            records, memory = measure_memory(build, count)
+            for reader_name, reader in readers.items():
+                seconds, total = time_it(lambda: reader(records))
+                assert total == expected
+                table.append([name, f"{memory / 2**20:,.1f}", f"{memory / count:.1f}", reader_name, f"{seconds:.3f}"])
+            del records
+
+        print(f"{count:,} cars")
+        print_table(["storage", "memory (MB)", "bytes per car", "sum of mileage via", "seconds"], table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Benchmark: partitioned summation vs the shared `total` threads from threading_basics.py
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_reduction
+#   python -m benchmarks.bench_reduction --large    (also runs the 1..1,000,000,000 range)
+
+import argparse
+import threading
+
+from benchmarks.common import best_of, print_table
+from python_concepts.reduction import BACKENDS, default_workers, parallel_sum
+
+
+def locked_two_thread_sum(n):
+    """ The add_first_half/add_second_half pattern from threading_basics.py with the lock turned on. """
+    total = 0
+    lock = threading.Lock()
+    half = n // 2
+
+    def add(numbers):
+        nonlocal total
+        for num in numbers:
+            with lock:
+                total += num
+
+    threads = [
+        threading.Thread(target=add, args=(range(half + 1),)),
+        threading.Thread(target=add, args=(range(half + 1, n + 1),)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return total
+
+
+def worker_counts(max_workers):
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def run(n, max_workers, repeat):
+    expected = n * (n + 1) // 2
+    numbers = range(1, n + 1)
+    rows = []
+
+    baseline, _ = best_of(lambda: sum(numbers), repeat)
+    rows.append(["sum() single thread", 1, f"{baseline:.4f}", "1.00x"])
+
+    # The per-increment lock is far too slow to run on the large ranges.
+    if n <= 10_000_000:
+        seconds, result = best_of(lambda: locked_two_thread_sum(n), 1)
+        assert result == expected
+        rows.append(["threads + lock", 2, f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+
+    for backend in BACKENDS:
+        for workers in worker_counts(max_workers):
+            if backend == "inline" and workers > 1:
+                continue
+            seconds, result = best_of(lambda: parallel_sum(numbers, backend=backend, workers=workers), repeat)
+            assert result == expected, f"{backend} with {workers} workers returned {result}"
+            rows.append([f"parallel_sum {backend}", workers, f"{seconds:.4f}", f"{baseline / seconds:.2f}x"])
+
+    print(f"Sum of 1..{n:,} = {expected}")
+    print_table(["strategy", "workers", "seconds", "speedup"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partitioned summation benchmark.")
+    parser.add_argument("--large", action="store_true", help="also sum 1..1,000,000,000 (1000x the tutorial range)")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="largest worker count to try")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{default_workers()} CPU cores available. Speedup is relative to a single sum() call.\n")
+    run(1_000_000, args.workers, args.repeat)
+    if args.large:
+        run(1_000_000_000, args.workers, 1)
+
+
+if __name__ == "__main__":
+    main()
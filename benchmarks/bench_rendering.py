@@ -0,0 +1,75 @@
+# Benchmark: records per second of the per-object display_info()/display() print loop compared with the batched renderer
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_rendering
+#   python -m benchmarks.bench_rendering --records 1000000
+#
+# Everything is written to os.devnull, so the numbers measure formatting and write calls, not a terminal.
+
+import argparse
+import contextlib
+import os
+
+from benchmarks.common import best_of, print_table
+from python_concepts.records import Car, CarFleet
+from python_concepts.rendering import render_cars, render_people
+
+MAKES_AND_MODELS = [("Jeep", "Wrangler"), ("Ford", "F-150"), ("Toyota", "Corolla"), ("Honda", "Civic")]
+
+
+class Person:
+    """ The Person from static_and_class_methods.py. """
+
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def display(self):
+        print(f"{self.name} is {self.age} years old.")
+
+
+def print_loop(records, method, sink, **kwargs):
+    with contextlib.redirect_stdout(sink):
+        for record in records:
+            getattr(record, method)(**kwargs)
+    return len(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched rendering throughput benchmark.")
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--buffer-size", type=int, default=1 << 20)
+    args = parser.parse_args()
+
+    cars = [
+        Car(*MAKES_AND_MODELS[i % len(MAKES_AND_MODELS)], 1990 + i % 30, "Used", i * 7 % 200_000)
+        for i in range(args.records)
+    ]
+    fleet = CarFleet.from_cars(cars)
+    people = [Person(f"Person {i}", i % 90) for i in range(args.records)]
+    buffer_size = args.buffer_size
+
+    with open(os.devnull, "w") as sink:
+        variants = [
+            ("cars, print loop, show_all", lambda: print_loop(cars, "display_info", sink, show_all=True)),
+            ("cars, print loop, show_all=False", lambda: print_loop(cars, "display_info", sink, show_all=False)),
+            ("cars, render_cars, show_all", lambda: render_cars(cars, file=sink, buffer_size=buffer_size)),
+            ("cars, render_cars, show_all=False",
+             lambda: render_cars(cars, show_all=False, file=sink, buffer_size=buffer_size)),
+            ("fleet, render_cars, show_all", lambda: render_cars(fleet, file=sink, buffer_size=buffer_size)),
+            ("cars, render_cars, csv", lambda: render_cars(cars, file=sink, format="csv", buffer_size=buffer_size)),
+            ("cars, render_cars, jsonl", lambda: render_cars(cars, file=sink, format="jsonl", buffer_size=buffer_size)),
+            ("people, print loop", lambda: print_loop(people, "display", sink)),
+            ("people, render_people", lambda: render_people(people, file=sink, buffer_size=buffer_size)),
+        ]
+        table = []
+        for name, run in variants:
+            seconds, count = best_of(run, 3)
+            table.append([name, f"{count / seconds:,.0f}"])
+
+    print(f"{args.records:,} records, buffer size {buffer_size:,} characters")
+    print_table(["variant", "records per second"], table)
+
+
+if __name__ == "__main__":
+    main()
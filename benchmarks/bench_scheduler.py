@@ -0,0 +1,95 @@
+# Benchmark: WorkerPool from python_concepts/scheduler.py vs creating one threading.Thread per task
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_scheduler
+#   python -m benchmarks.bench_scheduler --tasks 50000 --workers 16
+#
+# Start latency is the time from submitting a task to it starting to run. For the pool this includes the time
+# the task spent waiting in the queue behind the tasks submitted before it, which is the price of the thread limit.
+
+import argparse
+import statistics
+import threading
+import time
+
+from benchmarks.common import print_table
+from python_concepts.scheduler import WorkerPool
+
+
+def cpu_task():
+    return sum(range(100))
+
+
+def sleep_task():
+    time.sleep(0.001)
+
+
+def thread_per_task(task, count):
+    """
+    The threading_basics.py approach: start a new thread for every task and join them all at the end.
+    :return: (seconds, list of start latencies in seconds)
+    """
+    latencies = []
+
+    def run(submitted):
+        latencies.append(time.perf_counter() - submitted)
+        task()
+
+    start = time.perf_counter()
+    threads = []
+    for _ in range(count):
+        thread = threading.Thread(target=run, args=(time.perf_counter(),))
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+def worker_pool(task, count, workers):
+    """
+    The same tasks submitted to a WorkerPool.
+    :return: (seconds, list of start latencies in seconds)
+    """
+    latencies = []
+
+    def run(submitted):
+        latencies.append(time.perf_counter() - submitted)
+        task()
+
+    start = time.perf_counter()
+    with WorkerPool(workers=workers) as pool:
+        for _ in range(count):
+            pool.submit(run, time.perf_counter())
+    return time.perf_counter() - start, latencies
+
+
+def summarize(name, seconds, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if len(latencies) > 1 else latencies[0]
+    return [
+        name,
+        f"{len(latencies) / seconds:,.0f}",
+        f"{statistics.median(latencies) * 1e6:,.0f}",
+        f"{p99 * 1e6:,.0f}",
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker pool vs thread-per-task benchmark.")
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    headers = ["strategy", "tasks/sec", "p50 start latency (us)", "p99 start latency (us)"]
+    for label, task in (("cpu task: sum(range(100))", cpu_task), ("wait task: time.sleep(0.001)", sleep_task)):
+        rows = [
+            summarize("thread per task", *thread_per_task(task, args.tasks)),
+            summarize(f"WorkerPool({args.workers})", *worker_pool(task, args.tasks, args.workers)),
+        ]
+        print(f"{args.tasks:,} x {label}")
+        print_table(headers, rows)
+
+
+if __name__ == "__main__":
+    main()
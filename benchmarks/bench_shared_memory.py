@@ -0,0 +1,110 @@
+# Benchmark: the add_first_half/add_second_half sum on threads, on a process pool that pickles results back,
+# and on processes that write their results into shared memory
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_shared_memory
+#   python -m benchmarks.bench_shared_memory --count 20000000 --workers 1 2 4 8 --payloads 1 1000000
+#
+# The first table is the scaling: every worker runs the same Python loop over its share of 1..count, so threads stay
+# at one core's speed (the GIL) while both process versions can use one core per worker. Results here are one
+# integer per worker, so the two process versions should be close.
+# The second table is the IPC cost: every worker does no real work, but hands back `payload` integers, either
+# pickled through the pool's result pipe or written into a SharedInts block.
+
+import argparse
+import os
+import threading
+
+from benchmarks.common import best_of, print_table
+from python_concepts.reduction import map_chunks, partition
+from python_concepts.shared_accumulators import Process, SharedInts, add_numbers, shared_memory_sum
+
+
+# These run inside the worker processes, so they have to be module level functions.
+def loop_sum(numbers):
+    total = 0
+    for num in numbers:
+        total += num
+    return total
+
+
+def make_payload(size):
+    return list(range(size))
+
+
+def write_payload(shared, index, size):
+    shared[index * size:(index + 1) * size] = range(size)
+
+
+def thread_sum(data, workers):
+    """ The partial_totals version from threading_basics.py with `workers` threads. """
+    pieces = partition(data, workers)
+    partial_totals = [0] * len(pieces)
+
+    def add_range(index, numbers):
+        partial_totals[index] = loop_sum(numbers)
+
+    threads = [threading.Thread(target=add_range, args=(i, piece)) for i, piece in enumerate(pieces)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(partial_totals)
+
+
+def pickled_pool_sum(data, workers):
+    return sum(map_chunks(loop_sum, partition(data, workers), backend="process", workers=workers))
+
+
+def pickled_payload(size, workers):
+    return sum(len(result) for result in map_chunks(make_payload, [size] * workers, backend="process", workers=workers))
+
+
+def shared_payload(size, workers):
+    # Same process startup as shared_memory_sum, but every worker writes `size` integers.
+    with SharedInts(size * workers) as shared:
+        processes = [Process(target=write_payload, args=(shared, i, size)) for i in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return len(shared)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared memory process backend benchmark.")
+    parser.add_argument("--count", type=int, default=4_000_000, help="add up 1..count")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--payloads", type=int, nargs="+", default=[1, 100_000, 1_000_000],
+                        help="integers every worker hands back in the IPC table")
+    args = parser.parse_args()
+
+    data = range(1, args.count + 1)
+    expected = args.count * (args.count + 1) // 2
+    rows = []
+    for name, run in [
+        ("threads", thread_sum),
+        ("process pool, pickled results", pickled_pool_sum),
+        ("processes, shared memory", lambda data, workers: shared_memory_sum(data, workers, add_numbers)),
+    ]:
+        row = [name]
+        for workers in args.workers:
+            seconds, total = best_of(lambda: run(data, workers), 3)
+            assert total == expected, (name, workers, total)
+            row.append(f"{seconds * 1000:,.0f} ms")
+        rows.append(row)
+    print(f"sum of 1..{args.count:,} with a Python loop, {os.cpu_count()} CPU cores")
+    print_table(["backend"] + [f"{workers} workers" for workers in args.workers], rows)
+
+    workers = max(args.workers)
+    rows = []
+    for size in args.payloads:
+        pickled, _ = best_of(lambda: pickled_payload(size, workers), 3)
+        shared, _ = best_of(lambda: shared_payload(size, workers), 3)
+        rows.append([f"{size:,}", f"{pickled * 1000:,.1f} ms", f"{shared * 1000:,.1f} ms", f"{pickled / shared:.2f}x"])
+    print(f"{workers} workers handing back results")
+    print_table(["ints per worker", "pickled", "shared memory", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Benchmark: memory use while streaming a very long input through filter -> map -> batch
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_streams
+#   python -m benchmarks.bench_streams --elements 100000000
+#
+# The resident memory (RSS) of the process is sampled every tenth of the way through the stream.
+# For a Stream it should stay flat no matter how many elements go through, while the list(...) version
+# from map_and_filter_functions.py grows with the input (it is only run for the smaller sizes).
+
+import argparse
+import os
+import time
+
+from benchmarks.common import print_table
+from python_concepts.pipeline import X
+from python_concepts.streams import Stream
+
+
+def current_rss_mb():
+    """ Current resident memory of this process in MB (Linux only, 0 elsewhere). """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        return 0.0
+
+
+def numbers(count):
+    """ Stands in for an unbounded source like a file or socket. """
+    for i in range(count):
+        yield i
+
+
+def stream_total(count, samples):
+    # There are count // 2 odd numbers in batches of 1000, so this samples about 10 times over the whole stream.
+    checkpoint = max(1, count // 2 // 1000 // 10)
+    total = 0
+    stream = Stream(numbers(count)).filter(X % 2 != 0).map(X + 7).batch(1000).map(sum)
+    for i, batch_total in enumerate(stream):
+        total += batch_total
+        if i % checkpoint == 0:
+            samples.append(current_rss_mb())
+    return total
+
+
+def list_total(count, samples):
+    odd_nums_plus_seven = list(map(lambda x: x + 7, filter(lambda x: x % 2 != 0, numbers(count))))
+    samples.append(current_rss_mb())
+    return sum(odd_nums_plus_seven)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Constant memory streaming benchmark.")
+    parser.add_argument("--elements", type=int, default=10_000_000)
+    parser.add_argument("--list-limit", type=int, default=10_000_000, help="largest input to also run with list(...)")
+    args = parser.parse_args()
+
+    count = args.elements
+    # Sum of the odd numbers below count, plus 7 for every one of them.
+    odds = count // 2
+    expected = odds * odds + 7 * odds
+
+    rows = []
+    for name, strategy in (("Stream", stream_total), ("list(map(filter(...)))", list_total)):
+        if strategy is list_total and count > args.list_limit:
+            rows.append([name, "skipped", "-", "-"])
+            continue
+        before = current_rss_mb()
+        samples = []
+        start = time.perf_counter()
+        assert strategy(count, samples) == expected
+        seconds = time.perf_counter() - start
+        rows.append([name, f"{seconds:.2f}", f"{before:.1f}", f"{max(samples):.1f}"])
+
+    print(f"{count:,} elements\n")
+    print_table(["strategy", "seconds", "RSS before (MB)", "peak sampled RSS (MB)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Benchmark: what thread_trace costs, turned off and turned on
+#
+# Run from the root of the repository:
+#   python -m benchmarks.bench_thread_trace
+#   python -m benchmarks.bench_thread_trace --count 1000000 --budget-ns 500
+#
+# While tracing is off, thread_trace.Lock() and Thread() return plain threading objects, so the only cost is the
+# factory call when they're created. While tracing is on, every acquire/release pair pays for the clock reads and
+# counters of TracedLock. The script exits with status 1 when that overhead per pair is over --budget-ns.
+
+import argparse
+import sys
+import threading
+
+from benchmarks.common import best_of, print_table
+from python_concepts import thread_trace
+
+
+def lock_loop(lock, count):
+    for _ in range(count):
+        with lock:
+            pass
+
+
+def two_thread_sum(make_lock, make_thread, n):
+    """ add_first_half/add_second_half from threading_basics.py with the lock turned on. """
+    total = 0
+    lock = make_lock()
+    half = n // 2
+
+    def add(numbers):
+        nonlocal total
+        for num in numbers:
+            with lock:
+                total += num
+
+    threads = [make_thread(target=add, args=(range(half + 1),)), make_thread(target=add, args=(range(half + 1, n + 1),))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return total
+
+
+def start_join(make_thread, count):
+    for _ in range(count):
+        thread = make_thread(target=int)
+        thread.start()
+        thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="thread_trace overhead benchmark.")
+    parser.add_argument("--count", type=int, default=200_000, help="lock acquire/release pairs")
+    parser.add_argument("--threads", type=int, default=2_000, help="threads started and joined")
+    parser.add_argument("--budget-ns", type=float, default=1_000.0, help="allowed tracing overhead per lock pair")
+    args = parser.parse_args()
+
+    def traced(func):
+        with thread_trace.tracing():
+            return func()
+
+    table = []
+    plain_ns = None
+    for name, run in [
+        ("threading.Lock", lambda: lock_loop(threading.Lock(), args.count)),
+        ("thread_trace.Lock, tracing off", lambda: lock_loop(thread_trace.Lock(), args.count)),
+        ("thread_trace.Lock, tracing on", lambda: traced(lambda: lock_loop(thread_trace.Lock(), args.count))),
+    ]:
+        seconds, _ = best_of(run, 5)
+        pair_ns = seconds / args.count * 1e9
+        plain_ns = plain_ns or pair_ns
+        table.append([name, f"{pair_ns:,.1f}", f"{pair_ns - plain_ns:+,.1f}"])
+    traced_overhead_ns = pair_ns - plain_ns
+    print(f"{args.count:,} uncontended acquire/release pairs")
+    print_table(["lock", "ns per pair", "overhead ns"], table)
+
+    table = []
+    plain = None
+    for name, make_lock, make_thread, wrap in [
+        ("threading", threading.Lock, threading.Thread, lambda func: func()),
+        ("thread_trace, tracing off", thread_trace.Lock, thread_trace.Thread, lambda func: func()),
+        ("thread_trace, tracing on", thread_trace.Lock, thread_trace.Thread, traced),
+    ]:
+        seconds, total = best_of(lambda: wrap(lambda: two_thread_sum(make_lock, make_thread, args.count)), 3)
+        plain = plain or seconds
+        table.append([name, f"{seconds * 1000:,.1f}", f"{(seconds / plain - 1) * 100:+.1f}%", f"{total:,}"])
+    print(f"locked two thread sum of 1..{args.count:,}")
+    print_table(["implementation", "ms", "overhead", "total"], table)
+
+    table = []
+    plain = None
+    for name, make_thread, wrap in [
+        ("threading.Thread", threading.Thread, lambda func: func()),
+        ("thread_trace.Thread, tracing off", thread_trace.Thread, lambda func: func()),
+        ("thread_trace.Thread, tracing on", thread_trace.Thread, traced),
+    ]:
+        seconds, _ = best_of(lambda: wrap(lambda: start_join(make_thread, args.threads)), 3)
+        per_thread_us = seconds / args.threads * 1e6
+        plain = plain or per_thread_us
+        table.append([name, f"{per_thread_us:,.1f}", f"{per_thread_us - plain:+,.1f}"])
+    print(f"{args.threads:,} threads started and joined")
+    print_table(["thread", "us per thread", "overhead us"], table)
+
+    status = "within" if traced_overhead_ns <= args.budget_ns else "OVER"
+    print(f"tracing overhead per lock pair: {traced_overhead_ns:,.1f} ns, {status} the {args.budget_ns:,.0f} ns budget")
+    return 0 if traced_overhead_ns <= args.budget_ns else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# Small helpers shared by the benchmark scripts in this folder.
+
+import time
+
+
+def best_of(func, repeat=3):
+    """
+    Run func `repeat` times and return the fastest wall time in seconds along with the last result.
+    The fastest run is the one least disturbed by whatever else the machine was doing.
+    :param func: function that takes no arguments
+    :param repeat: int
+    :return: (float, result of func)
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(headers, rows):
+    """
+    Print rows as a plain text table with left aligned columns.
+    :param headers: list of str
+    :param rows: list of lists
+    """
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(header)), *(len(row[i]) for row in rows)) for i, header in enumerate(headers)]
+    print("  ".join(str(header).ljust(width) for header, width in zip(headers, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    print()
@@ -0,0 +1,161 @@
+# The benchmarks registered for the benchmark suite (see suite.py): the hot path of every tutorial,
+# next to the python_concepts module that speeds it up.
+#
+# The tutorial versions are imported straight from python_concepts/tutorials, so the suite measures the code
+# the tutorials actually show. Tutorial functions that print or have a fixed size are rewritten here with a size.
+
+import threading
+
+from benchmarks.bench_reduction import locked_two_thread_sum
+from benchmarks.registry import benchmark
+from python_concepts import construction, lazy_strings, people
+from python_concepts.expressions import expression
+from python_concepts.pipeline import Pipeline, X
+from python_concepts.reduction import parallel_sum
+from python_concepts.tutorials import args_and_kwargs, map_and_filter_functions, optional_parameters
+from python_concepts.tutorials import static_and_class_methods
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# threading_basics.py: adding up 1..n on two threads
+
+
+@benchmark("threading.locked_sum", sizes=(10_000, 100_000))
+def threading_locked_sum(size):
+    """ add_first_half/add_second_half with the lock taken for every number """
+    return lambda: locked_two_thread_sum(size)
+
+
+@benchmark("threading.partial_totals", sizes=(10_000, 100_000))
+def threading_partial_totals(size):
+    """ Two threads that each sum their own half and store it in partial_totals """
+    half = size // 2
+
+    def run():
+        partial_totals = [0, 0]
+
+        def add_range(index, numbers):
+            partial_totals[index] = sum(numbers)
+
+        threads = [
+            threading.Thread(target=add_range, args=(0, range(half + 1))),
+            threading.Thread(target=add_range, args=(1, range(half + 1, size + 1))),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return sum(partial_totals)
+    return run
+
+
+@benchmark("threading.parallel_sum", sizes=(10_000, 100_000))
+def threading_parallel_sum(size):
+    """ reduction.parallel_sum on the thread backend """
+    return lambda: parallel_sum(range(1, size + 1), backend="thread")
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# map_and_filter_functions.py: map(add_7, filter(is_odd, nums))
+
+
+@benchmark("map_filter.builtins", sizes=(1_000, 100_000))
+def map_filter_builtins(size):
+    """ list(map(add_7, filter(is_odd, nums))) with the tutorial's functions """
+    nums = list(range(size))
+    add_7, is_odd = map_and_filter_functions.add_7, map_and_filter_functions.is_odd
+    return lambda: list(map(add_7, filter(is_odd, nums)))
+
+
+@benchmark("map_filter.pipeline", sizes=(1_000, 100_000))
+def map_filter_pipeline(size):
+    """ Pipeline().filter(X % 2 != 0).map(X + 7) """
+    nums = list(range(size))
+    pipeline = Pipeline().filter(X % 2 != 0).map(X + 7)
+    return lambda: pipeline.run(nums)
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# lambda_functions.py: applying lambda x: x + 5 to every number
+
+
+@benchmark("lambda.map", sizes=(1_000, 100_000))
+def lambda_map(size):
+    """ list(map(lambda x: x + 5, nums)) """
+    nums = list(range(size))
+    return lambda: list(map(lambda x: x + 5, nums))
+
+
+@benchmark("lambda.expression_batch", sizes=(1_000, 100_000))
+def lambda_expression_batch(size):
+    """ expression("lambda x: x + 5").apply_batch(nums) """
+    nums = list(range(size))
+    add_five = expression("lambda x: x + 5")
+    return lambda: add_five.apply_batch(nums)
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# args_and_kwargs.py: creating Cars from rows
+
+
+def _car_rows(size):
+    return [("Jeep", "Wrangler", 2000 + i % 25, i, "gray") for i in range(size)]
+
+
+@benchmark("car.kwargs_init", sizes=(1_000, 100_000))
+def car_kwargs_init(size):
+    """ The tutorial's Car(**kwargs) for every row """
+    rows = _car_rows(size)
+    fields = construction.Car.fields
+    Car = args_and_kwargs.Car
+    return lambda: [Car(**dict(zip(fields, row))) for row in rows]
+
+
+@benchmark("car.from_rows", sizes=(1_000, 100_000))
+def car_from_rows(size):
+    """ construction.Car.from_rows(rows) """
+    rows = _car_rows(size)
+    return lambda: construction.Car.from_rows(rows)
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# static_and_class_methods.py: creating people from birth years
+
+
+def _birth_year_rows(size):
+    return [(f"Person {i}", 1930 + i % 95) for i in range(size)]
+
+
+@benchmark("person.factory", sizes=(1_000, 100_000))
+def person_factory(size):
+    """ The tutorial's Person.create_person_from_birth_year for every row """
+    rows = _birth_year_rows(size)
+    create = static_and_class_methods.Person.create_person_from_birth_year
+    return lambda: [create(name, year) for name, year in rows]
+
+
+@benchmark("person.from_birth_years", sizes=(1_000, 100_000))
+def person_from_birth_years(size):
+    """ people.Person.from_birth_years(rows) """
+    rows = _birth_year_rows(size)
+    return lambda: people.Person.from_birth_years(rows)
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# optional_parameters.py: repeat_words("Python", frequency)
+
+
+@benchmark("repeat_words.eager", sizes=(1_000, 1_000_000))
+def repeat_words_eager(size):
+    """ The tutorial's repeat_words, then len() and a slice """
+    repeat_words = optional_parameters.repeat_words
+
+    def run():
+        words = repeat_words("Python", size)
+        return len(words), words[-12:]
+    return run
+
+
+@benchmark("repeat_words.lazy", sizes=(1_000, 1_000_000))
+def repeat_words_lazy(size):
+    """ lazy_strings.repeat_words, then len() and a slice """
+    repeat_words = lazy_strings.repeat_words
+
+    def run():
+        words = repeat_words("Python", size)
+        return len(words), str(words[-12:])
+    return run
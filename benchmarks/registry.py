@@ -0,0 +1,217 @@
+# Benchmark registry for the benchmark suite (see suite.py).
+#
+# A benchmark is a function that takes an input size, does its setup, and returns a function with no arguments
+# that runs the code being measured once:
+#
+#   @benchmark("map_filter.builtins", sizes=(1_000, 100_000))
+#   def map_filter_builtins(size):
+#       nums = list(range(size))
+#       return lambda: list(map(add_7, filter(is_odd, nums)))
+#
+# Every (benchmark, size) pair is measured separately and stored under a key like "map_filter.builtins[1000]".
+
+import gc
+import math
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# name -> Benchmark, in the order they were registered
+_BENCHMARKS = {}
+
+
+class Benchmark:
+    """ A registered benchmark and the input sizes it runs with. """
+
+    def __init__(self, name, setup, sizes, description=""):
+        self.name = name
+        self.setup = setup
+        self.sizes = tuple(sizes)
+        self.description = description
+
+    def __repr__(self):
+        return f"Benchmark({self.name!r}, sizes={self.sizes})"
+
+
+def benchmark(name, sizes=(1_000,)):
+    """
+    Register a benchmark. The first line of the function's docstring is used as its description.
+    :param name: str, unique name like "module.variant"
+    :param sizes: tuple of int, input sizes to run it with
+    :return: decorator
+    """
+    def register(setup):
+        if name in _BENCHMARKS:
+            raise ValueError(f"A benchmark called {name!r} is already registered.")
+        description = (setup.__doc__ or "").strip().split("\n")[0]
+        _BENCHMARKS[name] = Benchmark(name, setup, sizes, description)
+        return setup
+    return register
+
+
+def registered(patterns=()):
+    """
+    Registered benchmarks whose name contains any of the patterns, all of them if there are no patterns.
+    :param patterns: iterable of str
+    :return: list of Benchmark
+    """
+    patterns = list(patterns)
+    return [bench for name, bench in _BENCHMARKS.items() if not patterns or any(p in name for p in patterns)]
+
+
+def result_key(name, size):
+    return f"{name}[{size}]"
+
+
+def _time_loops(func, loops):
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start
+
+
+def calibrate(func, min_time):
+    """
+    Find how many calls in a row take at least min_time seconds, like timeit.Timer.autorange.
+    :param func: function that takes no arguments
+    :param min_time: float, seconds
+    :return: int, number of loops
+    """
+    loops = 1
+    while True:
+        seconds = _time_loops(func, loops)
+        if seconds >= min_time:
+            return loops
+        # jump close to the target instead of only doubling, but never by more than 10x at once
+        loops = min(loops * 10, max(loops * 2, math.ceil(loops * min_time / max(seconds, 1e-9))))
+
+
+def summarize(samples):
+    """
+    Statistics of a list of per-call times.
+    :param samples: list of float, seconds
+    :return: dict
+    """
+    return {
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def peak_memory(func):
+    """
+    Peak memory allocated by one call of func, measured with tracemalloc.
+    :param func: function that takes no arguments
+    :return: int, bytes
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        return max(0, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def measure(func, warmup=1, repeat=5, min_time=0.05, memory=True):
+    """
+    Time func: warmup calls first, then `repeat` samples of as many calls as fit in min_time.
+    Garbage collection is turned off while a sample runs, like timeit does.
+    :param func: function that takes no arguments
+    :param warmup: int, calls before timing
+    :param repeat: int, number of samples
+    :param min_time: float, minimum seconds per sample
+    :param memory: bool, also measure peak memory with tracemalloc (in a separate call, it slows code down)
+    :return: dict with the statistics in seconds per call, "loops", "repeat", "samples" and "peak_bytes"
+    """
+    for _ in range(warmup):
+        func()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops = calibrate(func, min_time)
+        samples = [_time_loops(func, loops) / loops for _ in range(repeat)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    result = summarize(samples)
+    result.update(loops=loops, repeat=repeat, samples=samples, peak_bytes=peak_memory(func) if memory else None)
+    return result
+
+
+def metadata():
+    """ Where the results came from, so results from different machines aren't compared by accident. """
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": numpy_version,
+    }
+
+
+def run_benchmarks(benchmarks, sizes=None, report=None, **options):
+    """
+    Run benchmarks at each of their sizes.
+    :param benchmarks: list of Benchmark
+    :param sizes: tuple of int to use instead of each benchmark's own sizes, or None
+    :param report: function called with (key, result) after every measurement, or None
+    :param options: passed on to measure
+    :return: dict with "metadata" and "results" (key -> result dict)
+    """
+    results = {}
+    for bench in benchmarks:
+        for size in sizes or bench.sizes:
+            key = result_key(bench.name, size)
+            result = measure(bench.setup(size), **options)
+            result["size"] = size
+            results[key] = result
+            if report:
+                report(key, result)
+    return {"metadata": metadata(), "results": results}
+
+
+def compare(baseline, current, threshold=0.10, statistic="median"):
+    """
+    Compare two sets of results.
+    :param baseline: dict, results of run_benchmarks (or loaded from its JSON)
+    :param current: dict, same
+    :param threshold: float, relative slowdown that counts as a regression (0.10 = 10% slower)
+    :param statistic: str, which statistic to compare
+    :return: list of (key, baseline seconds, current seconds, ratio, status) where status is
+             "regression", "improved", "same", "new" or "missing"
+    """
+    base, cur = baseline["results"], current["results"]
+    rows = []
+    for key in list(base) + [key for key in cur if key not in base]:
+        if key not in cur:
+            rows.append((key, base[key][statistic], None, None, "missing"))
+        elif key not in base:
+            rows.append((key, None, cur[key][statistic], None, "new"))
+        else:
+            ratio = cur[key][statistic] / base[key][statistic]
+            if ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 / (1 + threshold):
+                status = "improved"
+            else:
+                status = "same"
+            rows.append((key, base[key][statistic], cur[key][statistic], ratio, status))
+    return rows
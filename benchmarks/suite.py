@@ -0,0 +1,130 @@
+# Benchmark suite: every hot path registered in hot_paths.py, with statistics, memory and regression checks
+#
+# Run from the root of the repository:
+#   python -m benchmarks.suite list
+#   python -m benchmarks.suite run --output baseline.json
+#   python -m benchmarks.suite run -k map_filter -k lambda --sizes 10000 --repeat 10
+#   python -m benchmarks.suite run --output current.json --baseline baseline.json
+#   python -m benchmarks.suite compare baseline.json current.json --threshold 0.05
+#
+# run times every benchmark at each of its sizes: a warmup call, then --repeat samples of as many calls as fit in
+# --min-time seconds, and one more call under tracemalloc for the peak memory. The median time per call is what
+# gets compared. compare (or run with --baseline) exits with status 1 when any benchmark got slower than the
+# baseline by more than --threshold, so the suite can guard performance work in CI. Only compare results from the
+# same machine: the metadata of both files is printed to make that easy to check.
+
+import argparse
+import json
+import sys
+
+from benchmarks import hot_paths  # registers the benchmarks
+from benchmarks.common import print_table
+from benchmarks.registry import compare, registered, run_benchmarks
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:,.2f} {unit}"
+    return f"{seconds / 1e-9:,.1f} ns"
+
+
+def format_bytes(size):
+    if size is None:
+        return "-"
+    for unit, scale in (("GB", 2 ** 30), ("MB", 2 ** 20), ("KB", 2 ** 10)):
+        if size >= scale:
+            return f"{size / scale:,.1f} {unit}"
+    return f"{size} B"
+
+
+def print_result(key, result):
+    spread = result["stdev"] / result["mean"] * 100 if result["mean"] else 0
+    print(f"{key:<40} median {format_seconds(result['median']):>10}  min {format_seconds(result['min']):>10}  "
+          f"+-{spread:4.1f}%  peak {format_bytes(result['peak_bytes']):>9}  ({result['repeat']} x {result['loops']} calls)",
+          flush=True)
+
+
+def print_comparison(baseline, current, threshold):
+    """
+    Print the comparison table.
+    :return: int, number of regressions
+    """
+    for label, results in (("baseline", baseline), ("current", current)):
+        meta = results.get("metadata", {})
+        print(f"{label}: {meta.get('date')}  Python {meta.get('python')}  {meta.get('platform')}  {meta.get('cpus')} cpus")
+    print()
+    rows = compare(baseline, current, threshold)
+    print_table(
+        ["benchmark", "baseline", "current", "change", "status"],
+        [[key, format_seconds(old), format_seconds(new), "-" if ratio is None else f"{(ratio - 1) * 100:+.1f}%", status]
+         for key, old, new, ratio, status in rows],
+    )
+    regressions = [row[0] for row in rows if row[4] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+    return len(regressions)
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for the python_concepts hot paths.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="list the registered benchmarks")
+    list_parser.add_argument("-k", dest="patterns", action="append", default=[], help="only names containing this")
+
+    run_parser = commands.add_parser("run", help="run benchmarks and optionally save or compare the results")
+    run_parser.add_argument("-k", dest="patterns", action="append", default=[], help="only names containing this")
+    run_parser.add_argument("--sizes", type=int, nargs="+", help="input sizes instead of each benchmark's own")
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    run_parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory call")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--baseline", help="compare the results with this JSON file")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        print_table(
+            ["benchmark", "sizes", "description"],
+            [[bench.name, ", ".join(f"{size:,}" for size in bench.sizes), bench.description]
+             for bench in registered(args.patterns)],
+        )
+        return 0
+
+    if args.command == "compare":
+        return 1 if print_comparison(load(args.baseline), load(args.current), args.threshold) else 0
+
+    benchmarks = registered(args.patterns)
+    if not benchmarks:
+        print(f"No benchmarks match {args.patterns}.", file=sys.stderr)
+        return 2
+    results = run_benchmarks(
+        benchmarks, sizes=args.sizes, report=print_result,
+        warmup=args.warmup, repeat=args.repeat, min_time=args.min_time, memory=not args.no_memory,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nSaved {len(results['results'])} results to {args.output}")
+    if args.baseline:
+        print()
+        return 1 if print_comparison(load(args.baseline), results, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
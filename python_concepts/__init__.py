@@ -0,0 +1,7 @@
+# Python Concepts
+
+# Reusable versions of the ideas shown in the tutorial files in python_concepts/tutorials.
+# The tutorial files explain a concept with small examples, the modules in this package take
+# the same concept and turn it into something you can import and use on real amounts of data.
+
+# Each module starts with a short explanation of the problem it solves and which tutorial file it builds on.
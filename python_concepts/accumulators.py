@@ -0,0 +1,215 @@
+# Accumulators
+
+# The race condition section of threading_basics.py shows two extremes: every thread updates the
+# global `total` with no protection at all (fast but wrong), or every single `total += num` takes the
+# one global lock (correct but slow, because the threads spend their time fighting over that lock).
+
+# The classes below sit in between. They all count correctly, but they take the lock less often
+# (or never) on the hot path. Every one of them has the same small interface:
+#   add(amount=1) - add amount to the counter. Safe to call from any number of threads.
+#   value         - the current total. Exact once every thread that called add() has finished.
+# so they can be passed straight into the add_first_half/add_second_half pattern in place of the lock:
+
+#   def add_first_half(accumulator):
+#       for num in range(500001):
+#           accumulator.add(num)
+
+# Which one to pick:
+#   LockedCounter      - one lock taken on every update. The baseline from threading_basics.py.
+#   ThreadLocalCounter - every thread adds into its own private cell, no locks at all when adding.
+#                        Reading the value adds the cells up. Best when reads are rare.
+#   StripedCounter     - N counters each with their own lock. Threads are spread across the stripes,
+#                        so with enough stripes two threads rarely want the same lock.
+#   BatchedAccumulator - every thread collects K updates privately and then takes the shared lock
+#                        once to add them all to the total.
+
+# ThreadLocalCounter and BatchedAccumulator keep one cell per thread. When a thread ends, its cell is folded
+# into the shared total and forgotten, so a counter used by millions of short lived threads stays small.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import itertools
+import threading
+import weakref
+
+
+class _ThreadToken:
+    """ Stored in a thread local next to a thread's cell. It is freed when the thread ends. """
+
+    __slots__ = ("__weakref__",)
+
+
+def _on_thread_exit(accumulator, key):
+    """
+    Call accumulator._retire(key) when the current thread ends.
+    :param accumulator: ThreadLocalCounter or BatchedAccumulator, whose _local gets the token
+    :param key: int
+    """
+    token = accumulator._local.token = _ThreadToken()
+    # The finalizer only has a weak reference, so it doesn't keep the accumulator alive as long as the thread.
+    finalizer = weakref.finalize(token, _retire, weakref.ref(accumulator), key)
+    finalizer.atexit = False
+
+
+def _retire(accumulator_ref, key):
+    accumulator = accumulator_ref()
+    if accumulator is not None:
+        accumulator._retire(key)
+
+
+class LockedCounter:
+    """ A counter protected by a single lock that is acquired on every update. """
+
+    def __init__(self, initial=0):
+        self._total = initial
+        self._lock = threading.Lock()
+
+    def add(self, amount=1):
+        with self._lock:
+            self._total += amount
+
+    @property
+    def value(self):
+        with self._lock:
+            return self._total
+
+
+class ThreadLocalCounter:
+    """ A counter where every thread adds into its own cell. The cells are only combined when the value is read. """
+
+    def __init__(self, initial=0):
+        # The initial value plus the cells of the threads that have ended.
+        self._base = initial
+        self._local = threading.local()
+        self._cells = {}  # id of the cell -> cell, for the threads that are still running
+        # Only used when a thread touches the counter for the first time, when it ends and when the value is read.
+        self._register_lock = threading.Lock()
+
+    def _cell(self):
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0]
+            with self._register_lock:
+                self._cells[id(cell)] = cell
+            _on_thread_exit(self, id(cell))
+            return cell
+
+    def _retire(self, key):
+        with self._register_lock:
+            self._base += self._cells.pop(key)[0]
+
+    def add(self, amount=1):
+        # Only the current thread ever writes to its own cell, so no lock is needed here.
+        self._cell()[0] += amount
+
+    @property
+    def value(self):
+        # Summed under the lock, so a thread that ends meanwhile isn't counted both in its cell and in _base.
+        with self._register_lock:
+            return self._base + sum(cell[0] for cell in self._cells.values())
+
+
+class StripedCounter:
+    """ A counter split into `stripes` independently locked cells. Each thread is assigned to one stripe. """
+
+    def __init__(self, stripes=16, initial=0):
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1.")
+        self._initial = initial
+        self._cells = [0] * stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._local = threading.local()
+        # Hands out stripes round robin, so the first `stripes` threads never share a lock.
+        self._next_stripe = itertools.count()
+
+    def _stripe(self):
+        try:
+            return self._local.stripe
+        except AttributeError:
+            stripe = self._local.stripe = next(self._next_stripe) % len(self._cells)
+            return stripe
+
+    def add(self, amount=1):
+        stripe = self._stripe()
+        with self._locks[stripe]:
+            self._cells[stripe] += amount
+
+    @property
+    def value(self):
+        total = self._initial
+        for stripe, lock in enumerate(self._locks):
+            with lock:
+                total += self._cells[stripe]
+        return total
+
+
+class BatchedAccumulator:
+    """ A counter where every thread collects batch_size updates before adding them to the shared total under the lock. """
+
+    def __init__(self, batch_size=1024, initial=0):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self.batch_size = batch_size
+        self._total = initial
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # id of the batch -> pending batch of every running thread, so that reading the value also sees updates
+        # that were not flushed yet. A thread's batch is flushed and removed when the thread ends.
+        self._pending = {}
+
+    def _batch(self):
+        try:
+            return self._local.batch
+        except AttributeError:
+            # [number of pending updates, sum of pending updates]
+            batch = self._local.batch = [0, 0]
+            with self._lock:
+                self._pending[id(batch)] = batch
+            _on_thread_exit(self, id(batch))
+            return batch
+
+    def _retire(self, key):
+        with self._lock:
+            self._total += self._pending.pop(key)[1]
+
+    def add(self, amount=1):
+        batch = self._batch()
+        batch[1] += amount
+        batch[0] += 1
+        if batch[0] >= self.batch_size:
+            self._flush(batch)
+
+    def _flush(self, batch):
+        with self._lock:
+            self._total += batch[1]
+            batch[0] = 0
+            batch[1] = 0
+
+    def flush(self):
+        """ Add the current thread's pending updates to the shared total. """
+        self._flush(self._batch())
+
+    @property
+    def value(self):
+        with self._lock:
+            return self._total + sum(batch[1] for batch in self._pending.values())
+
+
+ACCUMULATORS = {
+    "locked": LockedCounter,
+    "thread-local": ThreadLocalCounter,
+    "striped": StripedCounter,
+    "batched": BatchedAccumulator,
+}
+
+
+def add_range(accumulator, numbers):
+    """
+    Add every number to the accumulator. The generic version of add_first_half/add_second_half.
+    :param accumulator: any of the accumulators above
+    :param numbers: iterable of numbers
+    """
+    add = accumulator.add
+    for num in numbers:
+        add(num)
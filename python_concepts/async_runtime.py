@@ -0,0 +1,95 @@
+# asyncio Versions of the Sleeping Thread Examples
+
+# The count(n) and thread_func() examples in threading_basics.py spend almost all of their time in time.sleep().
+# That is exactly the "waiting for something to happen" situation the preface of that file describes, but every one
+# of those waiting tasks still needs its own OS thread, and every OS thread needs its own stack and kernel bookkeeping.
+
+# asyncio runs all of the tasks on a single thread instead. A coroutine (an `async def` function) runs until it
+# reaches an `await`, and while it waits (await asyncio.sleep(1) instead of time.sleep(1)), the event loop runs
+# whichever other coroutine is ready. A waiting coroutine only costs a small Python object, so tens of thousands of
+# them fit in the memory a few hundred threads would take.
+
+# The same ideas from threading_basics.py map over like this:
+#   threading.Thread(target=count, args=(10,)).start()  ->  task = spawn(count(10))
+#   x.join()                                            ->  await task
+#   threads taking turns (interleaved)                  ->  await run_interleaved([...])
+#   x.join() before starting y (ordered)                ->  await run_ordered([...])
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import asyncio
+
+
+async def thread_func(delay=1.0):
+    """ The thread_func example from threading_basics.py as a coroutine. """
+    print("first")
+    await asyncio.sleep(delay)
+    print("next")
+
+
+async def count(n, delay=1.0, out=None):
+    """
+    The count example from threading_basics.py as a coroutine. Counts from 1 to n, waiting delay seconds after
+    every number. Numbers are appended to out if a list is given, and printed otherwise.
+    :param n: int
+    :param delay: float
+    :param out: list or None
+    :return: str
+    """
+    for i in range(1, n + 1):
+        if out is None:
+            print(i)
+        else:
+            out.append(i)
+        await asyncio.sleep(delay)
+    if out is None:
+        print("Done")
+    return "Done"
+
+
+def spawn(coro):
+    """
+    Start running a coroutine in the background, like calling .start() on a thread.
+    Awaiting the returned task waits for it to finish, like .join(), and gives back its return value.
+    Must be called while the event loop is running (from inside another coroutine).
+    :param coro: coroutine
+    :return: asyncio.Task
+    """
+    return asyncio.get_running_loop().create_task(coro)
+
+
+async def run_interleaved(coros, limit=None):
+    """
+    Run every coroutine at the same time, so they take turns whenever one of them waits.
+    :param coros: iterable of coroutines
+    :param limit: int, the most coroutines allowed to run at once. None means no limit.
+    :return: list of return values, in the same order as coros
+    """
+    if limit is None:
+        return await asyncio.gather(*coros)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(limited(coro) for coro in coros))
+
+
+async def run_ordered(coros):
+    """
+    Run the coroutines one after the other, each one starting when the previous one has finished.
+    :param coros: iterable of coroutines
+    :return: list of return values, in the same order as coros
+    """
+    return [await coro for coro in coros]
+
+
+def run(coro):
+    """
+    Start an event loop, run coro until it finishes and return its result. The entry point from normal code.
+    :param coro: coroutine
+    :return: the return value of coro
+    """
+    return asyncio.run(coro)
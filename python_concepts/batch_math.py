@@ -0,0 +1,240 @@
+# Batch Versions of add(*args) and calculate(**kwargs)
+
+# add(*args) and calculate(start_value, **kwargs) in args_and_kwargs.py work on one set of numbers at a time.
+# Running them over millions of rows means millions of Python function calls, each doing a few operations.
+
+# The batch versions take whole columns of numbers instead and work on every row at once:
+
+#   add_batch([1, 2], [0.25, 0.5], [7, 8])          # row by row: [1 + 0.25 + 7, 2 + 0.5 + 8] = [8.25, 10.5]
+#   calculate_batch([10, 20], multiply=5, divide=[4, 2], add=3, subtract=6)   # [9.5, 47.0]
+
+# Every keyword can be a single number (used for every row) or a sequence with one number per row.
+# Operations run in the same order as calculate: multiply, divide, add, subtract. Unlike calculate, an operation
+# that isn't passed at all is skipped instead of raising KeyError. Just like calculate, an operation whose value
+# is 0 (or None) is skipped for that row, because calculate only applies an operation `if kwargs[...]` is truthy.
+
+# Adding floats rounds after every addition, so adding 0.1 ten times doesn't give exactly 1.0. add_batch adds
+# floats like math.fsum, which gives the correctly rounded sum, and integers exactly. An infinite value or a sum too
+# big for a float gives inf (or nan for inf - inf), the same as adding the numbers one by one.
+
+# When NumPy is installed and the inputs are numeric, the work runs as array operations that give exactly the same
+# results as the Python loops. Integers are checked first: when a result might not fit in NumPy's 64 bit ints, the
+# rows are added as Python ints instead. Floats are added with compensated summation (Neumaier's), which tracks the
+# rounding error of every addition, and the few rows where that can't prove the result is correctly rounded are
+# redone with math.fsum.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import math
+
+from python_concepts.pipeline import INT64_MAX, INT64_MIN, int64_bounds, np
+
+OPERATIONS = ("multiply", "divide", "add", "subtract")
+
+
+def _as_numeric_array(values):
+    """
+    values as a NumPy array the array path gives exact results for, or None if NumPy isn't available or values
+    aren't all numbers of one type. Integers are converted to int64.
+    """
+    if np is None:
+        return None
+    # NumPy turns [1, 2.5] into floats, but the Python loop keeps every value's own type.
+    if isinstance(values, (list, tuple)) and len(set(map(type, values))) > 1:
+        return None
+    array = np.asarray(values)
+    if array.dtype.kind == "f":
+        return array
+    if array.dtype.kind in "iu" and _int_range(array) is not None:
+        return array.astype(np.int64, copy=False)
+    return None
+
+
+def _int_range(array):
+    """ (smallest, largest) value of an integer array, or None if it is a float array or doesn't fit in int64. """
+    if array.dtype.kind not in "iu":
+        return None
+    if not array.size:
+        return (0, 0)
+    low, high = int(array.min()), int(array.max())
+    return (low, high) if INT64_MIN <= low and high <= INT64_MAX else None
+
+
+def _python_values(values):
+    """ NumPy numbers follow NumPy's rules, so the Python loops work on Python numbers. """
+    if np is not None and isinstance(values, (np.ndarray, np.generic)):
+        return values.tolist()
+    return values
+
+
+def _add_row(row):
+    """ add(*row) from args_and_kwargs.py, with fsum for floats. """
+    if all(type(value) in (int, bool) for value in row):
+        return sum(row)
+    try:
+        return math.fsum(row)
+    except (OverflowError, ValueError):
+        # fsum raises when a partial sum overflows or for inf - inf. Adding one by one gives inf or nan there,
+        # like add() does.
+        total = 0
+        for value in row:
+            total += value
+        return total
+
+
+def add_batch(*columns):
+    """
+    Row by row sum of the columns: the result for row i is add(columns[0][i], columns[1][i], ...).
+    :param columns: sequences of numbers, all the same length
+    :return: list of numbers, or a NumPy array if any column was a NumPy array
+    """
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError("Every column must have the same length.")
+    if not columns:
+        return []
+
+    as_array = np is not None and any(isinstance(column, np.ndarray) for column in columns)
+    arrays = [_as_numeric_array(column) for column in columns]
+    if all(array is not None for array in arrays):
+        result = _add_arrays(arrays)
+        if result is not None:
+            return result if as_array else result.tolist()
+
+    result = [_add_row(row) for row in zip(*(_python_values(column) for column in columns))]
+    return np.array(result) if as_array else result
+
+
+def _add_arrays(arrays):
+    """
+    Add NumPy arrays element by element, exactly like _add_row does.
+    :return: numpy.ndarray, or None if the sum of integer arrays might not fit in int64
+    """
+    if all(array.dtype.kind == "i" for array in arrays):
+        try:
+            bounds = _int_range(arrays[0])
+            for array in arrays[1:]:
+                bounds = int64_bounds("add", bounds, _int_range(array))
+        except OverflowError:
+            return None
+        return np.sum(arrays, axis=0)
+
+    with np.errstate(all="ignore"):
+        total = np.zeros(len(arrays[0]), dtype=float)
+        compensation = np.zeros_like(total)
+        # Rows where adding up the rounding errors rounded as well, so total + compensation may be off.
+        inexact = np.zeros(len(total), dtype=bool)
+        for array in arrays:
+            array = array.astype(float, copy=False)
+            new_total = total + array
+            # Whichever of the two numbers is bigger, the low order bits of the smaller one are what got rounded away.
+            error = np.where(np.abs(total) >= np.abs(array), (total - new_total) + array, (array - new_total) + total)
+            new_compensation = compensation + error
+            inexact |= np.where(
+                np.abs(compensation) >= np.abs(error),
+                (compensation - new_compensation) + error,
+                (error - new_compensation) + compensation,
+            ) != 0
+            total, compensation = new_total, new_compensation
+        # Where every error was added up exactly, total + compensation is the exact sum rounded once, like fsum.
+        result = total + compensation
+        redo = np.flatnonzero(inexact | ~np.isfinite(result))
+    for row in redo.tolist():
+        result[row] = _add_row([array[row].item() for array in arrays])
+    return result
+
+
+def calculate_batch(start_values, **operations):
+    """
+    Run calculate(start_value, **operations) for every start value at once.
+    :param start_values: sequence of numbers
+    :param operations: multiply, divide, add and/or subtract, each a number or a sequence with one number per row
+    :return: list of numbers, or a NumPy array if start_values was a NumPy array
+    """
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        raise TypeError(f"Unknown operation(s) {sorted(unknown)}. Must be one of {OPERATIONS}.")
+    for name, value in operations.items():
+        if _is_sequence(value) and len(value) != len(start_values):
+            raise ValueError(f"{name} has {len(value)} values but there are {len(start_values)} start values.")
+
+    as_array = np is not None and isinstance(start_values, np.ndarray)
+    totals = _as_numeric_array(start_values)
+    parameters = {name: _as_numeric_array(_zero_for_none(value)) for name, value in operations.items()}
+    if totals is not None and all(parameter is not None for parameter in parameters.values()):
+        result = _calculate_arrays(totals, parameters)
+        if result is not None:
+            return result if as_array else result.tolist()
+
+    operations = {name: _python_values(value) for name, value in operations.items()}
+    rows = []
+    for i, total in enumerate(_python_values(start_values)):
+        for name in OPERATIONS:
+            if name not in operations:
+                continue
+            value = operations[name][i] if _is_sequence(operations[name]) else operations[name]
+            total = _apply(name, total, value)
+        rows.append(total)
+    return np.array(rows) if as_array else rows
+
+
+def _is_sequence(value):
+    return hasattr(value, "__len__") and not isinstance(value, str)
+
+
+def _zero_for_none(value):
+    if value is None:
+        return 0
+    if _is_sequence(value) and not (np is not None and isinstance(value, np.ndarray)):
+        return [0 if item is None else item for item in value]
+    return value
+
+
+def _apply(name, total, value):
+    # The same truthiness check as calculate: 0 and None mean "skip this operation".
+    if not value:
+        return total
+    if name == "multiply":
+        return total * value
+    if name == "divide":
+        return total / value
+    if name == "add":
+        return total + value
+    return total - value
+
+
+_INT64_OPS = {"multiply": "mul", "divide": "truediv", "add": "add", "subtract": "sub"}
+
+
+def _calculate_arrays(totals, parameters):
+    """
+    calculate() for arrays of totals and parameters, exactly like the Python loop.
+    :return: numpy.ndarray, or None if an integer result might not fit in int64
+    """
+    # Range of the totals while they are ints, None once they are floats.
+    bounds = _int_range(totals)
+    for name in OPERATIONS:
+        if name not in parameters:
+            continue
+        value = parameters[name]
+        if bounds is not None:
+            value_bounds = _int_range(value)
+            try:
+                new_bounds = None if value_bounds is None else int64_bounds(_INT64_OPS[name], bounds, value_bounds)
+            except OverflowError:
+                return None
+            # Rows that skip the operation keep their total.
+            bounds = None if new_bounds is None else (min(bounds[0], new_bounds[0]), max(bounds[1], new_bounds[1]))
+        skip = value == 0
+        # Floats overflow to inf without a warning in Python, so they don't warn here either.
+        with np.errstate(over="ignore", invalid="ignore"):
+            if name == "multiply":
+                totals = np.where(skip, totals, totals * value)
+            elif name == "divide":
+                # Divide by 1 where the row skips the operation, so there is no division by zero warning.
+                totals = np.where(skip, totals, totals / np.where(skip, 1, value))
+            elif name == "add":
+                totals = np.where(skip, totals, totals + value)
+            else:
+                totals = np.where(skip, totals, totals - value)
+    return totals
@@ -0,0 +1,138 @@
+# Cached Derived Values
+
+# Car.__repr__ in dunder_methods.py builds a new f-string every time the car is printed, even though the result
+# only changes when make or model change. When cars are logged over and over, that's a lot of identical strings.
+
+# CachedDerivedMixin lets a class remember values that are computed from its attributes. Methods decorated with
+# @derived are only run the first time they are called, after that the remembered value is returned, until one
+# of the attributes listed in `tracked_attributes` is set again:
+
+#   class Car(CachedDerivedMixin):
+#       tracked_attributes = ("make", "model")
+#
+#       @derived
+#       def __repr__(self):
+#           return f"Car('{self.make}', '{self.model}')"
+
+# Only assigning a tracked attribute (car.make = "Ford") clears the remembered values. Changing an attribute's value
+# in place (appending to a list attribute, for example) can't be noticed, so derived values should only depend on
+# attributes that are replaced, not modified.
+
+# Car.__mul__ in dunder_methods.py also changes make and model in place (my_car * 2 turns "Jeep" into "JeepJeep"),
+# so multiplying the same car again and again makes the strings twice as long every time. The Car below keeps that
+# behavior by default, but a class (or instance) with mutating_mul = False returns a new Car instead, whose make
+# and model are RepeatedStrings (see python_concepts/lazy_strings.py) that don't build the repeated text until needed.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import functools
+
+from python_concepts.lazy_strings import RepeatedString
+
+
+def derived(method):
+    """
+    Mark a method that takes no arguments as derived: CachedDerivedMixin remembers its result until a tracked
+    attribute is set.
+    :param method: function(self)
+    :return: the same function
+    """
+    method.__derived__ = True
+    return method
+
+
+def make_cached_method(method, attribute):
+    """
+    Write a method that returns self.<attribute> if it is set, and otherwise calls method and stores the result there.
+    The attribute name is written into the code, which makes a cache hit a single attribute lookup.
+    :param method: function(self)
+    :param attribute: str, instance attribute that holds the remembered value
+    :return: function(self)
+    """
+    source = (
+        f"def {method.__name__}(self):\n"
+        f"    try:\n"
+        f"        return self.{attribute}\n"
+        f"    except AttributeError:\n"
+        f"        value = self.{attribute} = method(self)\n"
+        f"        return value"
+    )
+    namespace = {"method": method}
+    exec(source, namespace)
+    return functools.wraps(method)(namespace[method.__name__])
+
+
+class CachedDerivedMixin:
+    """ Remembers the results of @derived methods, and forgets them whenever an attribute in tracked_attributes is set. """
+
+    tracked_attributes = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.tracked_attributes = frozenset(cls.tracked_attributes)
+        attributes = set()
+        for klass in cls.__mro__:
+            attributes.update(klass.__dict__.get("_derived_attributes", ()))
+        for name, value in list(cls.__dict__.items()):
+            if getattr(value, "__derived__", False):
+                attribute = "_derived_" + name.strip("_")
+                setattr(cls, name, make_cached_method(value, attribute))
+                attributes.add(attribute)
+        # Every instance attribute a remembered value can be stored in, including the ones from base classes.
+        cls._derived_attributes = tuple(sorted(attributes))
+
+    def _forget_derived(self):
+        instance_dict = self.__dict__
+        for attribute in self._derived_attributes:
+            instance_dict.pop(attribute, None)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.tracked_attributes:
+            self._forget_derived()
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        if name in self.tracked_attributes:
+            self._forget_derived()
+
+
+class Car(CachedDerivedMixin):
+    """ The Car from dunder_methods.py with a cached __repr__ and __hash__, and an optional non-mutating __mul__. """
+
+    tracked_attributes = ("make", "model")
+    # Set to False (on the class or one instance) to make car * n return a new Car instead of changing this one.
+    mutating_mul = True
+
+    def __init__(self, make, model):
+        self.make = make
+        self.model = model
+
+    @derived
+    def __repr__(self):
+        return f"Car('{self.make}', '{self.model}')"
+
+    def __eq__(self, other):
+        if not isinstance(other, Car):
+            return NotImplemented
+        return self.make == other.make and self.model == other.model
+
+    @derived
+    def __hash__(self):
+        return hash((str(self.make), str(self.model)))
+
+    def __mul__(self, x):
+        if type(x) is not int:
+            raise TypeError("Invalid argument. Must multiply Car by an int.")
+
+        if self.mutating_mul:
+            self.make = self.make * x
+            self.model = self.model * x
+            return None
+
+        car = type(self)(RepeatedString(self.make, x), RepeatedString(self.model, x))
+        car.mutating_mul = False
+        return car
+
+    def __call__(self):
+        print(f"You have called a {self.make} {self.model}")
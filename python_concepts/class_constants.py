@@ -0,0 +1,130 @@
+# Cached Class Constants
+
+# Person.get_species in static_and_class_methods.py is a classmethod that returns cls.species. Every call binds the
+# classmethod to the class, calls the Python function, and looks species up through the class hierarchy, even though
+# the answer only changes if someone assigns a new species to the class or one of its parents.
+
+# A classmethod decorated with @class_constant is only run once per class. Its result is then stored directly in that
+# class as a ready made function that returns it, so the next Person.get_species() (or person.get_species()) is a
+# single C level call with no Python code run at all:
+
+#   class Person(metaclass=ClassConstantMeta):
+#       species = "Homo Sapien"
+#
+#       @class_constant
+#       def get_species(cls):
+#           return cls.species
+
+# Every subclass gets its own cached result, computed with the subclass as cls, just like a classmethod. The
+# ClassConstantMeta metaclass forgets every cached result whenever an attribute is assigned to (or deleted from) a
+# class that uses it, or a new class using it is created, so
+
+#   Person.species = "Homo sapiens"
+#   Student.get_species()   # "Homo sapiens"
+
+# gives the new answer. Only assignments to classes that use ClassConstantMeta are noticed, so the attributes a
+# class_constant reads should be defined in those classes, not in a plain base class.
+
+# Classmethods that take arguments, like the create_person_from_birth_year factory, stay normal classmethods.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import itertools
+import weakref
+
+from python_concepts import people
+
+# Name of the class attribute that records what was stored in a class, so it can be undone.
+_STORED = "_stored_constants"
+
+
+class class_constant:
+    """ Decorator for a classmethod that takes no arguments and only depends on class attributes. """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        cls = type(obj) if owner is None else owner
+        value = self.func(cls)
+        # repeat(value).__next__ is a builtin function that returns value every time it's called. It isn't a
+        # descriptor, so stored in the class it is returned as is: no binding, and no Python code when called.
+        getter = itertools.repeat(value).__next__
+        if isinstance(cls, ClassConstantMeta):
+            cls._store_constant(self, getter)
+        return getter
+
+
+class ClassConstantMeta(type):
+    """ Metaclass that stores class_constant results per class and forgets them when a class attribute changes. """
+
+    # Every class using this metaclass. Class attributes are rarely assigned, so on every assignment all stored
+    # results are simply forgotten, instead of working out which ones could depend on the attribute.
+    _classes = weakref.WeakSet()
+
+    def __init__(cls, name, bases, namespace, **kwargs):
+        # A new subclass would otherwise inherit the result stored in its parent, computed for the parent.
+        ClassConstantMeta.forget_constants()
+        super().__init__(name, bases, namespace, **kwargs)
+        # name -> what was in this class's own __dict__ before something was stored there (None if nothing)
+        type.__setattr__(cls, _STORED, {})
+        ClassConstantMeta._classes.add(cls)
+
+    def _store_constant(cls, descriptor, getter):
+        name = descriptor.name
+        cls._store(name, getter)
+        # The subclasses must not inherit the stored result, so they get their own copy of the descriptor,
+        # which computes and stores their own result the first time they are asked.
+        subclasses = cls.__subclasses__()
+        while subclasses:
+            subclass = subclasses.pop()
+            if isinstance(subclass, ClassConstantMeta) and name not in subclass.__dict__:
+                subclass._store(name, descriptor)
+            subclasses.extend(subclass.__subclasses__())
+
+    def _store(cls, name, value):
+        stored = cls.__dict__[_STORED]
+        if name not in stored:
+            stored[name] = cls.__dict__.get(name)
+        type.__setattr__(cls, name, value)
+
+    @staticmethod
+    def forget_constants():
+        """ Undo everything stored by class_constant in every class. """
+        for klass in list(ClassConstantMeta._classes):
+            stored = klass.__dict__[_STORED]
+            for name, original in stored.items():
+                if original is None:
+                    type.__delattr__(klass, name)
+                else:
+                    type.__setattr__(klass, name, original)
+            stored.clear()
+
+    def __setattr__(cls, name, value):
+        # Forget first, so putting a descriptor back can't overwrite the value being assigned.
+        ClassConstantMeta.forget_constants()
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        ClassConstantMeta.forget_constants()
+        super().__delattr__(name)
+
+
+class Person(people.Person, metaclass=ClassConstantMeta):
+    """ Person from people.py whose get_species is cached per class. """
+
+    # Defined here (again) so that assigning a new species is noticed, see the top of this file.
+    species = "Homo Sapien"
+
+    @class_constant
+    def get_species(cls):
+        """
+        Get the value of the class variable "species".
+        :return: str
+        """
+        return cls.species
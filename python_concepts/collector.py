@@ -0,0 +1,124 @@
+# Ordered Result Collection
+
+# In threading_basics.py two count() threads append into the same module level `nums` list, and the order
+# the numbers end up in depends on how the threads happened to take turns (or on where .join() was placed).
+# With a lot of producers that shared list is also a point every thread has to go through.
+
+# OrderedCollector gives every producer its own buffer instead. Appending only touches the producer's own
+# buffer, so producers never wait for each other. Every item is tagged with a sequence number when it is
+# appended, so the collector can still tell the order the items arrived in. Once the producers are done
+# you decide which order you want:
+#   arrival_order()  - the order the items were appended in, across all producers.
+#   producer_order() - all of the first producer's items, then all of the second producer's, and so on.
+#                      Always the same no matter how the threads were scheduled.
+#   sorted(key)      - every item sorted, also always the same.
+#   by_producer()    - a dictionary of producer name to that producer's items.
+
+#   collector = OrderedCollector()
+#   def count(n):
+#       for i in range(1, n+1):
+#           collector.append(i)   # instead of nums.append(i)
+
+# The sequence numbers come from itertools.count. Calling next() on it is a single C call, so in CPython
+# two threads can never get the same number, and no lock is needed.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import heapq
+import itertools
+import threading
+
+
+class ProducerBuffer:
+    """ The private buffer of one producer. Only the producer that owns it should append to it. """
+
+    __slots__ = ("name", "_seqs", "_items", "_next_seq", "_append_seq", "_append_item")
+
+    def __init__(self, name, sequence):
+        self.name = name
+        # Two flat lists instead of one list of (seq, item) tuples, so no tuple is created per item.
+        self._seqs = []
+        self._items = []
+        # Bound methods looked up once here instead of on every append.
+        self._next_seq = sequence.__next__
+        self._append_seq = self._seqs.append
+        self._append_item = self._items.append
+
+    def append(self, item):
+        self._append_seq(self._next_seq())
+        self._append_item(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return len(self._items)
+
+    def items(self):
+        return list(self._items)
+
+
+class OrderedCollector:
+    """ Collects items from many producers without a shared lock and returns them in the order you ask for. """
+
+    def __init__(self):
+        self._sequence = itertools.count()
+        self._buffers = []
+        self._local = threading.local()
+        # Only taken when a new producer registers, never when appending.
+        self._register_lock = threading.Lock()
+
+    def producer(self, name=None):
+        """
+        Create a new producer buffer. Producers are kept in the order they were created.
+        :param name: any hashable name, defaults to the position of the producer
+        :return: ProducerBuffer
+        """
+        with self._register_lock:
+            buffer = ProducerBuffer(len(self._buffers) if name is None else name, self._sequence)
+            self._buffers.append(buffer)
+        return buffer
+
+    def append(self, item):
+        """ Append item to the calling thread's buffer, creating it (named after the thread) on first use. """
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = self.producer(threading.current_thread().name)
+        buffer.append(item)
+
+    def __len__(self):
+        return sum(len(buffer) for buffer in self._buffers)
+
+    def arrival_order(self):
+        """
+        Every item in the order it was appended in.
+        Each buffer is already in sequence order, so this is a k-way merge rather than a full sort.
+        Sequence numbers are unique, so the (seq, item) pairs are ordered by seq alone and the items are never compared.
+        :return: list
+        """
+        streams = [zip(buffer._seqs, buffer._items) for buffer in self._buffers]
+        return [item for _, item in heapq.merge(*streams)]
+
+    def producer_order(self):
+        """
+        Every item grouped by producer, producers in the order they were created.
+        :return: list
+        """
+        return [item for buffer in self._buffers for item in buffer._items]
+
+    def by_producer(self):
+        """
+        :return: dict of producer name to list of that producer's items
+        """
+        return {buffer.name: buffer.items() for buffer in self._buffers}
+
+    def sorted(self, key=None, reverse=False):
+        """
+        Every item in sorted order.
+        :param key: function, same as for the builtin sorted
+        :param reverse: bool
+        :return: list
+        """
+        return sorted(self.producer_order(), key=key, reverse=reverse)
@@ -0,0 +1,253 @@
+# Compiled Expression Cache
+
+# lambda_functions.py builds small lambdas right where they are used: (lambda x: x+5)(7), map(lambda num: num * 2, nums).
+# When those expressions come from configuration or user input (as strings), building them means parsing and
+# compiling Python code, and doing that again on every request is a lot of wasted work for the same few expressions.
+
+# ExpressionCache compiles each expression once and hands back the same compiled function every time after that:
+
+#   cache = ExpressionCache(maxsize=256)
+#   add_five = cache.get("lambda x: x + 5")
+#   add_five(7)  # 12
+
+# Expressions are cached by their structure, not their exact text, so "lambda x: x+5" and "lambda x:  x + 5"
+# share one cache entry. Parameter names are part of the structure: "lambda num: num + 5" can be called as
+# f(num=3), so it gets its own entry. When the cache is full, the least recently used expression
+# is dropped (LRU). stats() reports the hit rate and how much time was spent compiling.
+
+# Single parameter arithmetic expressions are also turned into a pipeline expression (see python_concepts/pipeline.py),
+# so apply_batch() can run them on a whole list of numbers at once with NumPy when it is installed. `and` and `or`
+# give back one of their operands (x or 5 is 5 for x = 0), which NumPy has no operator for, so lambdas that use them
+# always run as Python. Either way apply_batch() gives the same results as calling the lambda on every value.
+
+# Expressions are evaluated with only a handful of builtins available, but this is not a sandbox:
+# only compile expressions from sources you trust.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import ast
+import collections
+import threading
+import time
+
+from python_concepts.pipeline import Expr, Pipeline, X
+
+SAFE_BUILTINS = {
+    "abs": abs, "bool": bool, "float": float, "int": int, "len": len,
+    "max": max, "min": min, "round": round, "str": str, "sum": sum,
+}
+
+_BINARY_NODES = {
+    ast.Add: "add", ast.Sub: "sub", ast.Mult: "mul", ast.Div: "truediv",
+    ast.FloorDiv: "floordiv", ast.Mod: "mod", ast.Pow: "pow", ast.BitAnd: "bitand", ast.BitOr: "bitor",
+}
+
+_COMPARE_NODES = {
+    ast.Eq: "eq", ast.NotEq: "ne", ast.Lt: "lt", ast.LtE: "le", ast.Gt: "gt", ast.GtE: "ge",
+}
+
+
+def parse_lambda(source):
+    """
+    Parse a lambda into an ast.Lambda node.
+    Accepts "lambda x: x + 5", a bare expression in terms of x like "x + 5", or an already parsed ast node.
+    :param source: str or ast.AST
+    :return: ast.Lambda
+    """
+    if isinstance(source, str):
+        source = ast.parse(source.strip(), mode="eval")
+    node = source.body if isinstance(source, ast.Expression) else source
+    if isinstance(node, ast.Lambda):
+        return node
+    if not isinstance(node, ast.expr):
+        raise ValueError("Expected a lambda or a single expression.")
+    arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg="x")], kwonlyargs=[], kw_defaults=[], defaults=[])
+    return ast.fix_missing_locations(ast.Lambda(args=arguments, body=node))
+
+
+def _parameter_names(node):
+    args = node.args
+    return [arg.arg for arg in args.posonlyargs + args.args + args.kwonlyargs] + \
+        [arg.arg for arg in (args.vararg, args.kwarg) if arg is not None]
+
+
+def structural_key(node):
+    """
+    A string that is the same for two lambdas that only differ in formatting (spaces, parentheses, comments).
+    The parameter names stay in, because they can be passed by keyword.
+    :param node: ast.Lambda
+    :return: str
+    """
+    return ast.dump(node)
+
+
+def to_pipeline_expr(node):
+    """
+    Turn a one parameter lambda into an Expr built from X, or return None if it uses anything Expr can't express.
+    :param node: ast.Lambda
+    :return: Expr or None
+    """
+    names = _parameter_names(node)
+    if len(names) != 1 or node.args.defaults:
+        return None
+    return _convert(node.body, names[0])
+
+
+def _convert(node, name):
+    if isinstance(node, ast.Name):
+        return X if node.id == name else None
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float, bool):
+        return Expr("const", node.value)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_NODES:
+        left, right = _convert(node.left, name), _convert(node.right, name)
+        if left is None or right is None:
+            return None
+        return Expr(_BINARY_NODES[type(node.op)], left, right)
+    if isinstance(node, ast.UnaryOp):
+        operand = _convert(node.operand, name)
+        if operand is None:
+            return None
+        if isinstance(node.op, ast.USub):
+            return Expr("neg", operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if isinstance(node.op, ast.Not):
+            return Expr("not", operand)
+        return None
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in _COMPARE_NODES:
+        left, right = _convert(node.left, name), _convert(node.comparators[0], name)
+        if left is None or right is None:
+            return None
+        return Expr(_COMPARE_NODES[type(node.ops[0])], left, right)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "abs" \
+            and len(node.args) == 1 and not node.keywords:
+        operand = _convert(node.args[0], name)
+        return None if operand is None else Expr("abs", operand)
+    return None
+
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+class CompiledExpression:
+    """ A compiled lambda. Call it like the lambda itself, or use apply_batch() to run it on many values. """
+
+    def __init__(self, node, key):
+        self.key = key
+        self.source = ast.unparse(node)
+        self.function = eval(compile(ast.Expression(body=node), "<expression>", "eval"), {"__builtins__": SAFE_BUILTINS})
+        self.expr = to_pipeline_expr(node)
+        # A one stage pipeline for apply_batch, which uses NumPy when it can.
+        self._pipeline = Pipeline().map(self.expr) if self.expr is not None else None
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+    @property
+    def vectorizable(self):
+        return self._pipeline is not None
+
+    def apply_batch(self, values):
+        """
+        Apply the expression to every value, like list(map(expression, values)).
+        A NumPy array gives back a NumPy array.
+        :param values: list, tuple, range or numpy.ndarray
+        :return: list or numpy.ndarray
+        """
+        if self._pipeline is not None:
+            return self._pipeline.run(values)
+        return list(map(self.function, values))
+
+
+class ExpressionCache:
+    """ A thread safe, least recently used cache of compiled expressions. """
+
+    def __init__(self, maxsize=256):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        # structural key -> CompiledExpression, oldest used first
+        self._compiled = collections.OrderedDict()
+        # exact source text -> structural key, so looking up the same string twice doesn't parse it again
+        self._keys_by_source = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_seconds = 0.0
+
+    def get(self, source):
+        """
+        The compiled version of source, compiling it only if an equivalent expression isn't cached yet.
+        :param source: str or ast node, see parse_lambda
+        :return: CompiledExpression
+        """
+        with self._lock:
+            key = self._keys_by_source.get(source) if isinstance(source, str) else None
+            if key is not None and key in self._compiled:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+                return self._compiled[key]
+
+        start = time.perf_counter()
+        node = parse_lambda(source)
+        key = structural_key(node)
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                # Compile while holding the lock, so two threads never compile the same expression twice.
+                compiled = self._compiled[key] = CompiledExpression(node, key)
+                self.misses += 1
+                if len(self._compiled) > self.maxsize:
+                    old_key, _ = self._compiled.popitem(last=False)
+                    self._keys_by_source = {text: k for text, k in self._keys_by_source.items() if k != old_key}
+                    self.evictions += 1
+                self.compile_seconds += time.perf_counter() - start
+            else:
+                self.hits += 1
+            self._compiled.move_to_end(key)
+            if isinstance(source, str):
+                # Many different spellings of one expression would otherwise grow this without limit.
+                if len(self._keys_by_source) >= 4 * self.maxsize:
+                    self._keys_by_source.clear()
+                self._keys_by_source[source] = key
+        return compiled
+
+    __call__ = get
+
+    def __len__(self):
+        return len(self._compiled)
+
+    def clear(self):
+        with self._lock:
+            self._compiled.clear()
+            self._keys_by_source.clear()
+
+    def stats(self):
+        """
+        :return: dict with hits, misses, evictions, hit_rate, size and compile_seconds
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._compiled),
+            "compile_seconds": self.compile_seconds,
+        }
+
+
+# A shared cache for code that doesn't need its own.
+default_cache = ExpressionCache()
+
+
+def expression(source):
+    """
+    Compile source with the shared default cache.
+    :param source: str or ast node, see parse_lambda
+    :return: CompiledExpression
+    """
+    return default_cache.get(source)
@@ -0,0 +1,208 @@
+# Lazy String Repetition
+
+# "Jeep" * 3 builds the whole string "JeepJeepJeep" right away. That is what we want most of the time, but when a
+# string is repeated a huge number of times (Car.__mul__ in dunder_methods.py, repeat_words in optional_parameters.py)
+# the repeated string can take up gigabytes of memory, even though all we do with it is look at a piece of it or
+# write it out somewhere.
+
+# RepeatedString only remembers the original text and how many times it is repeated, so it takes up the same few
+# bytes whether it is repeated 5 times or a billion times. It still behaves like a string for the common operations:
+
+#   words = RepeatedString("Python", 1_000_000_000)
+#   len(words)             # 6000000000
+#   words[7]               # "y"
+#   words[-3:]             # "hon" as a RepeatedString, slicing doesn't copy either
+#   words == "Python" * 2  # False, compared piece by piece
+#   "onPy" in words        # True, only searches len("onPy") + len("Python") characters
+#   for letter in words:   # one letter at a time
+#   words.write_to(file)   # written in pieces of chunk_size characters
+#   str(words)             # builds the full 6 GB string, only do this when it's small enough
+
+# Slices with a step other than 1 (words[::2]) are built as a normal str. hash() also has to build the full string,
+# because a RepeatedString must have the same hash as the str it is equal to.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import io
+import math
+
+# Characters per piece when iterating, comparing or writing.
+CHUNK_SIZE = 1 << 16
+
+
+class RepeatedString:
+    """
+    A string repeated `times` times, stored without building the repeated string.
+    Internally it is the piece [start, start + length) of text repeated forever, which is what makes slicing free.
+    """
+
+    __slots__ = ("text", "start", "length")
+
+    def __init__(self, text, times):
+        if type(times) is not int:
+            raise TypeError("times must be an int.")
+        if isinstance(text, RepeatedString):
+            # Repeating a repeated string just multiplies the counts, when it is a whole number of repetitions.
+            period = text._period_text()
+            if period and text.length % len(period) == 0:
+                text, times = period, text.length // len(period) * times
+            else:
+                text = str(text)
+        if not isinstance(text, str):
+            raise TypeError("text must be a str.")
+        self.text = text
+        self.start = 0
+        self.length = len(text) * max(times, 0)
+
+    @classmethod
+    def _window(cls, text, start, length):
+        window = object.__new__(cls)
+        window.text = text
+        window.start = start % len(text) if text else 0
+        window.length = length if text else 0
+        return window
+
+    @property
+    def times(self):
+        """ How many times text is repeated, or None if this is a slice that doesn't line up with text. """
+        if not self.text:
+            return 0
+        if self.start == 0 and self.length % len(self.text) == 0:
+            return self.length // len(self.text)
+        return None
+
+    def _period_text(self):
+        """ The text this string is a repetition of, rotated to start at the right character. """
+        if self.start == 0:
+            return self.text
+        return self.text[self.start:] + self.text[:self.start]
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        text = self._period_text()
+        full, extra = divmod(self.length, len(text)) if text else (0, 0)
+        return text * full + text[:extra]
+
+    def __repr__(self):
+        if self.times is not None:
+            return f"RepeatedString({self.text!r}, {self.times})"
+        return f"RepeatedString({self.text!r}, {-(-(self.start + self.length) // len(self.text))})" \
+               f"[{self.start}:{self.start + self.length}]"
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step == 1:
+                return self._window(self.text, self.start + start, max(stop - start, 0))
+            return "".join(self[i] for i in range(start, stop, step))
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("RepeatedString index out of range")
+        return self.text[(self.start + index) % len(self.text)]
+
+    def __contains__(self, sub):
+        if isinstance(sub, RepeatedString):
+            sub = str(sub)
+        if not isinstance(sub, str):
+            raise TypeError(f"'in <RepeatedString>' requires string as left operand, not {type(sub).__name__}")
+        # The characters at position i only depend on i % len(text), so any match also shows up
+        # starting in the first len(text) positions, within the first len(sub) + len(text) - 1 characters.
+        return sub in str(self[:len(sub) + len(self.text) - 1]) if len(sub) <= self.length else False
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        The string in consecutive pieces of about chunk_size characters (never less than len(text)), the last one shorter.
+        :param chunk_size: int
+        :return: iterator of str
+        """
+        if not self.length:
+            return
+        text = self._period_text()
+        # A whole number of repetitions, so every full block starts at the same character.
+        block = text * max(1, chunk_size // len(text))
+        full, extra = divmod(self.length, len(block))
+        for _ in range(full):
+            yield block
+        if extra:
+            yield block[:extra]
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def write_to(self, file, chunk_size=CHUNK_SIZE, encoding=None):
+        """
+        Write the string to a file or buffer piece by piece, without building the whole string.
+        Binary files (and anything else when encoding is given) get encoded bytes, everything else gets str.
+        :param file: object with a write method
+        :param chunk_size: int, characters per write
+        :param encoding: str, defaults to "utf-8" for binary files
+        :return: int, number of characters written
+        """
+        if encoding is None and isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+            encoding = "utf-8"
+        write = file.write
+        last_chunk = last_encoded = None
+        for chunk in self.chunks(chunk_size):
+            if encoding is not None:
+                # Every full block is the same string, so it only needs to be encoded once.
+                if chunk is not last_chunk:
+                    last_chunk, last_encoded = chunk, chunk.encode(encoding)
+                write(last_encoded)
+            else:
+                write(chunk)
+        return self.length
+
+    def __mul__(self, times):
+        if type(times) is not int:
+            return NotImplemented
+        if self.times is not None:
+            return RepeatedString(self.text, self.times * times)
+        text = self._period_text()
+        if self.length % len(text) == 0:
+            return self._window(text, 0, self.length * max(times, 0))
+        # A slice that ends partway through text, repeating it means repeating the slice itself.
+        return RepeatedString(str(self), times)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        if not isinstance(other, (str, RepeatedString)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if isinstance(other, RepeatedString):
+            if (self.text, self.start) == (other.text, other.start):
+                return True
+            # Both strings repeat with periods p and q, so both repeat every lcm(p, q) characters:
+            # if that much of them matches, all of it does.
+            period = math.lcm(len(self.text) or 1, len(other.text) or 1)
+            if period <= CHUNK_SIZE:
+                return str(self[:period]) == str(other[:period])
+        position = 0
+        for chunk in self.chunks():
+            if str(other[position:position + len(chunk)]) != chunk:
+                return False
+            position += len(chunk)
+        return True
+
+    def __hash__(self):
+        # Must match the hash of the equal str.
+        return hash(str(self))
+
+
+def repeat_words(word, frequency=1):
+    """
+    repeat_words from optional_parameters.py, returning a RepeatedString instead of building word * frequency.
+    :param word: str
+    :param frequency: int
+    :return: RepeatedString
+    """
+    return RepeatedString(word, frequency)
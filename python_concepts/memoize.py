@@ -0,0 +1,351 @@
+# Memoization for *args/**kwargs Functions
+
+# Functions like add, calculate and func in args_and_kwargs.py are pure: called with the same arguments, they always
+# give back the same answer. When they get called with the same arguments over and over, it's faster to remember
+# (memoize) the answer the first time and hand it back afterwards.
+
+# functools.lru_cache does that, but it has a few limits that get in the way for functions that take *args/**kwargs:
+#   - calculate(10, add=3, multiply=5) and calculate(10, multiply=5, add=3) are cached separately.
+#   - Every argument has to be hashable, so calling a cached function with a list or a dict raises TypeError.
+#   - The cache is limited by the number of entries, not by how much memory the cached results take up.
+
+# memoize() fixes all three:
+
+#   @memoize(maxsize=1000, max_bytes=50_000_000, policy="lfu", ttl=60)
+#   def calculate(start_value=0, **kwargs):
+#       ...
+
+# Arguments are matched up with the function's parameters before building the cache key, so keyword order
+# (and passing an argument by position vs by name) doesn't matter. Unhashable arguments are handled according to
+# `unhashable`:
+#   "freeze" - lists, dicts and sets are turned into hashable tuples and frozensets (the default).
+#   "pickle" - the argument is pickled and the bytes are used in the key.
+#   "error"  - raise TypeError, like lru_cache does.
+#   or any function that takes the argument and returns something hashable.
+
+# When the cache is full (maxsize entries or max_bytes of results), an entry is evicted:
+#   "lru" - the least recently used entry.
+#   "lfu" - the least frequently used entry (the oldest one if several are tied).
+# With ttl set, entries also expire ttl seconds after they were stored.
+
+# The cache is safe to use from many threads. cache_info() reports hits, misses, evictions and expirations.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import collections
+import functools
+import inspect
+import pickle
+import sys
+import threading
+import time
+
+POLICIES = ("lru", "lfu")
+
+
+class _Tag:
+    """ A marker inside cache keys. Only this module has the instances, so no argument can ever be equal to one. """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"<{self.name}>"
+
+
+_DICT, _LIST, _TUPLE, _SET, _PICKLED = (_Tag(name) for name in ("dict", "list", "tuple", "set", "pickled"))
+# Separates the positional from the keyword arguments in a raw cache key.
+_KWARGS = _Tag("kwargs")
+
+
+def freeze(value):
+    """
+    A hashable stand in for value. Lists, tuples, dicts and sets are converted recursively, and tagged with their
+    type so that [1, 2] and (1, 2) don't end up with the same key. The tags are private objects, so a frozen
+    value never equals an argument that was hashable to begin with.
+    :param value: anything
+    :return: hashable value
+    """
+    if isinstance(value, dict):
+        return (_DICT, frozenset((freeze(key), freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (_LIST, tuple(freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return (_TUPLE, tuple(freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (_SET, frozenset(freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (_PICKLED, pickle.dumps(value))
+    return value
+
+
+def deep_sizeof(value, _depth=0):
+    """
+    Rough size of value in bytes, including the items of lists, tuples, sets and dicts (a few levels deep).
+    :param value: anything
+    :return: int
+    """
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(key, _depth + 1) + deep_sizeof(item, _depth + 1) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, _depth + 1) for item in value)
+    return size
+
+
+class _LRUOrder:
+    """ Keeps keys in least recently used first order. """
+
+    def __init__(self):
+        self._keys = collections.OrderedDict()
+
+    def add(self, key):
+        self._keys[key] = None
+
+    def touch(self, key):
+        self._keys.move_to_end(key)
+
+    def remove(self, key):
+        del self._keys[key]
+
+    def victim(self):
+        return next(iter(self._keys))
+
+
+class _LFUOrder:
+    """ Keeps keys grouped by how often they were used, so the least frequently used key is found without a scan. """
+
+    def __init__(self):
+        self._counts = {}
+        # use count -> keys with that count, oldest first
+        self._buckets = collections.defaultdict(collections.OrderedDict)
+        self._min_count = 0
+
+    def add(self, key):
+        self._counts[key] = 1
+        self._buckets[1][key] = None
+        self._min_count = 1
+
+    def touch(self, key):
+        count = self._counts[key]
+        self._counts[key] = count + 1
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._buckets[count + 1][key] = None
+
+    def remove(self, key):
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = min(self._buckets, default=0)
+
+    def victim(self):
+        return next(iter(self._buckets[self._min_count]))
+
+
+class MemoizedFunction:
+    """ A function wrapped with a cache. Created by the memoize decorator. """
+
+    def __init__(self, func, maxsize, max_bytes, policy, ttl, unhashable, sizeof):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}. Must be one of {POLICIES}.")
+        self.func = func
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.ttl = ttl
+        self._unhashable = _unhashable_handler(unhashable)
+        self._sizeof = sizeof
+        try:
+            self._signature = inspect.signature(func)
+        except (TypeError, ValueError):
+            self._signature = None
+
+        # Binding arguments to the signature is slow, so remember which canonical key every hashable
+        # (args, kwargs) combination maps to. frozenset makes the keyword order irrelevant here already.
+        self._canonical_keys = {}
+        # key -> (result, size in bytes, time it expires or None)
+        self._entries = {}
+        self._order = _LRUOrder() if policy == "lru" else _LFUOrder()
+        # With a ttl every entry lives equally long, so insertion order is also expiry order.
+        self._expiry_order = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        functools.update_wrapper(self, func)
+
+    def make_key(self, args, kwargs):
+        """
+        The cache key for a call. Calls that bind the same values to the same parameters get the same key.
+        :return: hashable tuple
+        """
+        if self._signature is not None:
+            try:
+                bound = self._signature.bind(*args, **kwargs)
+            except TypeError:
+                # Let the real call raise the error for a bad set of arguments.
+                bound = None
+            if bound is not None:
+                bound.apply_defaults()
+                parts = []
+                for name, value in bound.arguments.items():
+                    kind = self._signature.parameters[name].kind
+                    if kind is inspect.Parameter.VAR_KEYWORD:
+                        value = tuple(sorted((key, self._hashable(item)) for key, item in value.items()))
+                    elif kind is inspect.Parameter.VAR_POSITIONAL:
+                        value = tuple(self._hashable(item) for item in value)
+                    else:
+                        value = self._hashable(value)
+                    parts.append((name, value))
+                return tuple(parts)
+        return (
+            tuple(self._hashable(arg) for arg in args),
+            tuple(sorted((key, self._hashable(value)) for key, value in kwargs.items())),
+        )
+
+    def _hashable(self, value):
+        try:
+            hash(value)
+        except TypeError:
+            return self._unhashable(value)
+        return value
+
+    def _key(self, args, kwargs):
+        # Without the separator, func((1, 2), frozenset({("a", 1)})) would have the same key as func(1, 2, a=1).
+        raw_key = args + (_KWARGS, frozenset(kwargs.items())) if kwargs else args
+        try:
+            key = self._canonical_keys.get(raw_key)
+        except TypeError:
+            # An unhashable argument, go the slow way.
+            return self.make_key(args, kwargs)
+        if key is None:
+            key = self.make_key(args, kwargs)
+            if len(self._canonical_keys) >= 4 * (self.maxsize or 1024):
+                self._canonical_keys.clear()
+            self._canonical_keys[raw_key] = key
+        return key
+
+    def __call__(self, *args, **kwargs):
+        key = self._key(args, kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[2] is not None and entry[2] <= time.monotonic():
+                    self._remove(key)
+                    self.expirations += 1
+                else:
+                    self._order.touch(key)
+                    self.hits += 1
+                    return entry[0]
+            self.misses += 1
+
+        # The function runs outside the lock so that slow calls don't block every other thread.
+        # Two threads missing on the same key at the same time may both call the function.
+        result = self.func(*args, **kwargs)
+        self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        size = self._sizeof(result) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Bigger than the whole cache, don't evict everything else for it.
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._drop_expired()
+            while self._entries and (
+                (self.maxsize is not None and len(self._entries) >= self.maxsize)
+                or (self.max_bytes is not None and self._bytes + size > self.max_bytes)
+            ):
+                self._remove(self._order.victim())
+                self.evictions += 1
+            if self.maxsize == 0:
+                return
+            expires = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (result, size, expires)
+            self._order.add(key)
+            if expires is not None:
+                self._expiry_order[key] = None
+            self._bytes += size
+
+    def _remove(self, key):
+        _, size, expires = self._entries.pop(key)
+        self._order.remove(key)
+        if expires is not None:
+            del self._expiry_order[key]
+        self._bytes -= size
+
+    def _drop_expired(self):
+        now = time.monotonic()
+        while self._expiry_order:
+            key = next(iter(self._expiry_order))
+            if self._entries[key][2] > now:
+                return
+            self._remove(key)
+            self.expirations += 1
+
+    def cache_info(self):
+        """
+        :return: dict with hits, misses, evictions, expirations, size (entries) and bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def cache_clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._canonical_keys.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+def _unhashable_handler(unhashable):
+    if callable(unhashable):
+        return unhashable
+    if unhashable == "freeze":
+        return freeze
+    if unhashable == "pickle":
+        return lambda value: (_PICKLED, pickle.dumps(value))
+    if unhashable == "error":
+        def error(value):
+            raise TypeError(f"unhashable type: {type(value).__name__!r}")
+        return error
+    raise ValueError(f"Unknown unhashable handling {unhashable!r}. Must be 'freeze', 'pickle', 'error' or a function.")
+
+
+def memoize(func=None, *, maxsize=1024, max_bytes=None, policy="lru", ttl=None, unhashable="freeze", sizeof=deep_sizeof):
+    """
+    Cache the results of a pure function. Can be used as @memoize or @memoize(...).
+    :param maxsize: int, most entries to keep, None for no limit
+    :param max_bytes: int, most bytes of results to keep (as measured by sizeof), None for no limit
+    :param policy: str, "lru" or "lfu"
+    :param ttl: float, seconds before an entry expires, None to never expire
+    :param unhashable: "freeze", "pickle", "error" or a function, see the top of this file
+    :param sizeof: function that returns the size of a result in bytes
+    :return: MemoizedFunction, or a decorator if func isn't given
+    """
+    def decorate(func):
+        return MemoizedFunction(func, maxsize, max_bytes, policy, ttl, unhashable, sizeof)
+
+    return decorate if func is None else decorate(func)
@@ -0,0 +1,128 @@
+# Parallel Map and Filter
+
+# The double, is_odd, starts_with_a and add_7 functions in map_and_filter_functions.py are pure functions:
+# their result only depends on their argument. That means the elements can be processed in any order, on any core,
+# and the answer stays the same. The builtin map and filter still only ever use one core.
+
+# parallel_map and parallel_filter work like map and filter, but split the input into chunks of chunk_size
+# elements and send the chunks to a pool of worker processes. Results come back as a generator:
+#   ordered=True  - results are yielded in the same order as the input, as soon as the next chunk in line is done.
+#   ordered=False - results are yielded chunk by chunk in whatever order the chunks finish.
+# Only a few chunks per worker are in flight at any time, so the input can be a very long (or endless) iterator.
+
+#   doubled_nums = parallel_map(double, nums, chunk_size=10000)
+#   print(list(doubled_nums))
+
+# Every chunk has to be pickled, sent to another process and the results pickled back, so this only pays off when
+# there are a lot of elements or every element takes a while to process (see benchmarks/bench_parallel.py).
+# Because of the pickling, the function has to be defined at the top level of a module: lambdas and functions
+# defined inside other functions can't be sent to another process.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import collections
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from python_concepts.reduction import default_workers
+
+
+def chunked(iterable, chunk_size):
+    """
+    Split an iterable into lists of chunk_size elements (the last one may be shorter) without reading it all at once.
+    :param iterable: iterable
+    :param chunk_size: int
+    :return: generator of lists
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# These run inside the worker processes, so they have to be module level functions.
+def _map_chunk(func, chunk):
+    return list(map(func, chunk))
+
+
+def _filter_chunk(func, chunk):
+    return list(filter(func, chunk))
+
+
+def _pipeline_chunk(pipeline, chunk):
+    return pipeline.run(chunk)
+
+
+def _run_chunks(chunk_func, func, iterable, chunk_size, workers, ordered, executor):
+    """ Send chunks to the pool with a bounded number in flight and yield the elements of every finished chunk. """
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers or default_workers())
+    max_in_flight = 2 * (workers or default_workers())
+
+    try:
+        chunks = chunked(iterable, chunk_size)
+        in_flight = collections.deque()
+        for chunk in chunks:
+            in_flight.append(executor.submit(chunk_func, func, chunk))
+            if len(in_flight) < max_in_flight:
+                continue
+            if ordered:
+                yield from in_flight.popleft().result()
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield from future.result()
+
+        if ordered:
+            while in_flight:
+                yield from in_flight.popleft().result()
+        else:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield from future.result()
+    finally:
+        if own_executor:
+            # If the caller stopped reading early, don't wait for chunks nobody will look at.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_map(func, iterable, chunk_size=1024, workers=None, ordered=True, executor=None):
+    """
+    Like map(func, iterable), but chunks of the input are processed on a pool of worker processes.
+    :param func: module level function of one argument
+    :param iterable: iterable
+    :param chunk_size: int, elements sent to a worker at a time
+    :param workers: int, number of worker processes, defaults to the number of CPU cores
+    :param ordered: bool, yield results in input order (True) or as chunks finish (False)
+    :param executor: an existing concurrent.futures executor to use instead of starting a new process pool
+    :return: generator
+    """
+    return _run_chunks(_map_chunk, func, iterable, chunk_size, workers, ordered, executor)
+
+
+def parallel_filter(func, iterable, chunk_size=1024, workers=None, ordered=True, executor=None):
+    """
+    Like filter(func, iterable), but chunks of the input are processed on a pool of worker processes.
+    Takes the same arguments as parallel_map.
+    :return: generator
+    """
+    return _run_chunks(_filter_chunk, func, iterable, chunk_size, workers, ordered, executor)
+
+
+def parallel_pipeline(pipeline, iterable, chunk_size=65536, workers=None, ordered=True, executor=None):
+    """
+    Run a Pipeline (see python_concepts/pipeline.py) on chunks of the input in a pool of worker processes.
+    Every worker runs the whole chain of stages on its chunk, using NumPy if it can.
+    Takes the same arguments as parallel_map.
+    :param pipeline: Pipeline
+    :return: generator
+    """
+    return _run_chunks(_pipeline_chunk, pipeline, iterable, chunk_size, workers, ordered, executor)
@@ -0,0 +1,200 @@
+# Creating and Classifying People in Bulk
+
+# Person.create_person_from_birth_year in static_and_class_methods.py calls date.today() every time it creates a
+# person, and Person.is_adult checks one age per call. When millions of people are created from (name, birth year)
+# rows and then filtered down to the adults, those per row calls add up.
+
+# Person.from_birth_years looks up the current year once for the whole batch and creates every person in one loop:
+
+#   people = Person.from_birth_years([("Matthew", 1996), ("Ada", 2012)])
+
+# Population goes one step further and doesn't create a Person object per row at all. It keeps all names in one list
+# and all ages in one array, and classifies every age at once:
+
+#   population = Population.from_birth_years(rows)
+#   mask = population.adult_mask()    # [True, False, ...]
+#   adults = population.adults()      # a Population with only the adults
+
+# is_adult_batch(ages) is the batch version of Person.is_adult. Given a NumPy array (or a typed array, when NumPy is
+# installed) it compares every age in one array operation and returns a NumPy boolean array. Given a list it
+# returns a list of bools.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+from array import array
+from datetime import date
+
+from python_concepts.pipeline import np
+
+ADULT_AGE = 18
+
+
+def is_adult_batch(ages, adult_age=ADULT_AGE):
+    """
+    Person.is_adult for many ages at once.
+    :param ages: list, array.array or NumPy array of ints
+    :param adult_age: int
+    :return: NumPy array of bools for array inputs when NumPy is installed, otherwise list of bools
+    """
+    if np is not None and isinstance(ages, (np.ndarray, array)):
+        # np.asarray reads an array.array's buffer without copying it.
+        return np.asarray(ages) >= adult_age
+    return [age >= adult_age for age in ages]
+
+
+class Person:
+    """ The Person from static_and_class_methods.py, with a bulk factory. """
+
+    species = "Homo Sapien"
+
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r}, {self.age!r})"
+
+    @classmethod
+    def get_species(cls):
+        """
+        Get the value of the class variable "species".
+        :return: str
+        """
+        return cls.species
+
+    @classmethod
+    def create_person_from_birth_year(cls, name, year):
+        """
+        Factory method that create a new instance of the Person class given a birth year.
+        :param name: str
+        :param year: int
+        :return: Person
+        """
+        return cls(name, date.today().year - year)
+
+    @classmethod
+    def from_birth_years(cls, rows, current_year=None):
+        """
+        create_person_from_birth_year for many rows, with the current year looked up once.
+        :param rows: iterable of (name, birth year) tuples
+        :param current_year: int, defaults to this year
+        :return: list of Person
+        """
+        year = date.today().year if current_year is None else current_year
+        if cls.__init__ is not Person.__init__:
+            # A subclass with its own __init__ might do more than set name and age, so call it.
+            return [cls(name, year - birth_year) for name, birth_year in rows]
+
+        new = object.__new__
+        people = []
+        append = people.append
+        for name, birth_year in rows:
+            person = new(cls)
+            person.name = name
+            person.age = year - birth_year
+            append(person)
+        return people
+
+    @staticmethod
+    def is_adult(age):
+        """
+        Given an age, returns a boolean for if that person is an adult.
+        :param age: int
+        :return: boolean
+        """
+        return age >= ADULT_AGE
+
+    def display(self):
+        """ Prints information about a person. """
+        print(f"{self.name} is {self.age} years old.")
+
+
+class Population:
+    """ Many people stored column by column: a list of names and an array of ages. """
+
+    def __init__(self, names=(), ages=()):
+        """
+        :param names: iterable of str
+        :param ages: iterable of int, one per name
+        """
+        self.names = list(names)
+        # A NumPy array when NumPy is installed, otherwise a typed array of 4 byte ints.
+        self.ages = np.asarray(ages, dtype=np.int32) if np is not None else array("i", ages)
+        if len(self.names) != len(self.ages):
+            raise ValueError("There must be exactly one age per name.")
+
+    @classmethod
+    def from_birth_years(cls, rows, current_year=None):
+        """
+        Build a population from (name, birth year) rows, with the current year looked up once.
+        :param rows: iterable of (name, birth year) tuples
+        :param current_year: int, defaults to this year
+        :return: Population
+        """
+        year = date.today().year if current_year is None else current_year
+        names = []
+        birth_years = array("i")
+        add_name = names.append
+        add_year = birth_years.append
+        for name, birth_year in rows:
+            add_name(name)
+            add_year(birth_year)
+
+        population = cls()
+        population.names = names
+        if np is not None:
+            population.ages = year - np.asarray(birth_years)
+        else:
+            population.ages = array("i", [year - birth_year for birth_year in birth_years])
+        return population
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """ A Person with the name and age at index. """
+        return Person(self.names[index], int(self.ages[index]))
+
+    def __iter__(self):
+        for name, age in zip(self.names, self.ages):
+            yield Person(name, int(age))
+
+    def column(self, field):
+        """
+        Every value of one field, as a list.
+        :param field: str, "name" or "age"
+        :return: list
+        """
+        if field == "name":
+            return list(self.names)
+        if field == "age":
+            return self.ages.tolist()
+        raise ValueError(f"Unknown field {field!r}. Must be 'name' or 'age'.")
+
+    def adult_mask(self, adult_age=ADULT_AGE):
+        """
+        :param adult_age: int
+        :return: NumPy array of bools (list of bools without NumPy), True for every adult
+        """
+        return is_adult_batch(self.ages, adult_age)
+
+    def select(self, mask):
+        """
+        The people where mask is True.
+        :param mask: sequence of bools, one per person
+        :return: Population
+        """
+        population = type(self)()
+        population.names = [name for name, keep in zip(self.names, mask) if keep]
+        if np is not None:
+            population.ages = self.ages[np.asarray(mask, dtype=bool)]
+        else:
+            population.ages = array("i", [age for age, keep in zip(self.ages, mask) if keep])
+        return population
+
+    def adults(self, adult_age=ADULT_AGE):
+        """
+        :param adult_age: int
+        :return: Population with only the adults
+        """
+        return self.select(self.adult_mask(adult_age))
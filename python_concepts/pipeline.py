@@ -0,0 +1,470 @@
+# Map/Filter Pipelines
+
+# map_and_filter_functions.py chains filter(is_odd, nums) into map(add_7, ...). That calls a Python function once
+# for every element in every stage, and for millions of numbers the function calls are most of the run time.
+
+# Pipeline records the same chain of map and filter stages:
+
+#   pipeline = Pipeline().filter(X % 2 != 0).map(X + 7)
+#   pipeline.run([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])  # [8, 10, 12, 14, 16]
+
+# Stages can be normal functions (is_odd, add_7, lambdas...) or expressions built from the placeholder X.
+# An expression like X % 2 != 0 is not evaluated right away. It builds a small tree that describes the
+# calculation, and because the pipeline knows what the calculation is, it can run it on a whole array
+# of numbers at once with NumPy instead of calling a function per element. When every stage is an
+# expression, NumPy is installed and the data is numeric, the stages run together over one batch of
+# numbers at a time. Otherwise the pipeline falls back to normal Python calls, so it always works.
+
+# Python's `and`, `or` and `not` can't be overloaded, so expressions use & | ~ instead:
+#   (X > 2) & (X < 8)
+# & and | are Python's bitwise operators on both paths, which for the True/False results of comparisons is the
+# same as and/or (X & 3 is x & 3, not x and 3). ~ is `not`.
+
+# Both paths give the same results as the Python loop would. The NumPy path uses fixed size integers (int64),
+# so before taking it the pipeline works out from the smallest and largest input how big every intermediate
+# result can get, and runs the Python loop instead when a result might not fit in 64 bits. ** and division by
+# anything other than a nonzero constant always run in Python, where 2 ** -1 is 0.5 and x // 0 raises
+# ZeroDivisionError instead of NumPy's error or warning.
+
+# When the pipeline can't use NumPy, it still doesn't stack one map/filter iterator per stage. The whole chain
+# is compiled into a single loop that runs every stage on an element before moving to the next element.
+# Expression stages are written straight into the loop, so they don't cost a function call at all, and
+# normal functions are called directly from the loop. explain() shows which path will be used and the generated loop.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import operator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# name: (Python source operator, function used to evaluate it on NumPy arrays). Both paths use the same Python
+# operator, the NumPy path only runs the ones where NumPy gives the same result (see _vectorizable).
+BINARY_OPS = {
+    "add": ("+", operator.add),
+    "sub": ("-", operator.sub),
+    "mul": ("*", operator.mul),
+    "truediv": ("/", operator.truediv),
+    "floordiv": ("//", operator.floordiv),
+    "mod": ("%", operator.mod),
+    "pow": ("**", operator.pow),
+    "eq": ("==", operator.eq),
+    "ne": ("!=", operator.ne),
+    "lt": ("<", operator.lt),
+    "le": ("<=", operator.le),
+    "gt": (">", operator.gt),
+    "ge": (">=", operator.ge),
+    "bitand": ("&", operator.and_),
+    "bitor": ("|", operator.or_),
+}
+
+UNARY_OPS = {
+    "neg": ("-{}", operator.neg),
+    "abs": ("abs({})", abs),
+    "not": ("not {}", lambda a: np.logical_not(a)),
+}
+
+# NumPy adds, multiplies... True/False arrays as booleans (True + True is True), Python as the ints 1 and 0.
+_ARITHMETIC = {"add", "sub", "mul", "truediv", "floordiv", "mod", "pow", "neg", "abs"}
+_DIVISIONS = {"truediv", "floordiv", "mod"}
+_COMPARISONS = {"eq", "ne", "lt", "le", "gt", "ge", "not"}
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+# Largest integer a float64 holds exactly. Python divides two ints exactly, NumPy converts them to float64 first.
+FLOAT_EXACT_MAX = 2 ** 53
+
+
+class Expr:
+    """ A node in an expression tree built from the placeholder X. """
+
+    __slots__ = ("op", "args")
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = args
+
+    def _binary(self, op, other, reflected=False):
+        other = other if isinstance(other, Expr) else Expr("const", other)
+        return Expr(op, other, self) if reflected else Expr(op, self, other)
+
+    # Comparison operators build expressions too, so Expr can't be used as a dictionary key. Use key() for that.
+    __hash__ = None
+
+    def __add__(self, other): return self._binary("add", other)
+    def __radd__(self, other): return self._binary("add", other, True)
+    def __sub__(self, other): return self._binary("sub", other)
+    def __rsub__(self, other): return self._binary("sub", other, True)
+    def __mul__(self, other): return self._binary("mul", other)
+    def __rmul__(self, other): return self._binary("mul", other, True)
+    def __truediv__(self, other): return self._binary("truediv", other)
+    def __rtruediv__(self, other): return self._binary("truediv", other, True)
+    def __floordiv__(self, other): return self._binary("floordiv", other)
+    def __rfloordiv__(self, other): return self._binary("floordiv", other, True)
+    def __mod__(self, other): return self._binary("mod", other)
+    def __rmod__(self, other): return self._binary("mod", other, True)
+    def __pow__(self, other): return self._binary("pow", other)
+    def __rpow__(self, other): return self._binary("pow", other, True)
+    def __eq__(self, other): return self._binary("eq", other)
+    def __ne__(self, other): return self._binary("ne", other)
+    def __lt__(self, other): return self._binary("lt", other)
+    def __le__(self, other): return self._binary("le", other)
+    def __gt__(self, other): return self._binary("gt", other)
+    def __ge__(self, other): return self._binary("ge", other)
+    def __and__(self, other): return self._binary("bitand", other)
+    def __rand__(self, other): return self._binary("bitand", other, True)
+    def __or__(self, other): return self._binary("bitor", other)
+    def __ror__(self, other): return self._binary("bitor", other, True)
+    def __neg__(self): return Expr("neg", self)
+    def __abs__(self): return Expr("abs", self)
+    def __invert__(self): return Expr("not", self)
+
+    def __bool__(self):
+        raise TypeError("Expressions can't be used with and/or/not or in if statements. Use & | ~ instead.")
+
+    def __repr__(self):
+        return self.to_source(None)
+
+    def key(self):
+        """
+        A hashable value that is equal for two expressions with the same structure and constants.
+        :return: tuple
+        """
+        if self.op == "var":
+            return ("var",)
+        if self.op == "const":
+            value = self.args[0]
+            return ("const", type(value).__name__, value)
+        return (self.op,) + tuple(arg.key() for arg in self.args)
+
+    def to_source(self, constants, name="x"):
+        """
+        Python source code for the expression, with the placeholder written as `name`.
+        Numbers are written out directly, any other constant is stored in `constants` and referenced by name.
+        :param constants: dict that collects the non-numeric constants, or None to write every constant with repr()
+        :param name: str
+        :return: str
+        """
+        if self.op == "var":
+            return name
+        if self.op == "const":
+            value = self.args[0]
+            if constants is None or type(value) in (int, float, bool) and repr(value) not in ("inf", "-inf", "nan"):
+                return repr(value)
+            constant_name = f"_c{len(constants)}"
+            constants[constant_name] = value
+            return constant_name
+        if self.op in UNARY_OPS:
+            return "(" + UNARY_OPS[self.op][0].format(self.args[0].to_source(constants, name)) + ")"
+        left, right = (arg.to_source(constants, name) for arg in self.args)
+        return f"({left} {BINARY_OPS[self.op][0]} {right})"
+
+    def evaluate(self, value):
+        """
+        Evaluate the expression on a whole NumPy array at once.
+        :param value: numpy.ndarray
+        :return: numpy.ndarray
+        """
+        if self.op == "var":
+            return value
+        if self.op == "const":
+            return self.args[0]
+        operands = [arg.evaluate(value) for arg in self.args]
+        if self.op in _ARITHMETIC:
+            operands = [_as_number(operand) for operand in operands]
+        if self.op in UNARY_OPS:
+            return UNARY_OPS[self.op][1](*operands)
+        return BINARY_OPS[self.op][1](*operands)
+
+
+def _as_number(value):
+    if isinstance(value, np.ndarray) and value.dtype.kind == "b":
+        return value.astype(np.int64)
+    return value
+
+
+# The placeholder for "the current element". X + 7 means "add 7 to every element".
+X = Expr("var")
+
+
+def _vectorizable(expr):
+    """
+    Whether NumPy gives the same result as Python for every operator in expr, whatever the input.
+    ** never does (2 ** -1, 0.0 ** -1, (-8) ** (1 / 3)...) and division only does by a nonzero constant.
+    :param expr: Expr
+    :return: bool
+    """
+    if expr.op == "pow":
+        return False
+    if expr.op in _DIVISIONS:
+        divisor = expr.args[1]
+        if divisor.op != "const" or type(divisor.args[0]) not in (int, float, bool) or divisor.args[0] == 0:
+            return False
+    return all(_vectorizable(arg) for arg in expr.args if isinstance(arg, Expr))
+
+
+def int64_bounds(op, left, right=None):
+    """
+    Interval arithmetic: the smallest and largest value `left op right` can have when each operand can be anything
+    in its range. Also used by batch_math.py.
+    :param op: str, a name from BINARY_OPS (right is a single value for "floordiv" and "mod"), or "neg" or "abs"
+    :param left: (int, int)
+    :param right: (int, int), or None for "neg" and "abs"
+    :return: (int, int), or None for "truediv", whose result is a float, which can't overflow like an int64
+    :raise OverflowError: when the result might not fit in an int64, or ints too big to divide exactly as floats
+    """
+    a, b = left
+    c, d = right if right is not None else (None, None)
+    if op == "neg":
+        bounds = (-b, -a)
+    elif op == "abs":
+        bounds = (0 if a <= 0 <= b else min(abs(a), abs(b)), max(abs(a), abs(b)))
+    elif op == "add":
+        bounds = (a + c, b + d)
+    elif op == "sub":
+        bounds = (a - d, b - c)
+    elif op == "mul":
+        products = (a * c, a * d, b * c, b * d)
+        bounds = (min(products), max(products))
+    elif op == "truediv":
+        if max(abs(a), abs(b), abs(c), abs(d)) > FLOAT_EXACT_MAX:
+            raise OverflowError("int too large to divide exactly as a float64")
+        return None
+    elif op == "floordiv":
+        bounds = (min(a // c, b // c), max(a // c, b // c))
+    elif op == "mod":
+        bounds = (0, c - 1) if c > 0 else (c + 1, 0)
+    else:  # bitand, bitor
+        size = 2 ** max(abs(a), abs(b), abs(c), abs(d)).bit_length()
+        bounds = (-size, size - 1)
+    return _check_int64(bounds)
+
+
+def _check_int64(bounds):
+    if bounds[0] < INT64_MIN or bounds[1] > INT64_MAX:
+        raise OverflowError("int too large for int64")
+    return bounds
+
+
+def _int_bounds(expr, low, high):
+    """
+    The smallest and largest value expr can have for integer inputs between low and high.
+    :param expr: Expr that passes _vectorizable
+    :param low: int
+    :param high: int
+    :return: (int, int), or None once the result is a float, which can't overflow like an int64
+    :raise OverflowError: when a value on the way might not fit in an int64
+    """
+    op, args = expr.op, expr.args
+    if op == "var":
+        return _check_int64((low, high))
+    if op == "const":
+        value = args[0]
+        if type(value) not in (int, bool):
+            return None
+        return _check_int64((int(value), int(value)))
+    if op in _COMPARISONS:
+        for arg in args:
+            _int_bounds(arg, low, high)
+        return (0, 1)
+    operands = [_int_bounds(arg, low, high) for arg in args]
+    if None in operands:
+        return None
+    return int64_bounds(op, *operands)
+
+
+def _fits_int64(stages, low, high):
+    """ Whether every intermediate result of the stages fits in an int64 for integer inputs between low and high. """
+    bounds = (low, high)
+    try:
+        for kind, expr in stages:
+            result = _int_bounds(expr, *bounds)
+            if kind == "map":
+                if result is None:
+                    return True
+                bounds = result
+    except OverflowError:
+        return False
+    return True
+
+
+def fuse(stages, lazy=False):
+    """
+    Compile a chain of map/filter stages into one function with a single loop over the data.
+    :param stages: tuple of ("map" or "filter", function or Expr)
+    :param lazy: bool, True gives a generator function, False a function that returns a list
+    :return: function, with the generated code in its __source__ attribute
+    """
+    namespace = {"__builtins__": {"abs": abs}}
+    constants = {}
+    lines = ["def fused(data):"]
+    if not lazy:
+        lines += ["    result = []", "    append = result.append"]
+    lines.append("    for x in data:")
+
+    for i, (kind, func) in enumerate(stages):
+        if isinstance(func, Expr):
+            code = func.to_source(constants)
+        else:
+            namespace[f"_f{i}"] = func
+            code = f"_f{i}(x)"
+        if kind == "map":
+            lines.append(f"        x = {code}")
+        else:
+            lines += [f"        if not {code}:", "            continue"]
+
+    if lazy:
+        lines.append("        yield x")
+    else:
+        lines += ["        append(x)", "    return result"]
+
+    source = "\n".join(lines)
+    namespace.update(constants)
+    exec(source, namespace)
+    fused = namespace["fused"]
+    fused.__source__ = source
+    return fused
+
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+class Pipeline:
+    """ An immutable chain of map and filter stages. map() and filter() return a new, longer pipeline. """
+
+    def __init__(self, stages=(), batch_size=65536):
+        """
+        :param stages: tuple of ("map" or "filter", function or Expr)
+        :param batch_size: int, number of elements the NumPy path processes at a time
+        """
+        self.stages = tuple(stages)
+        self.batch_size = batch_size
+        # Compiled loops, keyed by lazy. Pipelines never change, so they only need to be compiled once.
+        self._fused = {}
+
+    def __getstate__(self):
+        # Compiled loops are created with exec and can't be pickled. They are rebuilt on first use after unpickling,
+        # which is what lets a pipeline be sent to another process (see python_concepts/parallel.py).
+        state = self.__dict__.copy()
+        state["_fused"] = {}
+        return state
+
+    def _add(self, kind, func):
+        return type(self)(self.stages + ((kind, func),), batch_size=self.batch_size)
+
+    def map(self, func):
+        """ Add a stage that replaces every element with func(element). """
+        return self._add("map", func)
+
+    def filter(self, func):
+        """ Add a stage that only keeps the elements for which func(element) is true. """
+        return self._add("filter", func)
+
+    def __repr__(self):
+        return "Pipeline()" + "".join(f".{kind}({func!r})" for kind, func in self.stages)
+
+    def can_vectorize(self, data):
+        """
+        Whether run(data) will use the NumPy path.
+        :return: bool
+        """
+        return self._vector_input(data) is not None
+
+    def _vector_input(self, data):
+        """ data as an array the NumPy path gives exact results for, or None if the Python loop has to run it. """
+        if np is None or not all(isinstance(func, Expr) and _vectorizable(func) for _, func in self.stages):
+            return None
+        if isinstance(data, np.ndarray):
+            array = data
+        elif isinstance(data, (list, tuple, range)):
+            array = np.asarray(data)
+        else:
+            return None
+        # A list of non-numeric values can't be vectorized.
+        if array.dtype.kind not in "biuf":
+            return None
+        # NumPy turns [1, 2.5] or [True, 2] into one type, but the Python loop keeps every element's own type.
+        if isinstance(data, (list, tuple)) and len(set(map(type, data))) > 1:
+            return None
+        if array.dtype.kind in "iu" and len(array) and self.stages:
+            if not _fits_int64(self.stages, int(array.min()), int(array.max())):
+                return None
+            # Smaller integer types would overflow much sooner than Python ints, so work in int64.
+            array = array.astype(np.int64, copy=False)
+        return array
+
+    def run(self, data):
+        """
+        Run every element of data through the pipeline.
+        A NumPy array gives back a NumPy array, anything else gives back a list.
+        :param data: iterable
+        :return: list or numpy.ndarray
+        """
+        array = self._vector_input(data)
+        if array is not None:
+            result = self._run_numpy(array)
+            return result if isinstance(data, np.ndarray) else result.tolist()
+        if np is not None and isinstance(data, np.ndarray):
+            # NumPy scalars follow NumPy's rules, so the Python loop gets Python numbers.
+            result = self.compile()(data.tolist())
+            return np.array(result) if result else data[:0]
+        return self.compile()(data)
+
+    __call__ = run
+
+    def iterate(self, data):
+        """
+        Lazily run data through the stages, one element at a time.
+        :param data: iterable
+        :return: iterator
+        """
+        return self.compile(lazy=True)(data)
+
+    def compile(self, lazy=False):
+        """
+        The single loop function for this pipeline, see fuse().
+        :param lazy: bool
+        :return: function
+        """
+        if lazy not in self._fused:
+            self._fused[lazy] = fuse(self.stages, lazy=lazy)
+        return self._fused[lazy]
+
+    def explain(self, data=None):
+        """
+        Describe how the pipeline will run: its stages, whether it can use NumPy and the generated loop.
+        :param data: optional example input, used to decide if the NumPy path applies
+        :return: str
+        """
+        lines = [repr(self), ""]
+        for number, (kind, func) in enumerate(self.stages, 1):
+            how = "inlined expression" if isinstance(func, Expr) else "function call"
+            lines.append(f"  {number}. {kind:<6} {func!r}  ({how})")
+        lines.append("")
+        if data is not None and self.can_vectorize(data):
+            lines.append(f"Runs as NumPy array operations, {self.batch_size} elements per batch.")
+        else:
+            lines.append(f"Runs as one fused Python loop ({len(self.stages)} stages, 1 pass):")
+            lines.append(self.compile().__source__)
+        return "\n".join(lines)
+
+    def _run_numpy(self, array):
+        # Running every stage over one batch before moving to the next batch keeps the intermediate
+        # arrays small enough to stay in the CPU cache, instead of creating a full size array per stage.
+        results = []
+        for start in range(0, len(array), self.batch_size):
+            batch = array[start:start + self.batch_size]
+            for kind, expr in self.stages:
+                result = expr.evaluate(batch)
+                # An expression that doesn't use X at all gives back a single value instead of an array.
+                if kind == "map":
+                    batch = np.full(len(batch), result) if np.ndim(result) == 0 else result
+                elif np.ndim(result) == 0:
+                    batch = batch if result else batch[:0]
+                else:
+                    batch = batch[np.asarray(result, dtype=bool)]
+            results.append(batch)
+        if not results:
+            return array[:0]
+        return np.concatenate(results)
@@ -0,0 +1,267 @@
+# Interning and Object Pools
+
+# Person objects from static_and_class_methods.py and Car objects from the tutorial files are usually created, used
+# for a moment and thrown away. When that happens millions of times, and most of the objects hold the same few values
+# (the same make and model, the same name and age), creating and freeing them costs time, and all of the short lived
+# objects make the garbage collector run more often.
+
+# There are two ways to create fewer objects:
+
+# Interning (also called the flyweight pattern) is for objects that never change. A class that inherits from
+# Interned remembers the instances it has created, keyed by the arguments they were created with. Creating an object
+# with the same arguments again gives back the same instance instead of a new one:
+
+#   InternedCar("Jeep", "Wrangler") is InternedCar("Jeep", "Wrangler")   # True
+
+# Instances are only remembered while something else still uses them (the cache holds weak references), so the cache
+# never keeps objects alive by itself. Sharing one instance is only safe because it can't be changed: setting an
+# attribute on an Interned object raises AttributeError. Arguments are compared by value and type, because 1, 1.0
+# and True are equal in Python but an InternedPerson("Bob", True) must not give back InternedPerson("Bob", 1).
+# Arguments that can't be hashed (a list, for example) skip the cache and create a new instance every time.
+# Passing the same values by position and by keyword counts as different arguments, so InternedCar("Jeep", "Wrangler")
+# and InternedCar(make="Jeep", model="Wrangler") aren't shared.
+
+# An ObjectPool is for objects that do change. Instead of throwing an object away, release it back to the pool, and
+# the next acquire() reuses it instead of creating a new one. Releasing an object deletes all of its attributes, and
+# acquire() calls its __init__ again with the new arguments, so nothing from its previous use is left over:
+
+#   pool = ObjectPool(Person)
+#   person = pool.acquire("Matthew", 28)
+#   ...
+#   pool.release(person)   # don't use person after this
+
+# Objects that keep their state somewhere other than their attributes, like a dict or a list, can't be cleaned up
+# that way, so pooling them needs a reset function that puts the object back in a new state: ObjectPool(dict,
+# reset=lambda d, *args, **kwargs: (d.clear(), d.update(*args, **kwargs))).
+
+# Releasing an object and then still using it is a bug the pool can't catch, so only use a pool where it's clear
+# when an object is done being used, or use `with pool.borrowed(...) as person:`.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import contextlib
+import threading
+import types
+import weakref
+
+# Separates the positional from the keyword arguments in a cache key.
+_KWARGS = object()
+
+
+def _typed(value):
+    """
+    value together with its type, and the same for the items of a tuple or frozenset, so that 1, 1.0 and True differ.
+    Lists, sets and dicts can't be hashed, so keys holding them are never looked up and their items don't matter.
+    """
+    if isinstance(value, tuple):
+        return (type(value), tuple(map(_typed, value)))
+    if isinstance(value, frozenset):
+        return (type(value), frozenset(map(_typed, value)))
+    return (type(value), value)
+
+
+def interning_key(args, kwargs):
+    """
+    The cache key for a call with args and kwargs. Keyword order doesn't matter, and keyword values don't
+    have to be sortable.
+    :param args: tuple
+    :param kwargs: dict
+    :return: tuple, which can hold unhashable values (looking it up raises TypeError then)
+    """
+    key = tuple(_typed(arg) for arg in args)
+    if kwargs:
+        key += (_KWARGS, frozenset((name, _typed(value)) for name, value in kwargs.items()))
+    return key
+
+
+class InternedMeta(type):
+    """ Metaclass that gives back an existing instance when a class is called with arguments it has seen before. """
+
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # Every class gets its own cache, so a subclass never hands out instances of its parent.
+        cls._instances = weakref.WeakValueDictionary()
+
+    def __call__(cls, *args, **kwargs):
+        try:
+            key = interning_key(args, kwargs)
+            instance = cls._instances.get(key)
+        except TypeError:
+            # Unhashable arguments can't be looked up, so these instances aren't shared.
+            return super().__call__(*args, **kwargs)
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            # setdefault, so two threads creating the same instance at once still end up sharing one of them.
+            instance = cls._instances.setdefault(key, instance)
+        return instance
+
+    def interned_count(cls):
+        """
+        :return: int, number of instances of this class that are currently remembered
+        """
+        return len(cls._instances)
+
+
+class Interned(metaclass=InternedMeta):
+    """ Base class for immutable classes whose instances are shared between equal constructor calls. """
+
+    __slots__ = ("__weakref__",)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are shared and can't be changed.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} objects are shared and can't be changed.")
+
+    def _set(self, **values):
+        """ Set attributes from __init__, the only place an Interned object should be changed. """
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        # Unpickling calls the class again, which goes through the cache.
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+
+class InternedCar(Interned):
+    """ An immutable Car(make, model) from dunder_methods.py. """
+
+    __slots__ = ("make", "model")
+
+    def __init__(self, make, model):
+        self._set(make=make, model=model)
+
+    def __repr__(self):
+        return f"InternedCar({self.make!r}, {self.model!r})"
+
+
+class InternedPerson(Interned):
+    """ An immutable Person(name, age) from static_and_class_methods.py. """
+
+    __slots__ = ("name", "age")
+
+    def __init__(self, name, age):
+        self._set(name=name, age=age)
+
+    def __repr__(self):
+        return f"InternedPerson({self.name!r}, {self.age!r})"
+
+    def display(self):
+        """ Prints information about a person. """
+        print(f"{self.name} is {self.age} years old.")
+
+
+# Set on classes created by a class statement. Types written in C (dict, list, ...) keep their state outside of
+# their attributes, where clear_attributes can't reach it.
+_HEAPTYPE = 1 << 9
+
+
+def _state_in_attributes(cls):
+    """ Whether clear_attributes wipes everything an instance of cls holds. """
+    return isinstance(cls, type) and all(base is object or base.__flags__ & _HEAPTYPE for base in cls.__mro__)
+
+
+def clear_attributes(obj):
+    """
+    Delete every attribute of obj, the ones in its __dict__ and the ones in its __slots__.
+    :param obj: instance of a class for which _state_in_attributes is True
+    """
+    cls = type(obj)
+    slots = _slot_descriptors.get(cls)
+    if slots is None:
+        slots = _slot_descriptors[cls] = tuple(
+            descriptor for base in cls.__mro__ for descriptor in vars(base).values()
+            if isinstance(descriptor, types.MemberDescriptorType)
+        )
+    for descriptor in slots:
+        try:
+            descriptor.__delete__(obj)
+        except AttributeError:
+            pass  # the slot was never set
+    try:
+        obj.__dict__.clear()
+    except AttributeError:
+        pass  # only __slots__
+
+
+# class -> the descriptors of the __slots__ of the class and its bases
+_slot_descriptors = {}
+
+
+class ObjectPool:
+    """ A thread safe free list of released objects that acquire() reuses before creating new ones. """
+
+    def __init__(self, cls, maxsize=1024, reset=None):
+        """
+        :param cls: the class (or any function) that creates new objects
+        :param maxsize: int, most released objects to keep, the rest are left to the garbage collector
+        :param reset: function(obj, *args, **kwargs) that puts a reused object in the same state as
+                      cls(*args, **kwargs). Needed when cls isn't a class whose state is all in its attributes.
+                      Without it, released objects have their attributes deleted and reused ones get obj.__init__.
+        """
+        if reset is None and not _state_in_attributes(cls):
+            raise TypeError(f"{cls!r} keeps state outside of its attributes, so ObjectPool needs a reset function.")
+        self.cls = cls
+        self.maxsize = maxsize
+        self.reset = reset
+        self._free = []
+        # ids of the objects in _free, to catch an object released twice.
+        self._free_ids = set()
+        self._lock = threading.Lock()
+        self.created = self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        """
+        A reinitialized released object if there is one, otherwise a new one.
+        :return: object
+        """
+        with self._lock:
+            if not self._free:
+                self.created += 1
+                obj = None
+            else:
+                obj = self._free.pop()
+                self._free_ids.discard(id(obj))
+                self.reused += 1
+        if obj is None:
+            return self.cls(*args, **kwargs)
+        if self.reset is not None:
+            self.reset(obj, *args, **kwargs)
+        else:
+            obj.__init__(*args, **kwargs)
+        return obj
+
+    def release(self, obj):
+        """
+        Give an object back to the pool. It must not be used again after this.
+        :param obj: object from acquire()
+        """
+        if self.reset is None:
+            # Drop everything from the previous use now, instead of keeping it alive while the object waits.
+            # Done before taking the lock, because deleting an attribute can run any __del__ method.
+            clear_attributes(obj)
+        with self._lock:
+            if id(obj) in self._free_ids:
+                raise ValueError(f"This {type(obj).__name__} was already released.")
+            if len(self._free) < self.maxsize:
+                self._free_ids.add(id(obj))
+                self._free.append(obj)
+
+    @contextlib.contextmanager
+    def borrowed(self, *args, **kwargs):
+        """ acquire() an object for the body of a with statement and release it afterwards. """
+        obj = self.acquire(*args, **kwargs)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+
+    def __len__(self):
+        """ Number of released objects waiting to be reused. """
+        return len(self._free)
+
+    def stats(self):
+        """
+        :return: dict with created, reused and free (released objects waiting to be reused)
+        """
+        return {"created": self.created, "reused": self.reused, "free": len(self._free)}
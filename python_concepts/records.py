@@ -0,0 +1,274 @@
+# Compact Car Records
+
+# The Car classes in dunder_methods.py, args_and_kwargs.py and optional_parameters.py are normal classes, so every
+# instance carries its own __dict__ to hold its attributes. For one car that doesn't matter, but for millions of
+# cars the dictionaries take up more memory than the data inside them.
+
+# This file has two smaller ways to store the same information:
+
+# Car uses __slots__. Listing the attribute names in __slots__ tells Python to reserve a fixed spot for each
+# attribute in the object itself instead of creating a dictionary. The catch is that you can't add attributes
+# that aren't listed in __slots__.
+
+# CarFleet stores many cars column by column instead of object by object: all of the years in one typed array,
+# all of the mileages in another, and so on. Typed arrays (from the array module) store plain numbers without
+# wrapping each one in a Python object. Makes, models and conditions repeat a lot (there are millions of cars but
+# only a few hundred models), so every distinct string is stored once and the columns only hold its number.
+# Indexing a fleet gives back a CarView, which looks and acts like a Car but reads and writes the columns.
+
+#   fleet = CarFleet()
+#   fleet.append("Jeep", "Wrangler", 2013, "Used", 100000)
+#   fleet[0].display_info()  # Used 2013 Jeep Wrangler with 100000 miles.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import operator
+import sys
+from array import array
+
+FIELDS = ("make", "model", "year", "condition", "mileage")
+
+
+class Car:
+    """ The Car from optional_parameters.py, stored with __slots__ instead of a per instance __dict__. """
+
+    __slots__ = FIELDS
+
+    def __init__(self, make, model, year, condition="New", mileage=0):
+        self.make = make
+        self.model = model
+        self.year = year
+        self.condition = condition
+        self.mileage = mileage
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.make!r}, {self.model!r}, {self.year!r}, {self.condition!r}, {self.mileage!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, (Car, CarView)):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in FIELDS)
+
+    def __hash__(self):
+        # Defining __eq__ sets __hash__ to None, which would make cars unusable in sets and as dict keys.
+        # Like any hashable object, a car must not be changed while it is in a set or used as a key.
+        return hash(tuple(getattr(self, field) for field in FIELDS))
+
+    def display_info(self, show_all=True):
+        if show_all:
+            print(f"{self.condition} {self.year} {self.make} {self.model} with {self.mileage} miles.")
+        else:
+            print(f"{self.year} {self.make} {self.model}")
+
+
+class StringPool:
+    """ Stores every distinct string once and gives each one a number. """
+
+    def __init__(self):
+        self.strings = []
+        self._codes = {}
+
+    def code(self, string):
+        """
+        The number for string, adding it to the pool if it is new.
+        :param string: str
+        :return: int
+        """
+        try:
+            return self._codes[string]
+        except KeyError:
+            code = self._codes[string] = len(self.strings)
+            self.strings.append(string)
+            return code
+
+    def __len__(self):
+        return len(self.strings)
+
+    def __contains__(self, string):
+        return string in self._codes
+
+
+class CarView:
+    """ A Car-like view of one row of a CarFleet. Reading or setting an attribute reads or writes the fleet's columns. """
+
+    __slots__ = ("_fleet", "_index")
+
+    def __init__(self, fleet, index):
+        self._fleet = fleet
+        self._index = index
+
+    @property
+    def make(self):
+        fleet = self._fleet
+        return fleet.makes.strings[fleet.make_codes[self._index]]
+
+    @make.setter
+    def make(self, value):
+        fleet = self._fleet
+        fleet.make_codes[self._index] = fleet.makes.code(fleet._checked("make", value))
+
+    @property
+    def model(self):
+        fleet = self._fleet
+        return fleet.models.strings[fleet.model_codes[self._index]]
+
+    @model.setter
+    def model(self, value):
+        fleet = self._fleet
+        fleet.model_codes[self._index] = fleet.models.code(fleet._checked("model", value))
+
+    @property
+    def year(self):
+        return self._fleet.years[self._index]
+
+    @year.setter
+    def year(self, value):
+        self._fleet.years[self._index] = self._fleet._checked("year", value)
+
+    @property
+    def condition(self):
+        fleet = self._fleet
+        return fleet.conditions.strings[fleet.condition_codes[self._index]]
+
+    @condition.setter
+    def condition(self, value):
+        fleet = self._fleet
+        fleet.condition_codes[self._index] = fleet.conditions.code(fleet._checked("condition", value))
+
+    @property
+    def mileage(self):
+        return self._fleet.mileages[self._index]
+
+    @mileage.setter
+    def mileage(self, value):
+        self._fleet.mileages[self._index] = self._fleet._checked("mileage", value)
+
+    __repr__ = Car.__repr__
+    __eq__ = Car.__eq__
+    display_info = Car.display_info
+
+    def to_car(self):
+        """ A standalone Car with this row's values. """
+        return Car(self.make, self.model, self.year, self.condition, self.mileage)
+
+
+def _fits(typecode, value):
+    """
+    Check that value can be stored in an array of typecode.
+    :return: value
+    :raise TypeError, OverflowError: like array.append would
+    """
+    array(typecode, (value,))
+    return value
+
+
+class CarFleet:
+    """ A column oriented collection of cars. """
+
+    def __init__(self):
+        self.makes = StringPool()
+        self.models = StringPool()
+        self.conditions = StringPool()
+        # "I" is an unsigned int (at least 4 bytes), "h" a 2 byte int, "B" a 1 byte unsigned int
+        # and "q" an 8 byte int. Conditions use one byte, so a fleet can have at most 256 different conditions.
+        self.make_codes = array("I")
+        self.model_codes = array("I")
+        self.years = array("h")
+        self.condition_codes = array("B")
+        self.mileages = array("q")
+
+    @classmethod
+    def from_cars(cls, cars):
+        """
+        Build a fleet from any objects with make, model, year, condition and mileage attributes.
+        :param cars: iterable
+        :return: CarFleet
+        """
+        fleet = cls()
+        fleet.extend((car.make, car.model, car.year, car.condition, car.mileage) for car in cars)
+        return fleet
+
+    def _checked(self, field, value):
+        """
+        Convert and check a value before it is stored in the fleet, by append() or by setting a CarView attribute.
+        :param field: str, one of FIELDS
+        :return: the value to store
+        :raise TypeError, ValueError, OverflowError: if the fleet can't store value
+        """
+        if field == "year":
+            return _fits(self.years.typecode, value)
+        if field == "mileage":
+            # optional_parameters.py uses the string "0" as its default mileage, so accept numeric strings too.
+            return _fits(self.mileages.typecode, int(value))
+        hash(value)  # an unhashable value raises TypeError here instead of after it was added to the pool
+        if field == "condition" and value not in self.conditions and len(self.conditions) > 255:
+            raise ValueError("A CarFleet can have at most 256 different conditions.")
+        return value
+
+    def append(self, make, model, year, condition="New", mileage=0):
+        """ Add one car. Arguments are the same as for Car. If any of them is invalid, the fleet doesn't change. """
+        # Every value is converted and checked before any column changes, otherwise a bad mileage would
+        # leave the other columns one car longer than the mileages.
+        checked = self._checked
+        make, model, year = checked("make", make), checked("model", model), checked("year", year)
+        condition, mileage = checked("condition", condition), checked("mileage", mileage)
+        self.make_codes.append(self.makes.code(make))
+        self.model_codes.append(self.models.code(model))
+        self.years.append(year)
+        self.condition_codes.append(self.conditions.code(condition))
+        self.mileages.append(mileage)
+
+    def extend(self, rows):
+        """
+        Add many cars at once.
+        :param rows: iterable of (make, model, year[, condition[, mileage]]) tuples
+        """
+        append = self.append
+        for row in rows:
+            append(*row)
+
+    def __len__(self):
+        return len(self.years)
+
+    def __getitem__(self, index):
+        """
+        :param index: int, or a slice for a list of CarViews
+        :return: CarView
+        """
+        if isinstance(index, slice):
+            return [CarView(self, i) for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CarFleet index out of range")
+        return CarView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield CarView(self, index)
+
+    def column(self, field):
+        """
+        Every value of one field, as a list. Much faster than reading the field through every CarView.
+        :param field: str, one of FIELDS
+        :return: list
+        """
+        if field in ("make", "model", "condition"):
+            pool = getattr(self, f"{field}s")
+            codes = getattr(self, f"{field}_codes")
+            return [pool.strings[code] for code in codes]
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field {field!r}. Must be one of {FIELDS}.")
+        return getattr(self, f"{field}s").tolist()
+
+    def nbytes(self):
+        """
+        Memory used by the columns and the string pools, in bytes (the strings themselves are counted once each).
+        :return: int
+        """
+        columns = (self.make_codes, self.model_codes, self.years, self.condition_codes, self.mileages)
+        total = sum(column.buffer_info()[1] * column.itemsize for column in columns)
+        for pool in (self.makes, self.models, self.conditions):
+            total += sum(sys.getsizeof(string) for string in pool.strings)
+        return total
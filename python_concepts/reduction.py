@@ -0,0 +1,159 @@
+# Partitioned Reductions
+
+# The race condition example at the end of threading_basics.py has two threads doing `total += num`
+# on a shared global variable. Without the lock the answer is wrong, and with the lock the program
+# gets slower than a single thread, because every single addition now has to acquire and release the lock.
+
+# The way around this is to stop sharing the total at all. Instead of every worker updating one
+# variable, we split the numbers up into chunks, let each worker add up its own chunk into a local
+# result, and only combine the partial results once at the very end. There is nothing shared between
+# the workers, so there is nothing to lock and nothing that can race.
+
+# The functions below let you run that "split, reduce each chunk, merge once" pattern with three backends:
+#   "inline"  - runs every chunk one after the other on the current thread (useful as a baseline).
+#   "thread"  - runs the chunks on a thread pool. Because of the GIL this only helps when the chunk
+#               function spends its time outside of Python (I/O, or C code that releases the GIL).
+#   "process" - runs the chunks on a process pool, which is the one that actually uses multiple cores
+#               for CPU bound work like adding up numbers.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import math
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+
+BACKENDS = ("inline", "thread", "process")
+
+
+def default_workers():
+    """
+    Number of workers to use when none is given: one per CPU core.
+    :return: int
+    """
+    return os.cpu_count() or 1
+
+
+def partition(data, chunks):
+    """
+    Split data into at most `chunks` contiguous pieces whose sizes differ by at most one.
+    A range is split into smaller ranges, so no numbers are ever materialized and the pieces are
+    cheap to send to another process. Lists and tuples are sliced, and any other iterable is turned into a list first.
+    :param data: range, list, tuple or any other iterable
+    :param chunks: int
+    :return: list
+    """
+    if chunks < 1:
+        raise ValueError("chunks must be at least 1.")
+    if not isinstance(data, (range, list, tuple)):
+        data = list(data)
+
+    chunks = max(1, min(chunks, len(data)))
+    size, extra = divmod(len(data), chunks)
+
+    pieces = []
+    start = 0
+    for i in range(chunks):
+        # The first `extra` pieces get one more element so that every element lands in exactly one piece.
+        stop = start + size + (1 if i < extra else 0)
+        pieces.append(data[start:stop])
+        start = stop
+    return pieces
+
+
+def map_chunks(chunk_func, pieces, backend="thread", workers=None):
+    """
+    Apply chunk_func to every piece and return the results in the same order as the pieces.
+    For the process backend chunk_func must be picklable (a builtin or a function defined at module level).
+    :param chunk_func: function
+    :param pieces: list
+    :param backend: str, one of BACKENDS
+    :param workers: int
+    :return: list
+    """
+    if backend == "inline":
+        return [chunk_func(piece) for piece in pieces]
+    if backend == "thread":
+        executor_class = ThreadPoolExecutor
+    elif backend == "process":
+        executor_class = ProcessPoolExecutor
+    else:
+        raise ValueError(f"Unknown backend {backend!r}. Must be one of {BACKENDS}.")
+
+    workers = min(workers or default_workers(), len(pieces)) or 1
+    with executor_class(max_workers=workers) as executor:
+        # executor.map hands results back in submission order, no matter which chunk finishes first.
+        return list(executor.map(chunk_func, pieces))
+
+
+def parallel_reduce(data, chunk_func, combine=operator.add, initial=0, backend="thread", workers=None, chunks=None):
+    """
+    Reduce data by splitting it into chunks, reducing every chunk on its own with chunk_func and
+    then merging the partial results with combine, once per chunk, in chunk order.
+    Because the partials are always merged in the same order, the result does not depend on which worker finished first.
+    :param data: range, list, tuple or any other iterable
+    :param chunk_func: function that reduces one chunk to a partial result
+    :param combine: function that merges two partial results
+    :param initial: starting value for the merge
+    :param backend: str, one of BACKENDS
+    :param workers: int, defaults to the number of CPU cores
+    :param chunks: int, defaults to the number of workers
+    :return: the combined result
+    """
+    workers = workers or default_workers()
+    pieces = partition(data, chunks or workers)
+    partials = map_chunks(chunk_func, pieces, backend=backend, workers=workers)
+    return reduce(combine, partials, initial)
+
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Sums
+
+# Adding integers is always exact in Python, so the builtin sum can be used for every chunk.
+def parallel_sum(data, backend="thread", workers=None, chunks=None):
+    """
+    Add up every number in data using the partitioned reduction. Integers give the exact answer.
+    For floats, use parallel_fsum instead.
+    :param data: range, list, tuple or any other iterable of numbers
+    :return: int or float
+    """
+    return parallel_reduce(data, sum, backend=backend, workers=workers, chunks=chunks)
+
+
+# Adding floats is not exact: every addition rounds, so adding the chunks up separately and then
+# adding the chunk totals can give a slightly different answer than adding everything at once.
+# To keep the result exact, every chunk returns the list of non-overlapping partial sums that math.fsum
+# uses internally (Shewchuk's algorithm). These partials represent the chunk total without any rounding,
+# so merging the lists and handing them to math.fsum gives the correctly rounded sum of all of the numbers.
+def float_partials(values):
+    """
+    Add up values without rounding, returning the exact total as a list of non-overlapping floats.
+    :param values: iterable of floats
+    :return: list of floats
+    """
+    partials = []
+    for x in values:
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+    return partials
+
+
+def parallel_fsum(data, backend="thread", workers=None, chunks=None):
+    """
+    Add up floats using the partitioned reduction and return the correctly rounded total,
+    the same value math.fsum(data) would give.
+    :param data: range, list, tuple or any other iterable of numbers
+    :return: float
+    """
+    partials = parallel_reduce(data, float_partials, initial=[], backend=backend, workers=workers, chunks=chunks)
+    return math.fsum(partials)
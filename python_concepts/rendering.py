@@ -0,0 +1,216 @@
+# Batched Rendering of Records
+
+# Car.display_info in optional_parameters.py and Person.display in static_and_class_methods.py print one f-string
+# per object. That's fine for one car, but printing a fleet of millions of cars one print() at a time spends most
+# of its time inside print and the write to stdout, not in formatting the text.
+
+# A Renderer formats many records at once and writes the result in big pieces (buffer_size characters at a time,
+# or everything in a single write when buffer_size is None) to any file-like object:
+
+#   render_cars(cars)                                # the same lines as car.display_info() for every car
+#   render_cars(cars, show_all=False)                # the same lines as car.display_info(show_all=False)
+#   render_people(people, file=report, format="csv") # name,age header and one row per person
+#   render_cars(fleet, format="jsonl")               # {"condition": "Used", "year": 2013, ...} per line
+
+# Like display_info, show_all picks which columns are included: every field, or only year, make and model.
+
+# Records can be any objects with the right attributes (Car, Person, the CarView of a CarFleet), or a column store
+# with a column(field) method, like CarFleet in records.py. Column stores are read column by column, which skips
+# creating a view object per row.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import csv
+import io
+import json
+import keyword
+import operator
+import string
+import sys
+
+from python_concepts.parallel import chunked
+
+FORMATS = ("text", "csv", "jsonl")
+# Characters collected before each write.
+DEFAULT_BUFFER_SIZE = 1 << 20
+# Rows formatted per step. Small enough to keep memory flat, big enough that the per step overhead doesn't matter.
+BATCH_ROWS = 4096
+
+CAR_TEMPLATES = {
+    True: "{condition} {year} {make} {model} with {mileage} miles.",
+    False: "{year} {make} {model}",
+}
+PERSON_TEMPLATE = "{name} is {age} years old."
+
+
+def template_fields(template):
+    """
+    The field names used in a template, in order of first use.
+    :param template: str, like "{year} {make} {model}"
+    :return: tuple of str
+    """
+    fields = []
+    for _, field, _, _ in string.Formatter().parse(template):
+        if field is not None:
+            if not field.isidentifier() or keyword.iskeyword(field):
+                raise ValueError(f"Template fields must be attribute names, got {field!r}.")
+            if field not in fields:
+                fields.append(field)
+    return tuple(fields)
+
+
+def make_formatters(template, fields):
+    """
+    Write two functions that format a whole batch of records with one f-string per line: one takes objects and reads
+    their attributes, the other takes tuples of values in the order of fields.
+    :param template: str, like "{year} {make} {model}"
+    :param fields: tuple of str, every field in template must be in it
+    :return: (function(records) -> str, function(rows) -> str)
+    """
+    by_attribute = []
+    by_position = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        literal = literal.replace("{", "{{").replace("}", "}}")
+        by_attribute.append(literal)
+        by_position.append(literal)
+        if field is not None:
+            suffix = (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "")
+            by_attribute.append(f"{{record.{field}{suffix}}}")
+            by_position.append(f"{{_{fields.index(field)}{suffix}}}")
+    # repr() turns the line into a valid string literal, quotes and backslashes included.
+    attribute_line = "f" + repr("".join(by_attribute) + "\n")
+    position_line = "f" + repr("".join(by_position) + "\n")
+    # The trailing comma keeps a single field unpacking as a tuple: "for _0, in rows".
+    targets = ", ".join(f"_{i}" for i in range(len(fields))) + ","
+    source = (
+        "def format_records(records):\n"
+        f"    return ''.join([{attribute_line} for record in records])\n"
+        "def format_rows(rows):\n"
+        f"    return ''.join([{position_line} for {targets} in rows])\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["format_records"], namespace["format_rows"]
+
+
+class Renderer:
+    """ Formats records as text lines, CSV or JSON Lines and writes them in large pieces. """
+
+    def __init__(self, template, fields=None, format="text", buffer_size=DEFAULT_BUFFER_SIZE, header=True):
+        """
+        :param template: str, the line for one record, like "{name} is {age} years old."
+        :param fields: tuple of str, the columns for csv and jsonl, defaults to the fields in template
+        :param format: str, "text", "csv" or "jsonl"
+        :param buffer_size: int, characters to collect before each write, None to write everything at once
+        :param header: bool, write a header row for csv
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}. Must be one of {FORMATS}.")
+        self.template = template
+        self.fields = tuple(fields) if fields is not None else template_fields(template)
+        self.format = format
+        self.buffer_size = buffer_size
+        self.header = header
+        if format == "text":
+            missing = set(template_fields(template)) - set(self.fields)
+            if missing:
+                raise ValueError(f"Template uses fields {sorted(missing)} that aren't in fields.")
+            self._format_records, self._format_rows = make_formatters(template, self.fields)
+
+    def rows(self, records):
+        """
+        The values of self.fields for every record, as tuples.
+        :param records: iterable of objects, or an object with a column(field) method
+        :return: iterator of tuples
+        """
+        if hasattr(records, "column"):
+            return zip(*(records.column(field) for field in self.fields))
+        getter = operator.attrgetter(*self.fields)
+        if len(self.fields) == 1:
+            return ((getter(record),) for record in records)
+        return map(getter, records)
+
+    def render(self, records, file=None):
+        """
+        Write every record to file.
+        :param records: iterable of objects, or an object with a column(field) method
+        :param file: object with a write method, defaults to sys.stdout
+        :return: int, number of records written
+        """
+        file = sys.stdout if file is None else file
+        count = 0
+        for text, rows in self._pieces(records):
+            file.write(text)
+            count += rows
+        return count
+
+    def _pieces(self, records):
+        """ Yields (text, number of records in it), each text at least buffer_size characters except the last. """
+        if self.format == "text":
+            if hasattr(records, "column"):
+                format_batch, batches = self._format_rows, chunked(self.rows(records), BATCH_ROWS)
+            else:
+                format_batch, batches = self._format_records, chunked(records, BATCH_ROWS)
+            batches = ((format_batch(batch), len(batch)) for batch in batches)
+        elif self.format == "csv":
+            batches = self._csv_batches(self.rows(records))
+        else:
+            batches = self._jsonl_batches(self.rows(records))
+
+        pending = []
+        pending_size = pending_rows = 0
+        for text, batch_rows in batches:
+            pending.append(text)
+            pending_size += len(text)
+            pending_rows += batch_rows
+            if self.buffer_size is not None and pending_size >= self.buffer_size:
+                yield "".join(pending), pending_rows
+                pending = []
+                pending_size = pending_rows = 0
+        if pending:
+            yield "".join(pending), pending_rows
+
+    def _csv_batches(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if self.header:
+            writer.writerow(self.fields)
+            yield buffer.getvalue(), 0
+        for batch in chunked(rows, BATCH_ROWS):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(batch)
+            yield buffer.getvalue(), len(batch)
+
+    def _jsonl_batches(self, rows):
+        encode = json.JSONEncoder().encode
+        fields = self.fields
+        for batch in chunked(rows, BATCH_ROWS):
+            lines = [encode(dict(zip(fields, row))) for row in batch]
+            lines.append("")
+            yield "\n".join(lines), len(batch)
+
+
+def render_cars(cars, show_all=True, file=None, format="text", buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Car.display_info(show_all) for many cars at once.
+    :param cars: iterable of Car-like objects, or a CarFleet
+    :param show_all: bool, every field, or only year, make and model
+    :param file: object with a write method, defaults to sys.stdout
+    :param format: str, "text", "csv" or "jsonl"
+    :param buffer_size: int, characters to collect before each write, None to write everything at once
+    :return: int, number of cars written
+    """
+    return Renderer(CAR_TEMPLATES[bool(show_all)], format=format, buffer_size=buffer_size).render(cars, file)
+
+
+def render_people(people, file=None, format="text", buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Person.display() for many people at once.
+    :param people: iterable of Person-like objects, or a column store of people
+    :param file: object with a write method, defaults to sys.stdout
+    :param format: str, "text", "csv" or "jsonl"
+    :param buffer_size: int, characters to collect before each write, None to write everything at once
+    :return: int, number of people written
+    """
+    return Renderer(PERSON_TEMPLATE, format=format, buffer_size=buffer_size).render(people, file)
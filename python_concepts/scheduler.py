@@ -0,0 +1,186 @@
+# Worker Pool Scheduler
+
+# Every example in threading_basics.py creates a brand new threading.Thread for every piece of work,
+# and controls the order things run in by placing .join() calls by hand (x.join() before y.start() to make x run first).
+# That is fine for two threads, but creating a thread per task gets expensive when there are thousands of tasks,
+# and with no limit on how many threads get created a burst of work can use up all of the memory.
+
+# WorkerPool fixes both problems:
+#   - A fixed number of worker threads are created once and reused for every task.
+#   - At most max_pending tasks can be waiting or running at the same time. When the pool is full,
+#     submit() blocks until a task finishes (this is called backpressure), or raises queue.Full if a timeout runs out.
+#   - submit() returns a concurrent.futures.Future, so you can wait for the result of a task, and if the
+#     task raised an exception, calling .result() raises that same exception in your thread.
+#   - submit(..., after=[other_future]) only runs the task once every task it depends on has finished,
+#     which replaces the hand-placed .join() calls.
+
+#   with WorkerPool(workers=2) as pool:
+#       x = pool.submit(count, 10)
+#       y = pool.submit(count, 10, after=[x])  # y starts only when x is done
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import collections
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class DependencyError(Exception):
+    """ Raised for a task that never ran because a task it depends on failed or was cancelled. """
+
+
+class WorkerPool:
+    """ A fixed size pool of worker threads with a bounded number of pending tasks. """
+
+    def __init__(self, workers=4, max_pending=1024, name="worker"):
+        """
+        :param workers: int, number of threads in the pool
+        :param max_pending: int, how many submitted tasks may be unfinished before submit() blocks
+        :param name: str, prefix for the worker thread names
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+
+        # The queue itself never blocks. The slots semaphore is what limits the number of unfinished tasks, which means
+        # a task whose dependencies just finished can always be queued, even from inside a worker thread.
+        self._tasks = queue.SimpleQueue()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._unfinished = 0
+        self._idle = threading.Condition()
+        self._shutdown = False
+
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True) for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown(wait=True)
+
+    def submit(self, func, *args, after=(), timeout=None, **kwargs):
+        """
+        Schedule func(*args, **kwargs) to run on the pool.
+        :param func: function
+        :param after: iterable of Futures that must finish successfully before func runs
+        :param timeout: float, seconds to wait for a free slot. None waits forever.
+        :return: Future
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot submit tasks after shutdown.")
+        if not self._slots.acquire(timeout=timeout):
+            raise queue.Full("No free slot in the worker pool.")
+
+        with self._idle:
+            self._unfinished += 1
+
+        future = Future()
+        task = (future, func, args, kwargs)
+        dependencies = list(after)
+        if dependencies:
+            self._queue_after(task, dependencies)
+        else:
+            self._tasks.put(task)
+        return future
+
+    def map(self, func, iterable):
+        """
+        Like the builtin map, but every call runs on the pool. Results are yielded in input order.
+        Only max_pending calls are submitted ahead of the results being read, so iterable can be very long.
+        :param func: function
+        :param iterable: iterable of arguments, func is called with one at a time
+        :return: generator
+        """
+        pending = collections.deque()
+        for item in iterable:
+            # Non-blocking submit first, so that a full pool hands back finished results before blocking.
+            while pending:
+                try:
+                    pending.append(self.submit(func, item, timeout=0))
+                    break
+                except queue.Full:
+                    yield pending.popleft().result()
+            else:
+                pending.append(self.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
+
+    def _queue_after(self, task, dependencies):
+        """ Put task on the queue once every dependency is done, or fail it if one of them failed. """
+        future = task[0]
+        state = {"remaining": len(dependencies), "settled": False}
+        lock = threading.Lock()
+
+        def on_dependency_done(dependency):
+            failed = dependency.cancelled() or dependency.exception() is not None
+            with lock:
+                # Only the first failed dependency, or the last successful one, decides what happens to the task.
+                if state["settled"]:
+                    return
+                state["remaining"] -= 1
+                if not failed and state["remaining"]:
+                    return
+                state["settled"] = True
+
+            if not failed:
+                self._tasks.put(task)
+                return
+            if future.set_running_or_notify_cancel():
+                error = DependencyError("A task this task depends on did not succeed.")
+                error.__cause__ = None if dependency.cancelled() else dependency.exception()
+                future.set_exception(error)
+            self._task_done()
+
+        for dependency in dependencies:
+            dependency.add_done_callback(on_dependency_done)
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, func, args, kwargs = task
+            # Returns False if the future was cancelled while it was waiting in the queue.
+            if not future.set_running_or_notify_cancel():
+                self._task_done()
+                continue
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+            self._task_done()
+
+    def _task_done(self):
+        self._slots.release()
+        with self._idle:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._idle.notify_all()
+
+    def wait(self):
+        """ Block until every submitted task has finished. """
+        with self._idle:
+            self._idle.wait_for(lambda: self._unfinished == 0)
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting tasks. With wait=True, finish every submitted task (including ones waiting on dependencies)
+        and then stop the worker threads.
+        :param wait: bool
+        """
+        self._shutdown = True
+        if wait:
+            self.wait()
+        for _ in self._threads:
+            self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,234 @@
+# Section Checks
+
+# The tutorials show the expected output of a print() call in a comment on the same line:
+
+#   print(list(odd_nums)) # [1, 3, 5, 7, 9]
+
+# check_sections runs every section in its own fresh interpreter and checks that those comments are still true.
+# Running each section in a separate process means one section can't see the threads, globals or imports another
+# section left behind, a section that hangs is killed after a timeout, and sections can run at the same time.
+# Most of the run time of the tutorials is threading_basics sleeping, so with enough workers checking every
+# section takes about as long as the slowest section instead of the sum of all of them.
+
+# The expected output comments are matched in order against the lines the section printed, other printed lines
+# are skipped. Memory addresses like 0x105113370 match any address and __main__. matches any module path,
+# because they change from run to run. Sections marked @section(deterministic=False) print lists whose order
+# depends on how the threads were scheduled, so there a list matches if it has the same items in any order.
+
+# From the command line: python -m python_concepts.tutorials --check [tutorial [sections...]]
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import ast
+import inspect
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from python_concepts.sections import load_sections
+
+# Sections mostly sleep, so more of them than CPU cores can run at the same time.
+DEFAULT_JOBS = max(8, 2 * (os.cpu_count() or 1))
+DEFAULT_TIMEOUT = 60.0
+
+# The child process writes its measurements to stderr on a line starting with this marker.
+STATS_MARKER = "@@section-stats "
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def expected_output(func):
+    """
+    The expected output comments of a section, in the order they appear in its source.
+    :param func: section function
+    :return: list of str
+    """
+    source = inspect.getsource(func)
+    printing_lines = set()
+    comments = {}
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.NAME and token.string == "print":
+            printing_lines.add(token.start[0])
+        elif token.type == tokenize.COMMENT:
+            comments[token.start[0]] = token.string.lstrip("#").strip()
+    return [comments[line] for line in sorted(comments) if line in printing_lines]
+
+
+def _pattern(expected):
+    pattern = re.escape(expected)
+    pattern = re.sub(r"0x[0-9a-fA-F]+", "0x[0-9a-fA-F]+", pattern)
+    return re.compile(pattern.replace(re.escape("__main__."), r"[\w.<>]+\."))
+
+
+def _same_items(expected, line):
+    try:
+        expected, actual = ast.literal_eval(expected), ast.literal_eval(line)
+    except (ValueError, SyntaxError):
+        return False
+    if not isinstance(expected, (list, tuple)) or type(expected) is not type(actual):
+        return False
+    return sorted(expected, key=repr) == sorted(actual, key=repr)
+
+
+def missing_output(expected, output, deterministic=True):
+    """
+    Match expected output comments in order against printed lines.
+    :param expected: list of str, from expected_output
+    :param output: str, everything the section printed
+    :param deterministic: bool, False to also accept lists with the same items in another order
+    :return: list of str, the expected lines that weren't found
+    """
+    lines = [line.strip() for line in output.splitlines()]
+    position = 0
+    for index, text in enumerate(expected):
+        pattern = _pattern(text)
+        for offset, line in enumerate(lines[position:]):
+            if pattern.fullmatch(line) or (not deterministic and _same_items(text, line)):
+                position += offset + 1
+                break
+        else:
+            return expected[index:]
+    return []
+
+
+class SectionResult:
+    """ What happened when one section ran in its own process. """
+
+    def __init__(self, section, status, seconds=None, peak_bytes=None, expected=(), missing=(), stdout="", stderr=""):
+        self.section = section
+        self.status = status  # "ok", "failed", "error" or "timeout"
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+        self.expected = list(expected)
+        self.missing = list(missing)
+        self.stdout = stdout
+        self.stderr = stderr
+
+    def __repr__(self):
+        return f"SectionResult({self.section.label!r}, {self.status!r}, seconds={self.seconds})"
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+def _peak_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes everywhere else
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_isolated(module_name, number):
+    """
+    Entry point of the child process: run one section and write its run time and peak memory to stderr.
+    :param module_name: str
+    :param number: int, section number
+    """
+    current = load_sections(module_name)[number - 1]
+    start = time.perf_counter()
+    current.run()
+    seconds = time.perf_counter() - start
+    sys.stdout.flush()
+    sys.stderr.write(STATS_MARKER + json.dumps({"seconds": seconds, "peak_bytes": _peak_bytes()}) + "\n")
+
+
+def check_section(section, timeout=DEFAULT_TIMEOUT):
+    """
+    Run a section in a new interpreter and compare what it printed with its expected output comments.
+    :param section: Section
+    :param timeout: float, seconds before the process is killed
+    :return: SectionResult
+    """
+    expected = expected_output(section.func)
+    code = f"from python_concepts.section_checks import run_isolated; run_isolated({section.module!r}, {section.number})"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [_PACKAGE_ROOT, os.environ.get("PYTHONPATH")])))
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=timeout, env=env,
+        )
+    except subprocess.TimeoutExpired as error:
+        stdout = error.stdout.decode() if isinstance(error.stdout, bytes) else error.stdout or ""
+        return SectionResult(section, "timeout", timeout, expected=expected, missing=expected, stdout=stdout)
+
+    stats = {"seconds": time.perf_counter() - start, "peak_bytes": None}
+    stderr_lines = []
+    for line in process.stderr.splitlines():
+        if line.startswith(STATS_MARKER):
+            stats = json.loads(line[len(STATS_MARKER):])
+        else:
+            stderr_lines.append(line)
+    stderr = "\n".join(stderr_lines)
+
+    if process.returncode != 0:
+        status, missing = "error", expected
+    else:
+        missing = missing_output(expected, process.stdout, section.deterministic)
+        status = "failed" if missing else "ok"
+    return SectionResult(section, status, stats["seconds"], stats["peak_bytes"], expected, missing, process.stdout, stderr)
+
+
+def check_sections(sections, jobs=DEFAULT_JOBS, timeout=DEFAULT_TIMEOUT):
+    """
+    Check sections in parallel, each one in its own process.
+    :param sections: list of Section
+    :param jobs: int, how many sections run at the same time
+    :param timeout: float, seconds before a section's process is killed
+    :return: list of SectionResult, in the same order as sections
+    """
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        return list(executor.map(lambda current: check_section(current, timeout), sections))
+
+
+def print_report(results, elapsed, file=None):
+    """
+    Print one line per section with its status, run time and peak memory, then the details of any failures.
+    :param results: list of SectionResult
+    :param elapsed: float, wall time of the whole check in seconds
+    :param file: file to print to, sys.stdout by default
+    """
+    file = file or sys.stdout
+    rows = [["section", "status", "seconds", "peak MB", "expected"]]
+    for result in results:
+        rows.append([
+            result.section.label,
+            result.status,
+            "-" if result.seconds is None else f"{result.seconds:.3f}",
+            "-" if result.peak_bytes is None else f"{result.peak_bytes / 2 ** 20:.1f}",
+            f"{len(result.expected) - len(result.missing)}/{len(result.expected)}",
+        ])
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip(), file=file)
+
+    total = sum(result.seconds or 0 for result in results)
+    slowest = max(results, key=lambda result: result.seconds or 0, default=None)
+    print(file=file)
+    print(f"{sum(result.ok for result in results)}/{len(results)} sections ok in {elapsed:.2f}s "
+          f"(sections add up to {total:.2f}s, slowest {slowest.section.label if slowest else '-'} "
+          f"{slowest.seconds if slowest else 0:.2f}s)", file=file)
+
+    for result in results:
+        if result.ok:
+            continue
+        print(f"\n-=-=- {result.section.label}: {result.status} -=-=-", file=file)
+        for text in result.missing:
+            print(f"  missing: {text}", file=file)
+        if result.status == "failed":
+            for line in result.stdout.splitlines():
+                print(f"  printed: {line}", file=file)
+        if result.stderr:
+            print(result.stderr, file=file)
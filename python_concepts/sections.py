@@ -0,0 +1,106 @@
+# Tutorial Sections
+
+# The tutorial files in python_concepts/tutorials are split into sections by -=-=-=- lines. The example code of
+# every section lives in a function marked with @section, so importing a tutorial only defines its functions and
+# classes: nothing is printed, nothing sleeps and no threads are started until a section is run.
+
+#   @section
+#   def repr_method():
+#       my_car = Car("Jeep", "Wrangler")
+#       print(my_car) # Car('Jeep', 'Wrangler')
+
+# Sections are numbered from 1 in the order they appear in their file, and can be picked by number or by name:
+
+#   run_sections("python_concepts.tutorials.dunder_methods", ["2", "call_method"])
+
+# or from the command line with python -m python_concepts.tutorials (see tutorials/__main__.py).
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import importlib
+import sys
+
+# module name -> list of Section, in the order they were defined
+_SECTIONS = {}
+
+
+class Section:
+    """ One section of a tutorial file. """
+
+    def __init__(self, module, name, number, func, deterministic=True):
+        self.module = module
+        self.name = name
+        self.number = number
+        self.func = func
+        self.deterministic = deterministic
+
+    def __repr__(self):
+        return f"Section({self.module!r}, {self.number}, {self.name!r})"
+
+    @property
+    def label(self):
+        """ module:number:name, the way sections are shown by the runner. """
+        return f"{self.module.rsplit('.', 1)[-1]}:{self.number}:{self.name}"
+
+    def run(self):
+        self.func()
+
+
+def section(func=None, *, deterministic=True):
+    """
+    Register a function as the next section of the module it's defined in. Use @section(deterministic=False)
+    for sections whose output depends on how threads were scheduled.
+    :param func: function that takes no arguments
+    :param deterministic: bool, False if the order of the printed values can change from run to run
+    :return: func, unchanged
+    """
+    if func is None:
+        return lambda func: section(func, deterministic=deterministic)
+    sections = _SECTIONS.setdefault(func.__module__, [])
+    sections.append(Section(func.__module__, func.__name__, len(sections) + 1, func, deterministic))
+    return func
+
+
+def load_sections(module_name):
+    """
+    Import a tutorial module (if it isn't imported yet) and return its sections.
+    :param module_name: str, like "python_concepts.tutorials.dunder_methods"
+    :return: list of Section
+    """
+    if module_name not in sys.modules:
+        importlib.import_module(module_name)
+    return list(_SECTIONS.get(module_name, ()))
+
+
+def select_sections(sections, selectors=()):
+    """
+    Pick sections by number or name. No selectors picks all of them.
+    :param sections: list of Section
+    :param selectors: iterable of str or int, like ["2", "call_method"]
+    :return: list of Section
+    """
+    selected = []
+    for selector in selectors:
+        selector = str(selector)
+        matches = [s for s in sections if selector == str(s.number) or selector == s.name]
+        if not matches:
+            names = ", ".join(f"{s.number}/{s.name}" for s in sections)
+            raise LookupError(f"No section {selector!r}. Sections are: {names}.")
+        selected.extend(matches)
+    return selected if selected else list(sections)
+
+
+def run_sections(module_name, selectors=(), headers=False):
+    """
+    Run sections of a tutorial module.
+    :param module_name: str
+    :param selectors: iterable of str or int, the sections to run, all of them if empty
+    :param headers: bool, print a line with the section's name before each section
+    :return: list of Section that were run
+    """
+    sections = select_sections(load_sections(module_name), selectors)
+    for current in sections:
+        if headers:
+            print(f"-=-=- {current.label} -=-=-", flush=True)
+        current.run()
+    return sections
@@ -0,0 +1,297 @@
+# Shared Memory Accumulators
+
+# The add_first_half/add_second_half example in threading_basics.py runs on threads, and because of the GIL only
+# one of them can run Python code at a time, so it never gets faster than one core. Processes can use every core,
+# but every process has its own memory: a global `total` updated in a child process doesn't change the parent's.
+# The usual fix is a process pool that pickles each worker's result and sends it back to the parent
+# (reduction.parallel_sum(..., backend="process")), which costs a round trip through a pipe for every result.
+
+# The classes below put the numbers in a multiprocessing.shared_memory block instead. Every process maps the same
+# memory, so a worker writes its partial sum straight into it and the parent reads it after join(). Nothing is
+# pickled except the name of the block.
+
+#   SharedInts    - a fixed length array of 64-bit integers in shared memory. The process version of the
+#                   partial_totals = [0, 0] list from threading_basics.py: worker i writes partial_totals[i].
+#   SharedCounter - the accumulator interface from accumulators.py (add() and value), so it can be passed to
+#                   add_range in place of a ThreadLocalCounter. Every thread of every process adds into its own
+#                   slot, so no locks are needed when adding, only once per thread to claim a slot.
+#   Process       - a multiprocessing.Process with the same start()/join() interface as threading.Thread, whose
+#                   join() raises WorkerCrashed when the process died, so a crash can't silently give a wrong total.
+
+#   with SharedInts(2) as partial_totals:
+#       x = Process(target=add_numbers, args=(partial_totals, 0, range(500001)))
+#       y = Process(target=add_numbers, args=(partial_totals, 1, range(500001, 1000001)))
+#       x.start(); y.start(); x.join(); y.join()
+#       print(partial_totals.sum())  # 500000500000
+
+# Shared memory blocks outlive the processes that use them until someone unlinks them. The process that creates a
+# block owns it and unlinks it when the with block ends, when close() is called, when the object is garbage
+# collected or when the interpreter exits, whichever comes first, even if a worker crashed. If the owner itself is
+# killed, Python's resource tracker unlinks the block, and cleanup_stale_segments() removes any block whose owner
+# is no longer running. Values are 64-bit signed integers, so every partial result must stay below 2 ** 63.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import multiprocessing
+import os
+import secrets
+import threading
+import weakref
+from array import array
+from multiprocessing import shared_memory
+
+from python_concepts.reduction import default_workers, partition
+
+# Every block this module creates is called NAME_PREFIX + owner pid + "_" + random hex,
+# so cleanup_stale_segments can tell whose block it is.
+NAME_PREFIX = "pc_shared_"
+ITEM_SIZE = 8  # bytes per int64
+
+# Slots of a SharedCounter are one cache line apart, so two cores never write to the same cache line.
+SLOT_STRIDE = 64 // ITEM_SIZE
+
+_SHM_DIRECTORY = "/dev/shm"
+
+
+class WorkerCrashed(RuntimeError):
+    """ Raised by Process.join() when the worker process exited with an error or was killed. """
+
+
+def _open_block(name):
+    # Python 3.13+ can attach without registering the block with the resource tracker a second time.
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _release(cells, block, owner_pid):
+    # Runs from close() or from weakref.finalize. The memoryview has to be released before the block can be closed.
+    cells.release()
+    block.close()
+    # A forked child has a copy of the owner's object, but only the owner process itself unlinks the block.
+    if owner_pid == os.getpid():
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedInts:
+    """ A fixed length array of 64-bit signed integers in shared memory, starting out as zeros. """
+
+    def __init__(self, length, _name=None):
+        if length < 1:
+            raise ValueError("length must be at least 1.")
+        self.length = length
+        self.owner = _name is None
+        if self.owner:
+            name = f"{NAME_PREFIX}{os.getpid()}_{secrets.token_hex(4)}"
+            self._block = shared_memory.SharedMemory(name=name, create=True, size=length * ITEM_SIZE)
+        else:
+            self._block = _open_block(_name)
+        self.name = self._block.name
+        # SharedMemory can round the size up to a whole page, only the first `length` items are ours.
+        self._cells = self._block.buf[:length * ITEM_SIZE].cast("q")
+        if self.owner:
+            self._cells[:] = array("q", bytes(length * ITEM_SIZE))
+        self._finalizer = weakref.finalize(self, _release, self._cells, self._block, os.getpid() if self.owner else None)
+
+    def __reduce__(self):
+        # Only the name is sent to another process, which attaches to the same block without owning it.
+        return (_attach, (type(self), self.name, self.length))
+
+    def __repr__(self):
+        state = "closed" if self.closed else f"{self.tolist()}"
+        return f"<{type(self).__name__} {self.name} {state}>"
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        return self._cells[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = array("q", value)
+        self._cells[index] = value
+
+    def tolist(self):
+        return self._cells.tolist()
+
+    def sum(self):
+        return sum(self._cells)
+
+    @property
+    def closed(self):
+        return not self._finalizer.alive
+
+    def close(self):
+        """ Stop using the block. The owner also unlinks it, after which no other process can attach to it. """
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _attach(cls, name, length):
+    return cls(length, _name=name)
+
+
+# Updated in every forked child, so a SharedCounter can tell that it was copied into a new process.
+_current_pid = os.getpid()
+
+
+def _after_fork():
+    global _current_pid
+    _current_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+class SharedCounter(SharedInts):
+    """
+    A counter that threads in any number of processes can add to at the same time. Every thread claims its own slot
+    the first time it adds, and value adds all of the slots up. A slot stays claimed after its thread ends, so the
+    counter needs one slot for every thread that ever adds to it.
+    """
+
+    def __init__(self, processes=None, initial=0, context=None, _name=None, _length=None):
+        """
+        :param processes: int, how many threads besides this one can add (counting the threads of every process),
+                          defaults to the number of CPU cores
+        :param initial: int
+        :param context: multiprocessing context the worker processes are started from, like
+                        multiprocessing.get_context("spawn"). The default context if None.
+        """
+        processes = processes or default_workers()
+        # Item 0 holds the number of claimed slots. The owner's slot starts one stride later,
+        # followed by one slot for each of the other processes.
+        super().__init__(_length or (processes + 2) * SLOT_STRIDE, _name=_name)
+        self.processes = self.length // SLOT_STRIDE - 2
+        # (pid, slot) of the current thread. The pid tells a forked child, whose thread starts out with a copy
+        # of the parent's thread local, that the slot isn't its own.
+        self._local = threading.local()
+        if self.owner:
+            self._cells[SLOT_STRIDE] = initial
+            # The thread that created the counter has slot 1, so that the initial value is in there.
+            self._cells[0] = 1
+            self._local.claimed = (_current_pid, SLOT_STRIDE)
+            self._claim_lock = (context or multiprocessing).Lock()
+
+    def __reduce__(self):
+        return (_attach_counter, (self.name, self.length, self._claim_lock))
+
+    def _claim_slot(self):
+        with self._claim_lock:
+            claimed = self._cells[0]
+            if claimed >= self.processes + 1:
+                raise RuntimeError(f"More than {self.processes} other threads added to this SharedCounter.")
+            self._cells[0] = claimed + 1
+        slot = (claimed + 1) * SLOT_STRIDE
+        self._local.claimed = (_current_pid, slot)
+        return slot
+
+    def add(self, amount=1):
+        claimed = getattr(self._local, "claimed", None)
+        slot = claimed[1] if claimed is not None and claimed[0] == _current_pid else self._claim_slot()
+        # Only this thread ever writes to its slot, so no lock is needed here.
+        self._cells[slot] += amount
+
+    @property
+    def value(self):
+        """ The total. Exact once every process that called add() has finished. """
+        cells = self._cells
+        return sum(cells[slot] for slot in range(SLOT_STRIDE, self.length, SLOT_STRIDE))
+
+
+def _attach_counter(name, length, claim_lock):
+    counter = SharedCounter(_name=name, _length=length)
+    counter._claim_lock = claim_lock
+    return counter
+
+
+class Process(multiprocessing.Process):
+    """
+    A worker process with the start()/join() interface of threading.Thread. join() raises WorkerCrashed if the
+    process exited with an error or was killed, instead of letting the parent read a half finished result.
+    """
+
+    def join(self, timeout=None):
+        super().join(timeout)
+        if self.exitcode not in (0, None):
+            raise WorkerCrashed(f"{self.name} exited with code {self.exitcode}.")
+
+
+def cleanup_stale_segments():
+    """
+    Unlink the shared memory blocks created by this module whose owner process is no longer running.
+    Only works where shared memory blocks show up as files in /dev/shm (Linux).
+    :return: list of str, names of the removed blocks
+    """
+    if not os.path.isdir(_SHM_DIRECTORY):
+        return []
+    removed = []
+    for name in os.listdir(_SHM_DIRECTORY):
+        if not name.startswith(NAME_PREFIX):
+            continue
+        try:
+            pid = int(name[len(NAME_PREFIX):].split("_")[0])
+            os.kill(pid, 0)
+            continue  # the owner is still running
+        except ProcessLookupError:
+            pass
+        except (ValueError, PermissionError):
+            continue
+        try:
+            os.unlink(os.path.join(_SHM_DIRECTORY, name))
+            removed.append(name)
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Sums
+
+# These run inside the worker processes, so they have to be module level functions.
+def add_numbers(partials, index, numbers):
+    """
+    The loop from add_first_half/add_second_half, storing its total in partials[index].
+    :param partials: SharedInts
+    :param index: int
+    :param numbers: iterable of int
+    """
+    total = 0
+    for num in numbers:
+        total += num
+    partials[index] = total
+
+
+def shared_memory_sum(data, workers=None, chunk_func=add_numbers):
+    """
+    Add up the numbers in data on `workers` processes that each write their partial sum into shared memory.
+    :param data: range, list, tuple or any other iterable of int
+    :param workers: int, defaults to the number of CPU cores
+    :param chunk_func: module level function called as chunk_func(partials, index, piece)
+    :return: int
+    """
+    pieces = partition(data, workers or default_workers())
+    with SharedInts(len(pieces)) as partials:
+        processes = [Process(target=chunk_func, args=(partials, i, piece)) for i, piece in enumerate(pieces)]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.kill()
+                    multiprocessing.Process.join(process)
+        return partials.sum()
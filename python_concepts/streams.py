@@ -0,0 +1,250 @@
+# Streams
+
+# Every example in map_and_filter_functions.py and lambda_functions.py wraps the result in list(...), which means
+# every element has to be in memory at the same time. That doesn't work when the input never ends (lines from a
+# file, messages from a socket) or is bigger than the memory you have.
+
+# map_and_filter_functions.py also shows a sneaky problem: after print(list(doubled_nums)) the map object is used up,
+# so the for loop right after it prints nothing at all, without any error. A Stream raises StreamConsumedError instead.
+# If you really want to read the same data more than once, you have to say so with tee() or replayable().
+
+#   numbers = Stream(read_numbers_from_socket())
+#   for batch in numbers.filter(X % 2 != 0).map(X + 7).batch(1000):
+#       save(batch)
+
+# Streams only ever hold a bounded number of elements in memory:
+#   map/filter  - one element at a time. Consecutive map/filter stages are fused into one Pipeline loop
+#                 (see python_concepts/pipeline.py), so they can be expressions built from X or normal functions.
+#   batch(n)    - lists of n elements.
+#   window(n)   - sliding windows of the last n elements.
+#   buffer(n)   - runs everything before it on a background thread, with at most n elements waiting to be read.
+#                 If the reader is slower than the producer, the producer waits (backpressure) instead of piling up memory.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import collections
+import itertools
+import queue
+import threading
+
+from python_concepts.parallel import chunked
+from python_concepts.pipeline import Pipeline
+
+
+class StreamConsumedError(RuntimeError):
+    """ Raised when a stream that has already been read (or built on) is read again. """
+
+
+class Stream:
+    """ A single use, lazy sequence of elements. Every method returns a new stream that reads from this one. """
+
+    def __init__(self, source, pipeline=None):
+        """
+        :param source: any iterable
+        :param pipeline: Pipeline of map/filter stages still to apply to source
+        """
+        self._source = source
+        self._pipeline = pipeline
+        self._claimed = False
+
+    def _claim(self):
+        # A stream can only be read, or used to build another stream, once.
+        if self._claimed:
+            raise StreamConsumedError(
+                "This stream has already been read. Use tee() or replayable() to read the same data more than once."
+            )
+        self._claimed = True
+
+    def __iter__(self):
+        self._claim()
+        return self._unclaimed_iter()
+
+    def _then(self, generator_function, *args):
+        """ A new stream made by passing this stream through generator_function. """
+        self._claim()
+        return Stream(generator_function(self._unclaimed_iter(), *args))
+
+    def _unclaimed_iter(self):
+        # Like iter(self), for use once _claim() has already been called.
+        if self._pipeline is None:
+            return iter(self._source)
+        return self._pipeline.iterate(self._source)
+
+    # Map and filter
+
+    def map(self, func):
+        """
+        Replace every element with func(element).
+        :param func: function or expression built from X
+        :return: Stream
+        """
+        self._claim()
+        return Stream(self._source, (self._pipeline or Pipeline()).map(func))
+
+    def filter(self, func):
+        """
+        Only keep the elements for which func(element) is true.
+        :param func: function or expression built from X
+        :return: Stream
+        """
+        self._claim()
+        return Stream(self._source, (self._pipeline or Pipeline()).filter(func))
+
+    # Grouping
+
+    def batch(self, size):
+        """
+        Group the elements into lists of size elements. The last list may be shorter.
+        :param size: int
+        :return: Stream of lists
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        return self._then(chunked, size)
+
+    def window(self, size, step=1):
+        """
+        Sliding windows of size elements, moving step elements at a time. Windows are tuples.
+        Elements left over at the end that don't fill a whole window are dropped.
+        :param size: int
+        :param step: int
+        :return: Stream of tuples
+        """
+        if size < 1 or step < 1:
+            raise ValueError("size and step must be at least 1.")
+        return self._then(_windows, size, step)
+
+    def take(self, count):
+        """
+        Only the first count elements.
+        :param count: int
+        :return: Stream
+        """
+        return self._then(itertools.islice, count)
+
+    # Flow control
+
+    def buffer(self, size=1024):
+        """
+        Run this stream on a background thread, keeping at most size elements ready for the reader.
+        :param size: int
+        :return: Stream
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        return self._then(_buffered, size)
+
+    # Reading more than once
+
+    def tee(self, count=2):
+        """
+        Split the stream into count independent streams that each see every element.
+        Elements are kept in memory until every one of the streams has read them, so the streams should be
+        read at about the same pace (for example in lockstep with zip()).
+        :param count: int
+        :return: tuple of Streams
+        """
+        self._claim()
+        return tuple(Stream(branch) for branch in itertools.tee(self._unclaimed_iter(), count))
+
+    def replayable(self, max_items=None):
+        """
+        An iterable that can be looped over any number of times. Elements are remembered as they are first read.
+        :param max_items: int, raise BufferError instead of remembering more than this many elements
+        :return: Replayable
+        """
+        self._claim()
+        return Replayable(self._unclaimed_iter(), max_items)
+
+    # Consuming
+
+    def collect(self):
+        """ Read the whole stream into a list. Only for streams that are known to be finite. """
+        return list(self)
+
+    def for_each(self, func):
+        """ Call func on every element. """
+        for item in self:
+            func(item)
+
+
+class Replayable:
+    """ Wraps an iterator and remembers everything read from it, so it can be iterated over more than once. """
+
+    def __init__(self, iterator, max_items=None):
+        self._iterator = iterator
+        self._seen = []
+        self._max_items = max_items
+        self._exhausted = False
+
+    def __iter__(self):
+        position = 0
+        while True:
+            if position < len(self._seen):
+                yield self._seen[position]
+                position += 1
+                continue
+            if self._exhausted:
+                return
+            try:
+                item = next(self._iterator)
+            except StopIteration:
+                self._exhausted = True
+                return
+            if self._max_items is not None and len(self._seen) >= self._max_items:
+                raise BufferError(f"Replayable stream is longer than max_items={self._max_items}.")
+            self._seen.append(item)
+
+
+def _windows(iterator, size, step):
+    window = collections.deque(itertools.islice(iterator, size), maxlen=size)
+    if len(window) < size:
+        return
+    yield tuple(window)
+    while True:
+        added = list(itertools.islice(iterator, step))
+        window.extend(added)
+        if len(added) < step:
+            return
+        yield tuple(window)
+
+
+# Marks the end of the stream on the buffer's queue.
+_DONE = object()
+
+
+def _buffered(iterator, size):
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def offer(entry):
+        # Wait for room in the queue, but give up if the reader has gone away.
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterator:
+                if not offer((item, None)):
+                    return
+            offer((_DONE, None))
+        except BaseException as error:
+            offer((_DONE, error))
+
+    producer = threading.Thread(target=produce, daemon=True, name="stream-buffer")
+    producer.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
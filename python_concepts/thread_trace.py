@@ -0,0 +1,315 @@
+# Thread Trace
+
+# When the count, thread_func and add_first_half/add_second_half examples in threading_basics.py run,
+# there is no way to see where the time goes: a thread could be doing work, sleeping, waiting in join(),
+# or blocked in lock.acquire() while the other thread holds the lock.
+
+# This module has drop-in replacements for threading.Thread, threading.Lock and time.sleep that record
+# what every thread was doing while tracing is turned on:
+
+#   with tracing("trace.json") as recorder:
+#       lock = Lock()
+#       x = Thread(target=add_first_half, args=(lock,))
+#       ...
+#   print(recorder.summary())
+
+# The JSON file is in the Chrome trace format, so it can be opened in https://ui.perfetto.dev or chrome://tracing
+# to see a timeline with one row per thread. summary() lists the most contended locks (how often a thread had
+# to wait for them and for how long) and how long every thread ran.
+
+# Whether a lock or thread is traced is decided when it is created. While tracing is off, Lock() and Thread()
+# return a plain threading.Lock and threading.Thread, so code that uses them costs exactly the same as before.
+# Traced locks record every acquire and release in their counters, but only waits and holds longer than
+# min_event_us become events on the timeline, otherwise a million uncontended acquires would make the file huge.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_perf_counter_ns = time.perf_counter_ns
+
+# The Recorder that new locks and threads report to, None while tracing is off.
+_recorder = None
+
+
+class Recorder:
+    """ Collects the events and lock counters of one tracing session. """
+
+    def __init__(self, min_event_us=10.0):
+        self.min_event_ns = int(min_event_us * 1000)
+        self.start_ns = _perf_counter_ns()
+        self.end_ns = None
+        self.events = []  # (name, category, thread id, start ns, end ns); list.append is thread safe
+        self.locks = []
+        self.threads = {}  # thread id -> name
+        self._lock_number = 0
+        # The OS reuses thread idents as soon as a thread ends, so threads that run one after another would be
+        # merged into one. Every thread gets its own number instead, stored in a thread local the first time.
+        self._local = threading.local()
+        self._thread_ids = itertools.count(1)
+
+    def _thread_id(self):
+        try:
+            return self._local.tid
+        except AttributeError:
+            tid = self._local.tid = next(self._thread_ids)
+            self.threads[tid] = threading.current_thread().name
+            return tid
+
+    def _add_event(self, name, category, start_ns, end_ns):
+        self.events.append((name, category, self._thread_id(), start_ns, end_ns))
+
+    def _lock_name(self, depth=2):
+        frame = sys._getframe(depth)
+        self._lock_number += 1
+        return f"lock {self._lock_number} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})"
+
+    def to_chrome_trace(self):
+        """
+        The recorded events in the Chrome trace event format.
+        :return: dict, ready for json.dump
+        """
+        pid = os.getpid()
+        trace = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.threads.items()
+        ]
+        for name, category, tid, start_ns, end_ns in self.events:
+            trace.append({
+                "name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                "ts": (start_ns - self.start_ns) / 1000, "dur": (end_ns - start_ns) / 1000,
+            })
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """
+        Write the timeline to a JSON file that Perfetto and chrome://tracing can open.
+        :param path: str
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def lock_stats(self):
+        """
+        Counters of every traced lock, most waited on first.
+        :return: list of dict
+        """
+        stats = [lock.stats() for lock in self.locks]
+        return sorted(stats, key=lambda stat: stat["wait_ns"], reverse=True)
+
+    def summary(self, top=10):
+        """
+        A text report of the most contended locks and of every thread's run time.
+        :param top: int, how many locks to show
+        :return: str
+        """
+        elapsed_ns = (self.end_ns or _perf_counter_ns()) - self.start_ns
+        lines = [f"traced {elapsed_ns / 1e6:,.1f} ms, {len(self.events):,} events, {len(self.locks)} locks, "
+                 f"{len(self.threads)} threads", ""]
+
+        rows = [["lock", "acquires", "contended", "wait ms", "max wait ms", "hold ms", "max hold ms"]]
+        for stat in self.lock_stats()[:top]:
+            contended = stat["contended"] / stat["acquires"] * 100 if stat["acquires"] else 0
+            rows.append([
+                stat["name"], f"{stat['acquires']:,}", f"{stat['contended']:,} ({contended:.1f}%)",
+                f"{stat['wait_ns'] / 1e6:,.2f}", f"{stat['max_wait_ns'] / 1e6:,.2f}",
+                f"{stat['hold_ns'] / 1e6:,.2f}", f"{stat['max_hold_ns'] / 1e6:,.2f}",
+            ])
+
+        run_ns, join_ns, sleep_ns = {}, {}, {}
+        for name, category, tid, start_ns, end_ns in self.events:
+            totals = {"thread": run_ns, "join": join_ns, "sleep": sleep_ns}.get(category)
+            if totals is not None:
+                totals[tid] = totals.get(tid, 0) + end_ns - start_ns
+        thread_rows = [["thread", "run ms", "join ms", "sleep ms"]]
+        for tid, name in self.threads.items():
+            thread_rows.append([name] + [f"{totals.get(tid, 0) / 1e6:,.2f}" for totals in (run_ns, join_ns, sleep_ns)])
+
+        for table in (rows, thread_rows):
+            if len(table) == 1:
+                continue
+            widths = [max(len(row[i]) for row in table) for i in range(len(table[0]))]
+            for row in table:
+                lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+            lines.append("")
+        return "\n".join(lines)
+
+
+class TracedLock:
+    """ A threading.Lock that counts its acquires and measures how long threads waited for it and held it. """
+
+    def __init__(self, recorder, name):
+        self._lock = threading.Lock()
+        self._recorder = recorder
+        self.name = name
+        self.acquires = 0
+        self.contended = 0
+        self.wait_ns = 0
+        self.max_wait_ns = 0
+        self.hold_ns = 0
+        self.max_hold_ns = 0
+        self._acquired_ns = 0
+
+    def __repr__(self):
+        return f"<TracedLock {self.name!r} {'locked' if self._lock.locked() else 'unlocked'}>"
+
+    def acquire(self, blocking=True, timeout=-1):
+        # Try without waiting first, so uncontended acquires only pay for one clock read.
+        if self._lock.acquire(False):
+            now = _perf_counter_ns()
+        elif not blocking:
+            return False
+        else:
+            start = _perf_counter_ns()
+            if not self._lock.acquire(True, timeout):
+                return False
+            now = _perf_counter_ns()
+            wait_ns = now - start
+            # Everything below runs while holding the lock, so the counters need no lock of their own.
+            self.contended += 1
+            self.wait_ns += wait_ns
+            if wait_ns > self.max_wait_ns:
+                self.max_wait_ns = wait_ns
+            if wait_ns >= self._recorder.min_event_ns:
+                self._recorder._add_event(f"wait {self.name}", "lock wait", start, now)
+        self.acquires += 1
+        self._acquired_ns = now
+        return True
+
+    def release(self):
+        now = _perf_counter_ns()
+        hold_ns = now - self._acquired_ns
+        self.hold_ns += hold_ns
+        if hold_ns > self.max_hold_ns:
+            self.max_hold_ns = hold_ns
+        if hold_ns >= self._recorder.min_event_ns:
+            self._recorder._add_event(f"hold {self.name}", "lock hold", self._acquired_ns, now)
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def stats(self):
+        return {
+            "name": self.name, "acquires": self.acquires, "contended": self.contended,
+            "wait_ns": self.wait_ns, "max_wait_ns": self.max_wait_ns,
+            "hold_ns": self.hold_ns, "max_hold_ns": self.max_hold_ns,
+        }
+
+
+class TracedThread(threading.Thread):
+    """ A threading.Thread that records when it ran and how long other threads waited for it in join(). """
+
+    def __init__(self, *args, recorder, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._recorder = recorder
+
+    def run(self):
+        self._recorder._thread_id()
+        start = _perf_counter_ns()
+        try:
+            super().run()
+        finally:
+            self._recorder._add_event(self.name, "thread", start, _perf_counter_ns())
+
+    def join(self, timeout=None):
+        start = _perf_counter_ns()
+        super().join(timeout)
+        end = _perf_counter_ns()
+        if end - start >= self._recorder.min_event_ns:
+            self._recorder._add_event(f"join {self.name}", "join", start, end)
+
+
+def Lock(name=None):
+    """
+    A new lock: a TracedLock while tracing is on, a plain threading.Lock otherwise.
+    :param name: str, shown in the summary and timeline. Defaults to the file and line that created the lock.
+    :return: TracedLock or threading.Lock
+    """
+    recorder = _recorder
+    if recorder is None:
+        return threading.Lock()
+    lock = TracedLock(recorder, name or recorder._lock_name())
+    recorder.locks.append(lock)
+    return lock
+
+
+def Thread(*args, **kwargs):
+    """
+    A new thread, takes the same arguments as threading.Thread: a TracedThread while tracing is on,
+    a plain threading.Thread otherwise.
+    :return: TracedThread or threading.Thread
+    """
+    recorder = _recorder
+    if recorder is None:
+        return threading.Thread(*args, **kwargs)
+    return TracedThread(*args, recorder=recorder, **kwargs)
+
+
+def sleep(seconds):
+    """
+    time.sleep that shows up on the timeline while tracing is on.
+    :param seconds: float
+    """
+    recorder = _recorder
+    if recorder is None:
+        return time.sleep(seconds)
+    start = _perf_counter_ns()
+    time.sleep(seconds)
+    recorder._add_event("sleep", "sleep", start, _perf_counter_ns())
+
+
+def enable(min_event_us=10.0):
+    """
+    Start tracing. Locks and threads created from now on are traced.
+    :param min_event_us: float, shortest lock wait, lock hold or join that is put on the timeline
+    :return: Recorder
+    """
+    global _recorder
+    if _recorder is not None:
+        raise RuntimeError("Tracing is already enabled.")
+    _recorder = Recorder(min_event_us)
+    _recorder._thread_id()
+    return _recorder
+
+
+def disable():
+    """
+    Stop tracing. Locks and threads that were already created keep reporting to the returned Recorder.
+    :return: Recorder, or None if tracing wasn't on
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.end_ns = _perf_counter_ns()
+    return recorder
+
+
+@contextmanager
+def tracing(path=None, min_event_us=10.0):
+    """
+    Trace everything inside a with block, and write the Chrome trace to path at the end if one is given.
+    :param path: str or None
+    :param min_event_us: float
+    :return: Recorder
+    """
+    recorder = enable(min_event_us)
+    try:
+        yield recorder
+    finally:
+        disable()
+        if path is not None:
+            recorder.write_chrome_trace(path)
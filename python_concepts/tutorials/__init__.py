@@ -0,0 +1,22 @@
+# Tutorials
+
+# The tutorial files, one concept per file. Importing a tutorial only defines its functions and classes,
+# the example code is split into sections that run on demand (see python_concepts/sections.py):
+
+#   python -m python_concepts.tutorials                                  list every tutorial and its sections
+#   python -m python_concepts.tutorials dunder_methods                   run all sections of one tutorial
+#   python -m python_concepts.tutorials dunder_methods 2 call_method     run some sections, by number or name
+#   python -m python_concepts.tutorials all                              run every section of every tutorial
+
+# Each file can also still be run by itself: python -m python_concepts.tutorials.dunder_methods
+
+# Tutorial module names, in the order they are listed and run.
+TUTORIALS = (
+    "args_and_kwargs",
+    "dunder_methods",
+    "lambda_functions",
+    "map_and_filter_functions",
+    "optional_parameters",
+    "static_and_class_methods",
+    "threading_basics",
+)
@@ -0,0 +1,82 @@
+# Runs tutorial sections from the command line. See python_concepts/tutorials/__init__.py for examples.
+
+import argparse
+import sys
+import time
+
+from python_concepts import section_checks
+from python_concepts.sections import load_sections, run_sections, select_sections
+from python_concepts.tutorials import TUTORIALS
+
+
+def module_name(tutorial):
+    """
+    Full module name of a tutorial, given as "dunder_methods" or "dunder_methods.py".
+    :param tutorial: str
+    :return: str
+    """
+    tutorial = tutorial[:-3] if tutorial.endswith(".py") else tutorial
+    if tutorial not in TUTORIALS:
+        raise LookupError(f"No tutorial {tutorial!r}. Tutorials are: {', '.join(TUTORIALS)}.")
+    return f"{__package__}.{tutorial}"
+
+
+def list_sections():
+    for tutorial in TUTORIALS:
+        print(tutorial)
+        for current in load_sections(module_name(tutorial)):
+            print(f"  {current.number:>2}  {current.name}")
+
+
+def check(tutorial, selectors, jobs, timeout):
+    """
+    Run sections in separate processes and check their expected output comments.
+    :return: int, exit status
+    """
+    if tutorial in (None, "all"):
+        sections = [current for name in TUTORIALS for current in load_sections(module_name(name))]
+    else:
+        sections = select_sections(load_sections(module_name(tutorial)), selectors)
+    start = time.perf_counter()
+    results = section_checks.check_sections(sections, jobs, timeout)
+    section_checks.print_report(results, time.perf_counter() - start)
+    return 0 if all(result.ok for result in results) else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m python_concepts.tutorials",
+        description="Run the example sections of the tutorial files.",
+    )
+    parser.add_argument("tutorial", nargs="?", help="tutorial name, or 'all' to run every tutorial")
+    parser.add_argument("sections", nargs="*", help="section numbers or names, all sections if none are given")
+    parser.add_argument("--list", action="store_true", help="list the tutorials and their sections")
+    parser.add_argument("--headers", action="store_true", help="print the name of each section before running it")
+    parser.add_argument("--check", action="store_true",
+                        help="run every section in its own process and check the output against the expected output comments")
+    parser.add_argument("--jobs", type=int, default=section_checks.DEFAULT_JOBS, help="sections checked at the same time")
+    parser.add_argument("--timeout", type=float, default=section_checks.DEFAULT_TIMEOUT, help="seconds per section")
+    args = parser.parse_args(argv)
+
+    if args.list or (args.tutorial is None and not args.check):
+        list_sections()
+        return 0
+
+    try:
+        if args.check:
+            return check(args.tutorial, args.sections, args.jobs, args.timeout)
+        if args.tutorial == "all":
+            if args.sections:
+                parser.error("sections can't be picked when running all tutorials")
+            for tutorial in TUTORIALS:
+                run_sections(module_name(tutorial), headers=True)
+        else:
+            run_sections(module_name(args.tutorial), args.sections, headers=args.headers)
+    except LookupError as error:
+        print(error.args[0], file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
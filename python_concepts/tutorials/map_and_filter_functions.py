@@ -0,0 +1,152 @@
+# map() and filter()
+
+# What are they?
+
+# The map() function allows you to apply a function to every item in a list
+# (or any other iterable data type) and then creates a new list with the values
+# returned by the given function. You could accomplish the same goal with a for loop,
+# but the map function is a useful syntactical shortcut and will make your code a lot cleaner.
+# The map function takes two parameters, a function and a list,
+# and will apply that function to every element in the list.
+
+# The filter() function allows you to filter items in a list through a function and if that
+# function (for a given value from the list) returns True, it is added to the new list. If the
+# function returns False, the value will not be added to the list.
+# The filter function also takes two parameters, a function and a list.
+
+# Map and filter functions can be very useful when combined and are often used together.
+# Examples below.
+
+# To run the examples: python -m python_concepts.tutorials map_and_filter_functions [section number or name]
+
+from python_concepts.sections import run_sections, section
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+# If asked to return all of the doubled values of a given list, before knowing
+# about the map function you might have solved the problem like so:
+
+def double(num):
+    return num * 2
+
+@section
+def without_map():
+    nums = [1, 2, 3, 4, 5]
+
+    doubled_nums = []
+    for x in nums:
+        doubled_nums.append(double(x))
+
+    print(doubled_nums) # [2, 4, 6, 8, 10]
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Map Function
+
+# Using the map function, your solution might look something like this (with the same double function as above):
+
+@section
+def map_function():
+    nums = [1, 2, 3, 4, 5]
+    doubled_nums = []
+
+    # Given the double function and the nums list, the map function will pass every number in the
+    # nums list to the double function and insert that value into the list doubled_nums.
+    doubled_nums = map(double, nums)
+
+    # Because map function doesn't return a list (returns a map object), must cast the
+    # map object to a list data type to print out the values.
+    print(list(doubled_nums)) # [2, 4, 6, 8, 10]
+
+    # Because the map object is an iterable, you could also return the values using a for loop:
+    print(type(doubled_nums)) # <class 'map'>
+    for num in doubled_nums:
+        print(num)
+
+    # Careful! This for loop doesn't print anything. The map object was already used up by list(doubled_nums) above,
+    # and a used up map object just acts like it is empty instead of giving an error. python_concepts/streams.py has a
+    # Stream type that raises an error if you try this, and makes you ask for a copy (tee or replayable) on purpose.
+
+
+    # Another way to accomplish the same thing is through a list comprehension, but I will save that for a future post.
+    doubled_nums = [double(x) for x in nums]
+    print(doubled_nums) # [2, 4, 6, 8, 10]
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Filter function
+
+def is_odd(x):
+    return x % 2 != 0
+
+@section
+def filter_function():
+    nums = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    # Filters the list nums through the is_odd function and returns all values of nums
+    # where is_odd evaluates to True, which will be all of the odd numbers.
+    odd_nums = filter(is_odd, nums)
+    print(list(odd_nums)) # [1, 3, 5, 7, 9]
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Another example for the filter function
+
+def starts_with_a(name):
+    return name[0] == "A"
+
+@section
+def filter_names():
+    names = ["Alex", "John", "Alice", "Matt", "Travis", "Arnold"]
+
+    a_names = filter(starts_with_a, names)
+    print(list(a_names)) # ['Alex', 'Alice', 'Arnold']
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Combining map and filter (with the is_odd function from above)
+
+def add_7(x):
+    return x + 7
+
+@section
+def map_and_filter():
+    nums = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    odd_nums = filter(is_odd, nums)
+    odd_nums_plus_seven = map(add_7, odd_nums)
+    print(list(odd_nums_plus_seven)) # [8, 10, 12, 14, 16]
+
+    # could also save a line with:
+    odd_nums_plus_seven = map(add_7, filter(is_odd, nums))
+
+    print(list(odd_nums_plus_seven)) # [8, 10, 12, 14, 16]
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+# Map and filter on a lot of numbers
+
+# map and filter call a Python function once for every element, which adds up when there are millions of elements.
+# python_concepts/pipeline.py lets you write the same chain with the placeholder X instead of a function.
+# X % 2 != 0 describes the calculation instead of running it, so if NumPy is installed the whole chain can
+# run on arrays of numbers at once. Without NumPy it falls back to map and filter, so the answer is the same either way.
+
+@section
+def pipelines():
+    from python_concepts.pipeline import Pipeline, X
+
+    nums = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    odd_nums_plus_seven = Pipeline().filter(X % 2 != 0).map(X + 7)
+    print(odd_nums_plus_seven.run(nums)) # [8, 10, 12, 14, 16]
+
+    # Normal functions work as stages too, they just can't be sped up with NumPy.
+    print(Pipeline().filter(is_odd).map(add_7).run(nums)) # [8, 10, 12, 14, 16]
+
+    # filter(is_odd, nums) wrapped in map(add_7, ...) creates two iterators stacked on top of each other, and every element
+    # passes through both. A Pipeline compiles its whole chain into a single loop instead, and explain() shows that loop:
+    print(odd_nums_plus_seven.explain())
+
+# Because functions like double and is_odd only depend on their argument, the elements could also be split up across
+# several CPU cores. python_concepts/parallel.py has parallel_map and parallel_filter, which work like map and filter
+# but send chunks of the list to a pool of worker processes. It only pays off for large inputs or slow functions,
+# because every chunk has to be sent to another process and back.
+
+
+if __name__ == "__main__":
+    run_sections(__name__)
@@ -26,11 +26,15 @@
 # before they can do anything..which would not be a good user experience. Messages should be
 # processed whenever the server can get to them, but the user (client) should still be able to do stuff.
 
+# To run the examples: python -m python_concepts.tutorials threading_basics [section number or name]
+
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 
 import threading # _thread in Python 2
 import time
 
+from python_concepts.sections import run_sections, section
+
 # To create a thread, you must pass in a target argument which will be the function that we want to run on the thread.
 # If you want to pass arguments to that funcion, you must pass those to the args argument as a tuple.
 # If you will only be passing in a single argument to the target function, you need to pass it to the tuple with
@@ -43,20 +47,24 @@ def thread_func():
     time.sleep(1)
     print("next")
 
-# creating a thread called x
-x = threading.Thread(target=thread_func)
+@section
+def starting_a_thread():
+    # creating a thread called x
+    x = threading.Thread(target=thread_func)
 
-# To run a thread, you must start it
-x.start()
+    # To run a thread, you must start it
+    x.start()
 
-# Keep in mind that our current program is already running on a thread of its own, so creating
-# this new thread will mean that we now have 2 threads: our main thread and x.
+    # Keep in mind that our current program is already running on a thread of its own, so creating
+    # this new thread will mean that we now have 2 threads: our main thread and x.
 
-# To get the number of active threads your program is running, you can use the .activeCount() method.
-print(f"{threading.activeCount()} threads") # 2
+    # To get the number of active threads your program is running, you can use the threading.active_count() function.
+    # (Older tutorials use threading.activeCount(), which is deprecated.)
+    print(f"{threading.active_count()} threads") # 2 threads
 
-time.sleep(1)
-print("done")
+    time.sleep(1)
+    print("done")
+    x.join()
 
 # Notice the order that this program prints to the console. First we create the x thread and start it.
 # The x thread prints "first" and then it sleeps for one second. While the x thread sleeps, the program
@@ -76,13 +84,25 @@ def count(n):
         time.sleep(1)
     print("Done")
 
-for _ in range(2):
-    x = threading.Thread(target=count, args=(10,))
-    x.start()
+@section
+def two_threads():
+    threads = []
+    for _ in range(2):
+        x = threading.Thread(target=count, args=(10,))
+        x.start()
+        threads.append(x)
+
+    # The threads are joined here only so that the next section starts after they're done.
+    for x in threads:
+        x.join()
 
 # Notice that threads take turns printing the next number to the screen instead of one running through all of
 # the numbers and then the other one running through all of its numbers.
 
+# Both threads spend almost all of their time asleep. For work like this, where tasks mostly wait, asyncio can run
+# all of the tasks on one thread. python_concepts/async_runtime.py has coroutine versions of count() and
+# thread_func() and shows how starting and joining threads maps to asyncio tasks.
+
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 
 # Of course, we may want to have a little more control of when certain threads run than just whenever the computer decides.
@@ -91,53 +111,67 @@ for _ in range(2):
 # Pretty much what the .join() method is saying is, "Do not continue past this 
 # line of code until the thread has finished running." 
 
-nums = []
+# The threads take turns, so the order of nums below is one possible order, not the only one.
 
-def count(n):
-    for i in range(1, n+1):
-        nums.append(i)
-        time.sleep(0.01)
-    print("Done")
+@section(deterministic=False)
+def join():
+    nums = []
+
+    def count(n):
+        for i in range(1, n+1):
+            nums.append(i)
+            time.sleep(0.01)
+        print("Done")
 
 
-x = threading.Thread(target=count, args=(10,))
-x.start()
+    x = threading.Thread(target=count, args=(10,))
+    x.start()
+
+    y = threading.Thread(target=count, args=(10,))
+    y.start()
 
-y = threading.Thread(target=count, args=(10,))
-y.start()
+    # The main thread will not continue until the x and y threads have finished executing.
+    x.join()
+    y.join()
 
-# The main thread will not continue until the x and y threads have finished executing.
-x.join()
-y.join()
+    print(nums) # [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10]
 
-print(nums) # [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10]
+# The order of nums depends on how the two threads took turns. If you need the same order every run no matter how
+# the threads were scheduled, python_concepts/collector.py gives every thread its own buffer and lets you choose the order afterwards.
 
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 
 # Here I have moved the location of one of the .join() calls to show how it affects the overall program.
-nums = []
 
-def count(n):
-    for i in range(1, n+1):
-        nums.append(i)
-        time.sleep(0.01)
-    print("Done")
+@section
+def join_in_order():
+    nums = []
 
+    def count(n):
+        for i in range(1, n+1):
+            nums.append(i)
+            time.sleep(0.01)
+        print("Done")
 
-x = threading.Thread(target=count, args=(10,))
-x.start()
 
-# Moving the x.join() here will mean that the main program will not continue until the thread x has finished running.
-# This is how you can synchronize threads together to make sure they run in the desired order.
-x.join()
+    x = threading.Thread(target=count, args=(10,))
+    x.start()
+
+    # Moving the x.join() here will mean that the main program will not continue until the thread x has finished running.
+    # This is how you can synchronize threads together to make sure they run in the desired order.
+    x.join()
 
-y = threading.Thread(target=count, args=(10,))
-y.start()
+    y = threading.Thread(target=count, args=(10,))
+    y.start()
 
-y.join()
+    y.join()
 
-# Notice how instead of the threads running at the same time, x runs first, then y.
-print(nums) # [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    # Notice how instead of the threads running at the same time, x runs first, then y.
+    print(nums) # [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+# Placing .join() calls by hand works for two threads, but gets hard to follow with many tasks, and starting a new
+# thread for every task gets expensive. python_concepts/scheduler.py has a WorkerPool that reuses a fixed number of
+# threads and lets you say "run y after x" directly: pool.submit(count, 10, after=[x_future]).
 
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 
@@ -159,8 +193,6 @@ print(nums) # [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 # creating a race condition.
 
 total = 0
-# Create a Lock instance. Will have a status of unlocked by default
-lock = threading.Lock()
 
 def add_first_half(lock):
     """ Adds every integer from 1 to 500,000 """
@@ -178,13 +210,84 @@ def add_second_half(lock):
         total += num
         # lock.release() # release the lock
 
-x = threading.Thread(target=add_first_half, args=(lock,))
-x.start()
+@section
+def locks():
+    global total
+    total = 0
+    # Create a Lock instance. Will have a status of unlocked by default
+    lock = threading.Lock()
+
+    x = threading.Thread(target=add_first_half, args=(lock,))
+    x.start()
+
+    y = threading.Thread(target=add_second_half, args=(lock,))
+    y.start()
+
+    x.join()
+    y.join()
+
+    print(total)
+
+# To see where the time goes when the lock is turned on, python_concepts/thread_trace.py has a Lock and a Thread
+# that work like the ones from threading, but record how often each thread had to wait for the lock and for how long.
+# It can save a timeline of every thread that opens in https://ui.perfetto.dev.
+
+# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
+
+# The lock fixes the answer, but it makes the program slower than just adding the numbers on one thread,
+# because both threads spend most of their time acquiring and releasing the lock (and only one thread can run
+# Python code at a time anyway because of the GIL).
+
+# A better fix is to not share the total at all. Each thread adds up its own half into a local variable,
+# and we only combine the two partial results once both threads are done. Nothing is shared, so nothing needs a lock.
+
+partial_totals = [0, 0]
+
+def add_range(index, numbers):
+    """ Adds up numbers and stores the result in its own slot of partial_totals """
+    partial_totals[index] = sum(numbers)
+
+@section
+def partial_results():
+    x = threading.Thread(target=add_range, args=(0, range(500001)))
+    x.start()
+
+    y = threading.Thread(target=add_range, args=(1, range(500001, 1000001)))
+    y.start()
+
+    x.join()
+    y.join()
+
+    print(sum(partial_totals)) # 500000500000
+
+    # python_concepts/reduction.py turns this idea into something reusable. It splits any range or list into chunks,
+    # reduces every chunk on a thread pool or a process pool (processes can actually use more than one core),
+    # and merges the partial results once at the end:
+
+    from python_concepts.reduction import parallel_sum
+
+    print(parallel_sum(range(1, 1000001), backend="process")) # 500000500000
+
+    # When the threads really do need to update one shared counter while they run, python_concepts/accumulators.py
+    # has counters that take the lock less often than once per update (per-thread cells, striped locks and batched updates).
+    # Any of them can be passed to a function like add_first_half in place of the lock:
+
+    from python_concepts.accumulators import ThreadLocalCounter, add_range as add_to_counter
+
+    counter = ThreadLocalCounter()
+    x = threading.Thread(target=add_to_counter, args=(counter, range(500001)))
+    y = threading.Thread(target=add_to_counter, args=(counter, range(500001, 1000001)))
+    x.start()
+    y.start()
+    x.join()
+    y.join()
+
+    print(counter.value) # 500000500000
 
-y = threading.Thread(target=add_second_half, args=(lock,))
-y.start()
+# Threads can only use one core at a time for Python code. python_concepts/shared_accumulators.py runs the same
+# add_range loops on processes instead, which write their partial sums into shared memory rather than sending
+# them back to the main process, and its Process can be started and joined just like a Thread.
 
-x.join()
-y.join()
 
-print(total)
+if __name__ == "__main__":
+    run_sections(__name__)
@@ -0,0 +1,52 @@
+import gc
+import threading
+import weakref
+
+import pytest
+
+from python_concepts.accumulators import ACCUMULATORS, BatchedAccumulator, ThreadLocalCounter, add_range
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize("name", sorted(ACCUMULATORS))
+def test_two_threads_count_correctly(name):
+    accumulator = ACCUMULATORS[name]()
+    run_threads(lambda: add_range(accumulator, range(10_000)), 2)
+    if isinstance(accumulator, BatchedAccumulator):
+        accumulator.flush()
+    assert accumulator.value == 2 * sum(range(10_000))
+
+
+@pytest.mark.parametrize("cls, cells", [(ThreadLocalCounter, "_cells"), (BatchedAccumulator, "_pending")])
+def test_finished_threads_are_folded_into_the_total(cls, cells):
+    accumulator = cls(initial=5)
+    for _ in range(200):
+        # One at a time, so every thread has ended before the next one starts.
+        run_threads(lambda: add_range(accumulator, range(10)), 1)
+    assert len(getattr(accumulator, cells)) == 0
+    accumulator.add(1)
+    assert len(getattr(accumulator, cells)) == 1
+    assert accumulator.value == 5 + 200 * 45 + 1
+
+
+def test_counter_is_not_kept_alive_by_running_threads():
+    counter = ThreadLocalCounter()
+    counter.add(1)
+    added = threading.Event()
+    stop = threading.Event()
+    thread = threading.Thread(target=lambda: (counter.add(1), added.set(), stop.wait()))
+    thread.start()
+    added.wait()
+    counter_ref = weakref.ref(counter)
+    del counter
+    gc.collect()
+    assert counter_ref() is None
+    stop.set()
+    thread.join()
@@ -0,0 +1,97 @@
+import math
+import random
+import warnings
+
+import numpy as np
+import pytest
+
+from python_concepts.batch_math import add_batch, calculate_batch
+
+INF = float("inf")
+
+
+def add(*args):
+    """ add() from args_and_kwargs.py, returning the total instead of printing it. """
+    total = 0
+    for num in args:
+        total += num
+    return total
+
+
+def calculate(start_value, **kwargs):
+    """ calculate() from args_and_kwargs.py, returning the total and skipping missing operations. """
+    total = start_value
+    for name in ("multiply", "divide", "add", "subtract"):
+        value = kwargs.get(name)
+        if value:
+            total = {"multiply": total * value, "divide": total / value if value else total,
+                     "add": total + value, "subtract": total - value}[name]
+    return total
+
+
+def same(result, expected):
+    assert len(result) == len(expected)
+    for got, want in zip(result, expected):
+        assert type(got) is type(want), (got, want)
+        assert got == want or (math.isnan(got) and math.isnan(want)), (got, want)
+
+
+@pytest.mark.parametrize("columns", [
+    ([INF], [1.0]),
+    ([1e308], [1e308]),
+    ([1e308, 1.0], [1e308, 2.0], [-1e308, 3.0]),
+    ([INF, -INF, float("nan")], [-INF, 1.0, 1.0]),
+    ([2 ** 62], [2 ** 62]),
+    ([2 ** 63 - 1, -5], [1, 5]),
+    ([2 ** 70, 1], [1, 2 ** 70]),
+    ([1, 2], [0.25, 0.5], [7, 8]),
+    ([True, False], [True, True]),
+    ([1, 2.5], [2, 3]),
+])
+def test_add_batch_matches_add(columns):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = add_batch(*columns)
+    expected = []
+    for row in zip(*columns):
+        try:
+            expected.append(math.fsum(row) if any(type(value) is float for value in row) else add(*row))
+        except (OverflowError, ValueError):
+            expected.append(add(*row))
+    same(result, expected)
+
+
+def test_add_batch_floats_are_correctly_rounded():
+    rng = random.Random(5)
+    columns = [[rng.choice([1e16, -1e16, 1.0, 0.1, 3e-17, -0.3]) * rng.random() for _ in range(2000)] for _ in range(6)]
+    same(add_batch(*columns), [math.fsum(row) for row in zip(*columns)])
+    same(add_batch(*map(np.array, columns)).tolist(), [math.fsum(row) for row in zip(*columns)])
+
+
+def test_add_batch_big_ints_on_arrays():
+    result = add_batch(np.array([2 ** 62, 1]), np.array([2 ** 62, 2]))
+    assert result.tolist() == [2 ** 63, 3]
+
+
+@pytest.mark.parametrize("start_values, operations", [
+    ([2 ** 62], {"multiply": 4}),
+    ([2 ** 62, 3], {"add": [2 ** 62, 0], "subtract": 1}),
+    ([2 ** 60 + 1], {"divide": 3}),
+    ([10, 20], {"multiply": 5, "divide": [4, 2], "add": 3, "subtract": 6}),
+    ([1e308, 2.0], {"multiply": 10.0}),
+    ([INF, 1.0], {"subtract": INF}),
+    ([1, 2.5], {"add": 1}),
+])
+def test_calculate_batch_matches_calculate(start_values, operations):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = calculate_batch(start_values, **operations)
+    expected = [
+        calculate(value, **{name: op[i] if isinstance(op, list) else op for name, op in operations.items()})
+        for i, value in enumerate(start_values)
+    ]
+    same(result, expected)
+
+
+def test_calculate_batch_overflow_on_arrays():
+    assert calculate_batch(np.array([2 ** 62]), multiply=4).tolist() == [2 ** 64]
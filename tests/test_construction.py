@@ -0,0 +1,39 @@
+import pytest
+
+from python_concepts.construction import Car, Record, make_row_loader, validate_fields
+
+
+def record_class(fields):
+    return type("Row", (Record,), {"fields": fields})
+
+
+@pytest.mark.parametrize("fields", [
+    ("new", "value"), ("result", "x"), ("append", "x"), ("cls",), ("rows",), ("obj", "load"), ("object",),
+])
+def test_field_names_used_by_the_generated_loop(fields):
+    Row = record_class(fields)
+    rows = [tuple(f"{field}{i}" for field in fields) for i in range(3)]
+    loaded = Row.from_rows(rows)
+    assert [tuple(getattr(obj, field) for field in fields) for obj in loaded] == rows
+    assert all(type(obj) is Row for obj in loaded)
+
+
+@pytest.mark.parametrize("field", ["self", "fields", "_pc_new", "_pc_load"])
+def test_reserved_field_names_are_rejected(field):
+    with pytest.raises(ValueError, match="reserved"):
+        validate_fields(("x", field))
+    with pytest.raises(ValueError):
+        record_class((field,))
+
+
+def test_partial_rows_set_missing_fields_to_none():
+    loader = make_row_loader(("new", "result"), ("result",))
+    (obj,) = loader(Car, [(5,)])
+    assert (obj.new, obj.result) == (None, 5)
+
+
+def test_car_from_rows_and_columns():
+    cars = Car.from_rows([("Jeep", "Wrangler", 2013, 100000, "gray")])
+    assert repr(cars[0]) == "Car(make='Jeep', model='Wrangler', year=2013, miles=100000, color='gray')"
+    (car,) = Car.from_columns({"make": ["Jeep"], "model": ["Wrangler"]})
+    assert (car.make, car.model, car.year) == ("Jeep", "Wrangler", None)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from python_concepts.expressions import ExpressionCache, expression
+
+CASES = [
+    ("lambda x: x or 5", [0, 3]),
+    ("lambda x: x and 5", [0, 3]),
+    ("lambda x: x > 1 and x < 3", [1, 2, 3]),
+    ("lambda x: not x", [0, 3]),
+    ("lambda x: x ** -1", [1, 2, 4]),
+    ("lambda x: x ** 2", [2 ** 40, 3]),
+    ("lambda x: x * 2", [2 ** 62, 1]),
+    ("lambda x: x + 1", [2 ** 63 - 1]),
+    ("lambda x: -x", [-2 ** 63]),
+    ("lambda x: x // 3 + x % 3", [-7, 0, 7]),
+    ("lambda x: x & 6 | 1", [3, 12]),
+    ("lambda x: x / 3", [2 ** 60 + 1, 7]),
+    ("lambda x: abs(x) - 2.5", [-3, 4]),
+]
+
+
+@pytest.mark.parametrize("source, data", CASES)
+def test_apply_batch_matches_calling_the_lambda(source, data):
+    compiled = expression(source)
+    expected = [compiled(value) for value in data]
+    result = compiled.apply_batch(data)
+    assert result == expected
+    assert [type(value) for value in result] == [type(value) for value in expected]
+
+
+def test_apply_batch_on_numpy_array():
+    compiled = expression("lambda x: x * 2")
+    assert compiled.apply_batch(np.array([2 ** 62, 1])).tolist() == [2 ** 63, 2]
+
+
+def test_bool_operators_are_not_vectorized():
+    assert not expression("lambda x: x or 5").vectorizable
+    assert expression("lambda x: x + 5").vectorizable
+
+
+def test_cache_shares_differently_formatted_expressions():
+    cache = ExpressionCache(maxsize=2)
+    add_five = cache.get("lambda x: x+5")
+    assert cache.get("lambda x:  (x + 5)") is add_five
+    assert cache.hits == 1
+    assert add_five(x=3) == 8
+
+
+def test_parameter_names_are_part_of_the_key():
+    cache = ExpressionCache(maxsize=4)
+    cache.get("lambda x: x+5")
+    renamed = cache.get("lambda num: num + 5")
+    assert renamed(num=3) == 8
+    assert renamed.source == "lambda num: num + 5"
+    assert repr(renamed) == "CompiledExpression('lambda num: num + 5')"
+    assert cache.get("lambda a, b: a - b")(b=1, a=5) == 4
+    assert cache.get("lambda b, a: b - a")(b=1, a=5) == -4
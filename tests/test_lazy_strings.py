@@ -0,0 +1,38 @@
+import io
+
+import pytest
+
+from python_concepts.lazy_strings import RepeatedString, repeat_words
+
+
+def test_contains_matches_str():
+    for text, times in (("Python", 5), ("ab", 3), ("a", 4), ("", 3), ("Jeep", 0)):
+        words = RepeatedString(text, times)
+        full = text * times
+        windows = [words, words[1:], words[3:-2], words[5:6]]
+        for window, expected in zip(windows, (full, full[1:], full[3:-2], full[5:6])):
+            for sub in ("", "P", "onPy", "nPythonP", "thonPytho", "Python" * 6, "ba", "aaa", "aaaaa", "x"):
+                assert (sub in window) == (sub in expected), (window, sub)
+
+
+def test_contains_huge_repetition():
+    words = repeat_words("Python", 10 ** 12)
+    assert "onPy" in words
+    assert "Python" * 1000 in words
+    assert "PythonPythoN" not in words
+    assert RepeatedString("hon", 1) in words[3:]
+
+
+def test_contains_needs_a_string():
+    with pytest.raises(TypeError):
+        3 in RepeatedString("Python", 2)
+
+
+def test_slicing_and_writing():
+    words = RepeatedString("Python", 1000)
+    assert len(words) == 6000
+    assert str(words[-3:]) == "hon"
+    assert words == "Python" * 1000
+    buffer = io.StringIO()
+    assert words.write_to(buffer, chunk_size=100) == 6000
+    assert buffer.getvalue() == "Python" * 1000
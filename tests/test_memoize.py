@@ -0,0 +1,47 @@
+import pytest
+
+from python_concepts.memoize import freeze, memoize
+
+
+def test_positional_frozenset_does_not_collide_with_kwargs():
+    @memoize
+    def func(*args, **kwargs):
+        return args, kwargs
+
+    assert func(1, 2, a=1) == ((1, 2), {"a": 1})
+    assert func((1, 2), frozenset({("a", 1)})) == (((1, 2), frozenset({("a", 1)})), {})
+    assert func(1, 2, a=1) == ((1, 2), {"a": 1})
+    assert func.cache_info()["misses"] == 2
+
+
+@pytest.mark.parametrize("unhashable", ["freeze", "pickle"])
+def test_frozen_values_do_not_collide_with_plain_tuples(unhashable):
+    @memoize(unhashable=unhashable)
+    def g(value):
+        return repr(value)
+
+    assert g([1, 2]) == "[1, 2]"
+    assert g(("list", (1, 2))) == "('list', (1, 2))"
+    assert g(("pickle", b"x")) == "('pickle', b'x')"
+    assert g({"a": [1]}) == "{'a': [1]}"
+    assert g(("dict", frozenset({("a", ("list", (1,)))}))) == "('dict', frozenset({('a', ('list', (1,)))}))"
+
+
+def test_freeze_tells_containers_apart():
+    assert freeze([1, 2]) != freeze((1, 2))
+    assert freeze([1, 2]) != ("list", (1, 2))
+    assert freeze({"a": [1]}) == freeze({"a": [1]})
+    assert hash(freeze({1: {2, 3}, "x": [[]]}))
+
+
+def test_keyword_order_does_not_matter():
+    calls = []
+
+    @memoize
+    def calculate(start_value=0, **kwargs):
+        calls.append(kwargs)
+        return start_value + sum(kwargs.values())
+
+    assert calculate(10, add=3, multiply=5) == 18
+    assert calculate(10, multiply=5, add=3) == 18
+    assert len(calls) == 1
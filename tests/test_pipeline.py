@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from python_concepts.pipeline import Pipeline, X
+
+OPERATORS = [
+    X + 3, X - 3, X * 2, X / 2, X // 2, X % 3, X ** 2, X ** -1, X // 0, X % 0, X / 0,
+    -X, abs(X - 2), X & 3, X | 4, ~X, X == 2, X != 2, X < 2, X <= 2, X > 2, X >= 2,
+    (X > 1) & (X < 3), (X > 1) | (X < 0), ~(X > 1), (X > 1) + (X < 3), -(X > 1), 2 - X, 7 // (X + 1),
+]
+
+DATA = [
+    [1, 2, 4],
+    [0, -3, 7],
+    [2 ** 62, 1],
+    [-2 ** 63, 5],
+    [True, False],
+    [1.5, -2.0, 0.0],
+    [1, 2.5, -3],
+    [True, 2, 0],
+    (0.5, 1, False),
+    np.array([1, 2, 3], dtype=np.uint8),
+    np.array([2 ** 63 + 5], dtype=np.uint64),
+]
+
+
+def python_result(pipeline, data):
+    values = data.tolist() if isinstance(data, np.ndarray) else data
+    try:
+        return pipeline.compile()(values)
+    except Exception as error:
+        return type(error)
+
+
+def pipeline_result(pipeline, data):
+    try:
+        result = pipeline.run(data)
+    except Exception as error:
+        return type(error)
+    return result.tolist() if isinstance(result, np.ndarray) else result
+
+
+@pytest.mark.parametrize("data", DATA, ids=repr)
+@pytest.mark.parametrize("expr", OPERATORS, ids=repr)
+@pytest.mark.parametrize("kind", ["map", "filter"])
+def test_numpy_path_matches_python_loop(kind, expr, data):
+    pipeline = getattr(Pipeline(), kind)(expr)
+    expected = python_result(pipeline, data)
+    result = pipeline_result(pipeline, data)
+    assert result == expected
+    if isinstance(expected, list):
+        assert [type(value) for value in result] == [type(value) for value in expected]
+
+
+def test_bitwise_and_is_not_logical_and():
+    assert Pipeline().map(X & 3).run([1, 2, 4]) == [1, 2, 0]
+    assert Pipeline().filter((X > 2) & (X < 8)).run(list(range(10))) == [3, 4, 5, 6, 7]
+
+
+def test_exact_operators_take_the_python_loop():
+    assert Pipeline().map(X ** -1).run([1, 2]) == [1.0, 0.5]
+    with pytest.raises(ZeroDivisionError):
+        Pipeline().map(X // 0).run([1, 2])
+    assert not Pipeline().map(X ** 2).can_vectorize([1, 2])
+    assert Pipeline().filter(X % 2 != 0).map(X + 7).can_vectorize([1, 2])
+
+
+def test_overflow_falls_back_to_python_ints():
+    pipeline = Pipeline().map(X * 2)
+    assert not pipeline.can_vectorize([2 ** 62, 1])
+    assert pipeline.run([2 ** 62, 1]) == [2 ** 63, 2]
+    assert pipeline.run(np.array([2 ** 62, 1])).tolist() == [2 ** 63, 2]
+    assert pipeline.can_vectorize([2 ** 61, 1])
+
+
+def test_small_integer_types_do_not_wrap():
+    assert Pipeline().map(X * 100).run(np.array([200], dtype=np.uint8)).tolist() == [20000]
+    assert Pipeline().map(X - 1).run(np.array([0], dtype=np.uint64)).tolist() == [-1]
+
+
+def test_mixed_lists_keep_their_element_types():
+    assert not Pipeline().map(X + 3).can_vectorize([1, 2.5])
+    assert Pipeline().map(X + 3).run([1, 2.5]) == [4, 5.5]
+    assert [type(value) for value in Pipeline().map(X + 3).run([1, 2.5])] == [int, float]
+
+
+def test_empty_pipeline_keeps_the_dtype():
+    data = np.array([1, 2, 250], dtype=np.uint8)
+    result = Pipeline().run(data)
+    assert result.dtype == np.uint8
+    assert result.tolist() == [1, 2, 250]
@@ -0,0 +1,112 @@
+import collections
+import threading
+
+import pytest
+
+from python_concepts.pooling import InternedCar, InternedPerson, ObjectPool, interning_key
+
+
+def test_equal_values_of_different_types_are_not_shared():
+    one = InternedPerson("Bob", 1)
+    assert InternedPerson("Bob", True).age is True
+    assert type(InternedPerson("Bob", 1.0).age) is float
+    assert InternedPerson("Bob", 1) is one
+    assert InternedPerson("Bob", (1, 2)) is not InternedPerson("Bob", (1.0, 2))
+    assert InternedPerson("Bob", frozenset({1})) is not InternedPerson("Bob", frozenset({1.0}))
+    Age = collections.namedtuple("Age", "years")
+    assert InternedPerson("Bob", Age(1)) is not InternedPerson("Bob", Age(True))
+    assert type(InternedPerson("Bob", Age(True)).age.years) is bool
+
+
+def test_keyword_arguments():
+    car = InternedCar(make="Jeep", model="Wrangler")
+    assert InternedCar(model="Wrangler", make="Jeep") is car
+    # Unorderable keyword values used to make sorted() raise TypeError.
+    assert InternedCar(make=1, model="x").make == 1
+    assert InternedCar(make=None, model=2j).model == 2j
+
+
+def test_positional_frozenset_does_not_collide_with_kwargs():
+    assert interning_key((1,), {"a": 1}) != interning_key((1, frozenset({("a", 1)})), {})
+    first = InternedCar("Jeep", frozenset({("model", "x")}))
+    second = InternedCar("Jeep", model="x")
+    assert first is not second
+    assert second.model == "x"
+
+
+def test_unhashable_arguments_are_not_cached():
+    assert InternedCar("Jeep", ["Wrangler"]) is not InternedCar("Jeep", ["Wrangler"])
+
+
+class Person:
+    def __init__(self, name, age=None):
+        self.name = name
+        if age is not None:
+            self.age = age
+
+
+class Point:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y=None):
+        self.x = x
+        if y is not None:
+            self.y = y
+
+
+def test_object_pool_reuses_released_objects():
+    pool = ObjectPool(Person)
+    first = pool.acquire("Matthew", 28)
+    pool.release(first)
+    with pool.borrowed("Bob") as second:
+        assert second is first
+        assert vars(second) == {"name": "Bob"}
+    assert pool.stats() == {"created": 1, "reused": 1, "free": 1}
+
+
+def test_released_objects_with_slots_are_cleared():
+    pool = ObjectPool(Point)
+    first = pool.acquire(1, 2)
+    pool.release(first)
+    second = pool.acquire(3)
+    assert second is first
+    assert second.x == 3
+    assert not hasattr(second, "y")
+
+
+def test_builtin_types_need_a_reset_function():
+    with pytest.raises(TypeError):
+        ObjectPool(dict)
+    pool = ObjectPool(dict, reset=lambda d, *args, **kwargs: (d.clear(), d.update(*args, **kwargs)))
+    first = pool.acquire(a=1)
+    pool.release(first)
+    assert pool.acquire(b=2) == {"b": 2}
+
+
+def test_releasing_twice_raises():
+    pool = ObjectPool(Person)
+    person = pool.acquire("Bob")
+    pool.release(person)
+    with pytest.raises(ValueError):
+        pool.release(person)
+
+
+def test_object_pool_across_threads():
+    pool = ObjectPool(Person, maxsize=4)
+    seen = []
+
+    def work():
+        for i in range(2_000):
+            person = pool.acquire(i)
+            seen.append(person.name == i and not hasattr(person, "age"))
+            person.age = i
+            pool.release(person)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(seen)
+    assert len(pool) <= 4
+    assert pool.created + pool.reused == 8_000
@@ -0,0 +1,91 @@
+import pytest
+
+from python_concepts.records import Car, CarFleet
+
+
+def snapshot(fleet):
+    columns = (fleet.make_codes, fleet.model_codes, fleet.years, fleet.condition_codes, fleet.mileages)
+    pools = (fleet.makes, fleet.models, fleet.conditions)
+    return [column.tolist() for column in columns] + [list(pool.strings) for pool in pools]
+
+
+@pytest.mark.parametrize("row, error", [
+    (("Jeep", "Wrangler", 2013, "Used", "100,000"), ValueError),
+    (("Jeep", "Wrangler", 2013, "Used", 2 ** 63), OverflowError),
+    (("Jeep", "Wrangler", 40000, "Used", 0), OverflowError),
+    (("Jeep", "Wrangler", "2013", "Used", 0), TypeError),
+    (("Ford", ["F-150"], 2013, "Used", 0), TypeError),
+    (("Ford", "F-150", 2013, "Salvage", "lots"), ValueError),
+])
+def test_failed_append_leaves_the_fleet_unchanged(row, error):
+    fleet = CarFleet()
+    fleet.append("Jeep", "Wrangler", 2013, "Used", 100000)
+    before = snapshot(fleet)
+    with pytest.raises(error):
+        fleet.append(*row)
+    assert snapshot(fleet) == before
+    assert len(fleet) == 1
+    assert fleet[0] == Car("Jeep", "Wrangler", 2013, "Used", 100000)
+
+
+def test_too_many_conditions():
+    fleet = CarFleet()
+    fleet.extend(("Jeep", "Wrangler", 2013, f"condition {i}") for i in range(256))
+    before = snapshot(fleet)
+    with pytest.raises(ValueError):
+        fleet.append("Jeep", "Wrangler", 2013, "one too many")
+    assert snapshot(fleet) == before
+    fleet.append("Jeep", "Wrangler", 2013, "condition 0", "7")
+    assert fleet[-1].mileage == 7
+
+
+@pytest.mark.parametrize("field, value, error", [
+    ("mileage", "100,000", ValueError),
+    ("mileage", 2 ** 63, OverflowError),
+    ("year", 40000, OverflowError),
+    ("year", "2013", TypeError),
+    ("model", ["F-150"], TypeError),
+])
+def test_failed_set_leaves_the_fleet_unchanged(field, value, error):
+    fleet = CarFleet()
+    fleet.append("Jeep", "Wrangler", 2013, "Used", 100000)
+    before = snapshot(fleet)
+    with pytest.raises(error):
+        setattr(fleet[0], field, value)
+    assert snapshot(fleet) == before
+
+
+def test_setting_converts_like_append():
+    fleet = CarFleet()
+    fleet.append("Jeep", "Wrangler", 2013, "Used", 100000)
+    view = fleet[0]
+    view.mileage = "7"
+    view.make = "Ford"
+    assert view == Car("Ford", "Wrangler", 2013, "Used", 7)
+
+
+def test_setting_too_many_conditions():
+    fleet = CarFleet()
+    fleet.extend(("Jeep", "Wrangler", 2013, f"condition {i}") for i in range(256))
+    before = snapshot(fleet)
+    with pytest.raises(ValueError):
+        fleet[0].condition = "one too many"
+    assert snapshot(fleet) == before
+    fleet[0].condition = "condition 255"
+    assert fleet[0].condition == "condition 255"
+
+
+def test_cars_are_hashable():
+    cars = {Car("Jeep", "Wrangler", 2013), Car("Jeep", "Wrangler", 2013, "New", 0.0)}
+    assert len(cars) == 1
+    assert Car("Jeep", "Wrangler", 2013) in cars
+
+
+def test_slicing_gives_car_views():
+    fleet = CarFleet()
+    fleet.extend(("Jeep", "Wrangler", year) for year in range(2010, 2015))
+    assert [car.year for car in fleet[1:4]] == [2011, 2012, 2013]
+    assert [car.year for car in fleet[::-2]] == [2014, 2012, 2010]
+    assert fleet[10:] == []
+    fleet[1:2][0].year = 2000
+    assert fleet[1].year == 2000
@@ -0,0 +1,72 @@
+import sys
+import threading
+
+import pytest
+
+from python_concepts.accumulators import add_range
+from python_concepts.shared_accumulators import SLOT_STRIDE, Process, SharedCounter
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def add_on_threads(counter, threads, numbers):
+    run_threads(lambda: add_range(counter, numbers), threads)
+
+
+def test_threads_of_one_process_count_correctly():
+    counter = SharedCounter(processes=8, initial=5)
+    interval = sys.getswitchinterval()
+    # Switch threads as often as possible, so that two threads sharing a slot would lose updates.
+    sys.setswitchinterval(1e-6)
+    try:
+        add_on_threads(counter, 8, range(20_000))
+        assert counter.value == 5 + 8 * sum(range(20_000))
+    finally:
+        sys.setswitchinterval(interval)
+        counter.close()
+
+
+def test_every_thread_adds_into_its_own_slot():
+    counter = SharedCounter(processes=4)
+    try:
+        amounts = iter([1, 10, 100, 1000])
+        run_threads(lambda: counter.add(next(amounts)), 4)
+        slots = [counter._cells[slot] for slot in range(2 * SLOT_STRIDE, counter.length, SLOT_STRIDE)]
+        assert sorted(slots) == [1, 10, 100, 1000]
+    finally:
+        counter.close()
+
+
+def test_threads_in_several_processes_count_correctly():
+    counter = SharedCounter(processes=7)
+    try:
+        counter.add(1)
+        processes = [Process(target=add_on_threads, args=(counter, 3, range(10_000))) for _ in range(2)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        add_on_threads(counter, 1, range(10_000))
+        assert counter.value == 1 + 7 * sum(range(10_000))
+    finally:
+        counter.close()
+
+
+def test_every_thread_takes_a_slot():
+    counter = SharedCounter(processes=1)
+    try:
+        add_on_threads(counter, 1, range(3))
+        errors = []
+        thread = threading.Thread(target=lambda: errors.append(pytest.raises(RuntimeError, counter.add, 1)))
+        thread.start()
+        thread.join()
+        assert len(errors) == 1
+        assert counter.value == 3
+    finally:
+        counter.close()
@@ -0,0 +1,39 @@
+import threading
+
+from python_concepts import thread_trace
+
+
+def test_sequential_threads_are_kept_apart():
+    with thread_trace.tracing(min_event_us=0) as recorder:
+        idents = []
+        for i in range(5):
+            thread = thread_trace.Thread(target=lambda: idents.append(threading.get_ident()), name=f"worker {i}")
+            thread.start()
+            thread.join()
+
+    run_events = [event for event in recorder.events if event[1] == "thread"]
+    assert [event[0] for event in run_events] == [f"worker {i}" for i in range(5)]
+    assert len({event[2] for event in run_events}) == 5
+    assert sorted(recorder.threads.values()) == sorted([threading.current_thread().name] + [f"worker {i}" for i in range(5)])
+    summary = recorder.summary()
+    for i in range(5):
+        assert f"worker {i}" in summary
+
+
+def test_chrome_trace_names_every_thread():
+    with thread_trace.tracing(min_event_us=0) as recorder:
+        lock = thread_trace.Lock("shared")
+        for _ in range(3):
+            thread = thread_trace.Thread(target=lambda: lock.acquire() and lock.release())
+            thread.start()
+            thread.join()
+    trace = recorder.to_chrome_trace()["traceEvents"]
+    named = {event["tid"] for event in trace if event["ph"] == "M"}
+    used = {event["tid"] for event in trace if event["ph"] == "X"}
+    assert len(named) == 4
+    assert used <= named
+
+
+def test_plain_objects_while_tracing_is_off():
+    assert type(thread_trace.Lock()) is type(threading.Lock())
+    assert type(thread_trace.Thread(target=print)) is threading.Thread